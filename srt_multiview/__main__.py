@@ -1,5 +1,7 @@
-from srt_multiview.ui import main
+import sys
+
+from srt_multiview.cli import main
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
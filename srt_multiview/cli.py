@@ -0,0 +1,222 @@
+"""Command line entry point.
+
+Without a sub-command the Qt interface is started, as before. ``run``,
+``start``, ``stop``, ``replace`` and ``status`` never import Qt so they work
+on machines without a desktop session (services, kiosks, SSH).
+"""
+
+import argparse
+import json
+import signal
+import sys
+import time
+
+from . import __version__, core
+
+
+def _log(message: str) -> None:
+    print(f"{time.strftime('%H:%M:%S')} {message}", file=sys.stderr, flush=True)
+
+
+def _print_results(results: dict) -> None:
+    for route_id, result in results.get("routes", {}).items():
+        _log(f"route {route_id}: {'ok' if result['ok'] else result['reason']}")
+    for stream_id, result in results.get("streams", {}).items():
+        _log(f"flux {stream_id}: {'ok' if result['ok'] else result['reason']}")
+    sender = results.get("sender")
+    if sender is not None:
+        _log(f"émission: {'ok' if sender['ok'] else sender['reason']}")
+
+
+def cmd_run(args) -> int:
+    from .headless import HeadlessEngine
+
+    engine = HeadlessEngine(start_sender=not args.no_sender)
+
+    def on_signal(signum, frame):
+        _log(f"signal {signum} reçu, arrêt")
+        engine.request_stop()
+
+    signals = [signal.SIGINT, signal.SIGTERM]
+    if hasattr(signal, "SIGBREAK"):
+        signals.append(signal.SIGBREAK)
+    for sig in signals:
+        signal.signal(sig, on_signal)
+
+    def on_state(event: core.StateEvent) -> None:
+        if event.kind == "queue":
+            return
+        if event.kind == "displays":
+            _log(f"écrans: topologie modifiée (génération {core.display_topology.generation})")
+            return
+        if not event.running:
+            state = f"arrêté (code {event.returncode})"
+        elif event.kind == "player" and core.player_manager.is_ready(event.child_id):
+            state = "prêt"
+        else:
+            state = "démarré"
+        _log(f"{event.kind} {event.child_id}: {state}")
+
+    core.subscribe_state_changes(on_state)
+    try:
+        try:
+            engine.serve(args.host, args.port)
+        except OSError as e:
+            _log(f"API de contrôle indisponible: {e}")
+            return 1
+        if engine.metrics_server.last_error:
+            _log(f"métriques indisponibles: {engine.metrics_server.last_error}")
+        elif engine.metrics_server.address:
+            host, port = engine.metrics_server.address
+            _log(f"métriques: http://{host}:{port}/metrics")
+        _print_results(engine.start())
+        engine.wait()
+    finally:
+        engine.shutdown()
+        core.unsubscribe_state_changes(on_state)
+    return 0
+
+
+def _control(args, method: str, path: str):
+    from .headless import control_request
+
+    config = core.load_config()
+    if args.host:
+        config["headless"]["controlHost"] = args.host
+    if args.port:
+        config["headless"]["controlPort"] = args.port
+    return control_request(config, method, path)
+
+
+def cmd_stream(args) -> int:
+    from urllib.parse import quote
+
+    from .headless import EngineNotRunning
+
+    try:
+        result = _control(args, "POST", f"/streams/{quote(args.stream, safe='')}/{args.command}")
+    except EngineNotRunning:
+        print("Moteur non démarré (srt-multiview run).", file=sys.stderr)
+        return 2
+    except RuntimeError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    if not result.get("ok"):
+        print(f"{result.get('id')}: {result.get('reason')}", file=sys.stderr)
+        return 1
+    print(f"{result.get('id')}: ok")
+    return 0
+
+
+def _offline_status() -> dict:
+    config = core.load_config()
+    mapping = config.get("mapping", {})
+    return {
+        "engine": None,
+        "streams": [
+            {
+                "id": str(s["id"]),
+                "name": s.get("name"),
+                "source": str(s.get("source") or "srt").lower(),
+                "displayId": mapping.get(str(s["id"])),
+                "running": False,
+            }
+            for s in config["streams"]
+        ],
+        "routes": [{"id": str(r["id"]), "name": r.get("name"), "running": False} for r in config["routes"]],
+        "mosaics": [{"id": str(m["id"]), "name": m.get("name"), "running": False} for m in config["mosaics"]],
+        "walls": [{"id": str(w["id"]), "name": w.get("name"), "running": False} for w in config["walls"]],
+        "sender": {"displayId": config.get("sender", {}).get("displayId") or None, "running": False},
+    }
+
+
+def cmd_status(args) -> int:
+    from .headless import EngineNotRunning
+
+    try:
+        status = _control(args, "GET", "/status")
+    except EngineNotRunning:
+        status = _offline_status()
+    except RuntimeError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(status, ensure_ascii=False, indent=2))
+        return 0
+
+    engine = status.get("engine")
+    if engine is None:
+        print("Moteur: arrêté")
+    else:
+        print(f"Moteur: pid {engine.get('pid')}, actif depuis {int(engine.get('uptime') or 0)} s")
+    for stream in status.get("streams", []):
+        state = "en cours" if stream.get("running") else "arrêté"
+        if stream.get("queuePosition"):
+            state = f"en file ({stream['queuePosition']})"
+        elif stream.get("running") and not stream.get("ready", True):
+            state = "démarrage"
+        elif stream.get("stalled"):
+            state = "figé"
+        elif stream.get("restartPending"):
+            state = "relance"
+        elif stream.get("waitingDisplay"):
+            state = "attente écran"
+        print(f"  flux  {stream['id']:<16} {state:<10} {stream.get('name') or ''}")
+    for route in status.get("routes", []):
+        state = "en cours" if route.get("running") else "arrêté"
+        print(f"  route {route['id']:<16} {state:<10} {route.get('name') or ''}")
+    for mosaic in status.get("mosaics", []):
+        state = "en cours" if mosaic.get("running") else "arrêtée"
+        print(f"  mosaïque {mosaic['id']:<13} {state:<10} {mosaic.get('name') or ''}")
+    for wall in status.get("walls", []):
+        state = "en cours" if wall.get("running") else "arrêté"
+        if wall.get("waitingDisplay"):
+            state = "attente écran"
+        print(f"  mur   {wall['id']:<16} {state:<10} {wall.get('name') or ''}")
+    sender = status.get("sender") or {}
+    if sender.get("displayId"):
+        print(f"  émission {'en cours' if sender.get('running') else 'arrêtée'}")
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="srt-multiview", description="Multiview SRT/OMT vers écrans.")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--host", default=None, help="Adresse de l'API de contrôle (défaut: config).")
+    parser.add_argument("--port", type=int, default=None, help="Port de l'API de contrôle (défaut: config).")
+    sub = parser.add_subparsers(dest="command")
+
+    sub.add_parser("gui", help="Interface graphique (défaut).")
+
+    run = sub.add_parser("run", help="Moteur sans interface: lance routes, lecteurs et émission.")
+    run.add_argument("--no-sender", action="store_true", help="Ne pas démarrer l'émission OMT.")
+    run.set_defaults(func=cmd_run)
+
+    for name, help_text in (
+        ("start", "Démarre un flux."),
+        ("stop", "Arrête un flux."),
+        ("replace", "Applique les réglages d'un flux sans coupure."),
+    ):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("stream", help="Identifiant ou nom du flux.")
+        p.set_defaults(func=cmd_stream)
+
+    status = sub.add_parser("status", help="État des flux, routes et émission.")
+    status.add_argument("--json", action="store_true", help="Sortie JSON.")
+    status.set_defaults(func=cmd_status)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.command in {None, "gui"}:
+        from .ui import main as gui_main
+
+        gui_main()
+        return 0
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,38 @@
+import asyncio
+import atexit
+import bisect
+import copy
 import ctypes
 import hashlib
+import heapq
+import ipaddress
+import itertools
 import json
+import operator
 import os
+import random
 import re
+import signal
+import socket
+import struct
 import subprocess
 import sys
 import threading
+import time
 from collections import deque
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from ctypes import wintypes
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable, ClassVar
 
 from screeninfo import get_monitors
 
 from .paths import CONFIG_PATH, FFMPEG_PATH, FFPLAY_PATH
 
 
-VALID_STREAM_SOURCES = {"srt", "route", "omt", "udp"}
+VALID_STREAM_SOURCES = {"srt", "route", "omt", "udp", "slate"}
 VALID_RECEIVER_DECODES = {"cpu", "auto", "dxva2", "h264_amf", "h264_cuvid", "h264_qsv"}
 VALID_OMT_PIXEL_FORMATS = ("uyvy422", "bgra", "yuv422p10le")
 
@@ -29,6 +45,9 @@ DISPLAY_DEVICE_ATTACHED_TO_DESKTOP = 0x00000001
 DISPLAY_DEVICE_PRIMARY_DEVICE = 0x00000004
 DISPLAY_DEVICE_MIRRORING_DRIVER = 0x00000008
 
+# Grace period between the polite stop and the kill, shared by a whole batch.
+STOP_TIMEOUT = 2.0
+
 
 class POINTL(ctypes.Structure):
     _fields_ = [
@@ -109,39 +128,221 @@ def _win_creationflags() -> int:
     return getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
 
-def _terminate_proc(proc: subprocess.Popen | None) -> None:
-    if not proc or proc.poll() is not None:
-        return
+class _JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("PerProcessUserTimeLimit", ctypes.c_int64),
+        ("PerJobUserTimeLimit", ctypes.c_int64),
+        ("LimitFlags", wintypes.DWORD),
+        ("MinimumWorkingSetSize", ctypes.c_size_t),
+        ("MaximumWorkingSetSize", ctypes.c_size_t),
+        ("ActiveProcessLimit", wintypes.DWORD),
+        ("Affinity", ctypes.c_size_t),
+        ("PriorityClass", wintypes.DWORD),
+        ("SchedulingClass", wintypes.DWORD),
+    ]
 
-    if sys.platform == "win32":
-        try:
-            subprocess.run(
-                [
-                    "taskkill",
-                    "/PID",
-                    str(proc.pid),
-                    "/T",
-                    "/F",
-                ],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=_win_creationflags(),
-                check=False,
+
+class _IO_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        (name, ctypes.c_uint64)
+        for name in (
+            "ReadOperationCount",
+            "WriteOperationCount",
+            "OtherOperationCount",
+            "ReadTransferCount",
+            "WriteTransferCount",
+            "OtherTransferCount",
+        )
+    ]
+
+
+class _JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("BasicLimitInformation", _JOBOBJECT_BASIC_LIMIT_INFORMATION),
+        ("IoInfo", _IO_COUNTERS),
+        ("ProcessMemoryLimit", ctypes.c_size_t),
+        ("JobMemoryLimit", ctypes.c_size_t),
+        ("PeakProcessMemoryUsed", ctypes.c_size_t),
+        ("PeakJobMemoryUsed", ctypes.c_size_t),
+    ]
+
+
+_WIN_DLLS: dict[str, ctypes.CDLL] = {}
+
+
+def _win_dll(name: str):
+    """Private ``kernel32``/``psapi`` handle with the prototypes used here declared.
+
+    Without ``restype``/``argtypes`` ctypes passes and returns ``c_int``,
+    which truncates HANDLEs on 64-bit Windows.
+    """
+    dll = _WIN_DLLS.get(name)
+    if dll is not None:
+        return dll
+    dll = ctypes.WinDLL(name)
+    HANDLE, DWORD = wintypes.HANDLE, wintypes.DWORD
+    if name == "kernel32":
+        dll.OpenProcess.restype = HANDLE
+        dll.OpenProcess.argtypes = (DWORD, wintypes.BOOL, DWORD)
+        dll.CloseHandle.restype = wintypes.BOOL
+        dll.CloseHandle.argtypes = (HANDLE,)
+        dll.CreateJobObjectW.restype = HANDLE
+        dll.CreateJobObjectW.argtypes = (ctypes.c_void_p, wintypes.LPCWSTR)
+        dll.SetInformationJobObject.restype = wintypes.BOOL
+        dll.SetInformationJobObject.argtypes = (HANDLE, ctypes.c_int, ctypes.c_void_p, DWORD)
+        dll.AssignProcessToJobObject.restype = wintypes.BOOL
+        dll.AssignProcessToJobObject.argtypes = (HANDLE, HANDLE)
+        dll.TerminateJobObject.restype = wintypes.BOOL
+        dll.TerminateJobObject.argtypes = (HANDLE, wintypes.UINT)
+        dll.GetProcessTimes.restype = wintypes.BOOL
+        dll.GetProcessTimes.argtypes = (HANDLE,) + (ctypes.POINTER(wintypes.FILETIME),) * 4
+    elif name == "psapi":
+        dll.GetProcessMemoryInfo.restype = wintypes.BOOL
+        dll.GetProcessMemoryInfo.argtypes = (HANDLE, ctypes.c_void_p, DWORD)
+    _WIN_DLLS[name] = dll
+    return dll
+
+
+def _create_kill_job(pid: int, *, kill_on_close: bool = True) -> int | None:
+    """Put ``pid`` in its own job object so a stop reaches its children.
+
+    With ``kill_on_close`` the job also dies with us: the child does not
+    outlive a crashed or killed app (see ``ProcessSupervisor.kill_on_close``).
+    Returns the job handle, ``None`` if the job could not be set up.
+    """
+    JobObjectExtendedLimitInformation = 9
+    JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x2000
+    PROCESS_TERMINATE = 0x0001
+    PROCESS_SET_QUOTA = 0x0100
+    kernel32 = _win_dll("kernel32")
+    job = kernel32.CreateJobObjectW(None, None)
+    if not job:
+        return None
+    info = _JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+    info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE if kill_on_close else 0
+    process = kernel32.OpenProcess(PROCESS_TERMINATE | PROCESS_SET_QUOTA, False, int(pid))
+    try:
+        if (
+            process
+            and kernel32.SetInformationJobObject(
+                job, JobObjectExtendedLimitInformation, ctypes.byref(info), ctypes.sizeof(info)
             )
-        except Exception:
-            pass
+            and kernel32.AssignProcessToJobObject(job, process)
+        ):
+            return job
+    finally:
+        if process:
+            kernel32.CloseHandle(process)
+    kernel32.CloseHandle(job)
+    return None
 
+
+def _taskkill(pid: int) -> None:
     try:
-        proc.terminate()
+        # Not awaited: a batch must not pay one taskkill round-trip per child.
+        subprocess.Popen(
+            ["taskkill", "/PID", str(pid), "/T", "/F"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=_win_creationflags(),
+        )
     except Exception:
         pass
+
+
+def _signal_tree(proc: "subprocess.Popen | SupervisedProcess", *, kill: bool) -> None:
+    """Ask ``proc`` and its descendants to stop (``kill``: force), without waiting."""
+    signal_tree = getattr(proc, "signal_tree", None)
+    if signal_tree is not None:
+        signal_tree(kill=kill)
+        return
+    if sys.platform == "win32":
+        _taskkill(proc.pid)
     try:
-        proc.wait(timeout=2)
-    except subprocess.TimeoutExpired:
+        proc.kill() if kill else proc.terminate()
+    except Exception:
+        pass
+
+
+def terminate_processes(procs, timeout: float = STOP_TIMEOUT) -> None:
+    """Stop several children in ``timeout`` seconds total, not per child.
+
+    Every child (with its process group / job object) is signalled at once,
+    all of them are waited on against one shared deadline, and only those
+    still alive at the deadline are killed.
+    """
+    alive = [proc for proc in procs if proc is not None and proc.poll() is None]
+    for proc in alive:
+        _signal_tree(proc, kill=False)
+    deadline = time.monotonic() + float(timeout)
+    stragglers = []
+    for proc in alive:
         try:
-            proc.kill()
-        except Exception:
-            pass
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            stragglers.append(proc)
+    for proc in stragglers:
+        _signal_tree(proc, kill=True)
+
+
+def _terminate_proc(proc: "subprocess.Popen | SupervisedProcess | None") -> None:
+    terminate_processes([proc])
+
+
+class _PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ("cb", wintypes.DWORD),
+        ("PageFaultCount", wintypes.DWORD),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+def _process_usage_windows(pid: int) -> dict | None:
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    kernel32 = _win_dll("kernel32")
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, int(pid))
+    if not handle:
+        return None
+    try:
+        creation, exit_time, kernel, user = (wintypes.FILETIME() for _ in range(4))
+        if not kernel32.GetProcessTimes(
+            handle, ctypes.byref(creation), ctypes.byref(exit_time), ctypes.byref(kernel), ctypes.byref(user)
+        ):
+            return None
+        ticks = sum((t.dwHighDateTime << 32) | t.dwLowDateTime for t in (kernel, user))
+        counters = _PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        rss = None
+        if _win_dll("psapi").GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            rss = int(counters.WorkingSetSize)
+        return {"cpu_seconds": ticks / 1e7, "rss_bytes": rss}
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def process_usage(pid: int | None) -> dict | None:
+    """CPU time (s) and resident memory (bytes) of ``pid``, ``None`` if unknown."""
+    if not pid:
+        return None
+    try:
+        if sys.platform == "win32":
+            return _process_usage_windows(pid)
+        with open(f"/proc/{int(pid)}/stat", "rb") as f:
+            fields = f.read().rsplit(b")", 1)[1].split()
+        ticks = os.sysconf("SC_CLK_TCK")
+        return {
+            "cpu_seconds": (int(fields[11]) + int(fields[12])) / ticks,
+            "rss_bytes": int(fields[21]) * os.sysconf("SC_PAGE_SIZE"),
+        }
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
 
 
 def _config_display_schema_version(config: dict | None) -> int:
@@ -178,7 +379,8 @@ def _sort_displays(displays: list[dict]) -> list[dict]:
     return ordered
 
 
-def _get_displays_windows(exclude_primary: bool = False, *, name_overrides: dict[str, str] | None = None) -> list[dict]:
+def _get_displays_windows() -> list[dict]:
+    """Raw walk of the desktop displays, in enumeration order."""
     user32 = ctypes.WinDLL("user32", use_last_error=True)
     enum_display_devices = user32.EnumDisplayDevicesW
     enum_display_devices.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, ctypes.POINTER(DISPLAY_DEVICEW), wintypes.DWORD]
@@ -188,7 +390,6 @@ def _get_displays_windows(exclude_primary: bool = False, *, name_overrides: dict
     enum_display_settings.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, ctypes.POINTER(DEVMODEW), wintypes.DWORD]
     enum_display_settings.restype = wintypes.BOOL
 
-    overrides = name_overrides or {}
     displays: list[dict] = []
     adapter_index = 0
     while True:
@@ -213,9 +414,6 @@ def _get_displays_windows(exclude_primary: bool = False, *, name_overrides: dict
             continue
 
         is_primary = bool(state_flags & DISPLAY_DEVICE_PRIMARY_DEVICE)
-        if exclude_primary and is_primary:
-            continue
-
         adapter_label = _clean_win_text(adapter.DeviceString)
         adapter_device_id = _clean_win_text(adapter.DeviceID)
         adapter_device_key = _clean_win_text(adapter.DeviceKey)
@@ -253,16 +451,11 @@ def _get_displays_windows(exclude_primary: bool = False, *, name_overrides: dict
                 f"{int(devmode.dmPelsWidth)}|{int(devmode.dmPelsHeight)}|{1 if is_primary else 0}"
             )
 
-        display_id = _stable_display_id(identity)
-        display_name = monitor_label or adapter_label or adapter_device_name or f"Écran {len(displays) + 1}"
-        if overrides.get(display_id):
-            display_name = str(overrides[display_id])
-
         displays.append(
             {
-                "id": display_id,
+                "id": _stable_display_id(identity),
                 "index": len(displays),
-                "name": display_name,
+                "name": monitor_label or adapter_label or adapter_device_name,
                 "width": int(devmode.dmPelsWidth),
                 "height": int(devmode.dmPelsHeight),
                 "x": int(position.x),
@@ -273,6 +466,25 @@ def _get_displays_windows(exclude_primary: bool = False, *, name_overrides: dict
             }
         )
 
+    return displays
+
+
+def _windows_displays(raw: list[dict], exclude_primary: bool, overrides: dict[str, str]) -> list[dict]:
+    """One view of a raw Windows walk (enumeration order).
+
+    ``index`` and the ``Écran N`` fallback name count only the displays kept
+    in the view, as when the walk itself skipped the primary screen.
+    """
+    displays = []
+    for display in raw:
+        if exclude_primary and display.get("isPrimary"):
+            continue
+        display = dict(display, index=len(displays))
+        if overrides.get(display["id"]):
+            display["name"] = str(overrides[display["id"]])
+        elif not display.get("name"):
+            display["name"] = f"Écran {len(displays) + 1}"
+        displays.append(display)
     return _sort_displays(displays)
 
 
@@ -287,15 +499,16 @@ def load_config() -> dict:
             "mapping": {},
             "excludePrimaryDisplay": True,
         }
-        return normalize_config(config)
+        return config_store.commit(config)
 
     try:
         with open(CONFIG_PATH, "r", encoding="utf-8") as f:
             loaded = json.load(f)
         schema_before = _config_display_schema_version(loaded)
-        config = normalize_config(loaded)
+        config = config_store.commit(loaded)
         if schema_before != DISPLAY_ID_SCHEMA_VERSION:
             save_config(config)
+        config_store.mark_written(config)
         return config
     except (json.JSONDecodeError, ValueError, OSError):
         try:
@@ -303,7 +516,7 @@ def load_config() -> dict:
             CONFIG_PATH.replace(backup)
         except OSError:
             pass
-        return normalize_config(
+        return config_store.commit(
             {
                 "streams": [
                     {"id": "stream-1", "name": "Flux 1", "port": 9001, "latency": 120},
@@ -314,169 +527,536 @@ def load_config() -> dict:
         )
 
 
-def normalize_config(config: dict) -> dict:
-    config = dict(config or {})
-    reset_display_bindings = _config_display_schema_version(config) != DISPLAY_ID_SCHEMA_VERSION
-    config["displayIdSchemaVersion"] = DISPLAY_ID_SCHEMA_VERSION
-
-    config.setdefault("streams", [])
-    config.setdefault("mapping", {})
-    config.setdefault("displayNames", {})
-    config.setdefault("routes", [])
-    config.setdefault("receiver", {})
-    config["excludePrimaryDisplay"] = bool(config.get("excludePrimaryDisplay", True))
-    config["autoStartReceiver"] = bool(config.get("autoStartReceiver", False))
-    config["autoStartSender"] = bool(config.get("autoStartSender", False))
-
-    display_names = config.get("displayNames") or {}
-    if reset_display_bindings:
-        config["displayNames"] = {}
-    elif isinstance(display_names, dict):
-        config["displayNames"] = {str(k): str(v) for k, v in display_names.items() if v is not None}
-    else:
-        config["displayNames"] = {}
-
-    routes = config.get("routes") or []
-    normalized_routes = []
-    if isinstance(routes, list):
-        for i, r in enumerate(routes):
-            if not isinstance(r, dict):
-                continue
-            route = dict(r)
-            route.setdefault("id", f"route-{i + 1}")
-            route.setdefault("name", route["id"])
-            route.setdefault("inputPort", 9001)
-            route.setdefault("inputLatency", 120)
-            route.setdefault("multicastAddr", "239.10.10.10")
-            route.setdefault("multicastPort", 1234)
-            route.setdefault("pktSize", 1316)
-            route.setdefault("ttl", 1)
-
-            route["id"] = str(route.get("id") or f"route-{i + 1}")
-            route["name"] = str(route.get("name") or route["id"])
-            try:
-                route["inputPort"] = int(route.get("inputPort") or 9001)
-            except (TypeError, ValueError):
-                route["inputPort"] = 9001
-            try:
-                route["inputLatency"] = int(route.get("inputLatency") or 120)
-            except (TypeError, ValueError):
-                route["inputLatency"] = 120
-            route["multicastAddr"] = str(route.get("multicastAddr") or "239.10.10.10").strip()
-            try:
-                route["multicastPort"] = int(route.get("multicastPort") or 1234)
-            except (TypeError, ValueError):
-                route["multicastPort"] = 1234
-            try:
-                route["pktSize"] = int(route.get("pktSize") or 1316)
-            except (TypeError, ValueError):
-                route["pktSize"] = 1316
-            try:
-                route["ttl"] = int(route.get("ttl") or 1)
-            except (TypeError, ValueError):
-                route["ttl"] = 1
-
-            normalized_routes.append(route)
-
-    config["routes"] = normalized_routes
-
-    sender = dict(config.get("sender") or {})
-    sender["displayId"] = "" if reset_display_bindings else str(sender.get("displayId") or "")
-    sender["name"] = str(sender.get("name") or "SRT Multiview").strip() or "SRT Multiview"
+def _as_int(value, default: int) -> int:
     try:
-        fps = int(sender.get("fps") or 30)
+        return int(value or default)
     except (TypeError, ValueError):
-        fps = 30
-    sender["fps"] = max(1, min(60, fps))
-    pf = str(sender.get("pixelFormat") or "uyvy422").strip().lower()
-    if pf not in VALID_OMT_PIXEL_FORMATS:
-        pf = "uyvy422"
-    sender["pixelFormat"] = pf
-    sender["clockOutput"] = bool(sender.get("clockOutput", False))
+        return default
+
+
+def _as_float(value, default: float) -> float:
     try:
-        sender["referenceLevel"] = float(sender.get("referenceLevel", 1.0))
+        return float(value)
     except (TypeError, ValueError):
-        sender["referenceLevel"] = 1.0
-    # Drop legacy SRT-sender fields and the in-development audio fields.
-    for legacy in (
+        return default
+
+
+class _JsonModel:
+    """``from_dict``/``to_dict`` plumbing shared by the config dataclasses.
+
+    ``_FIELDS`` maps JSON keys to attributes; keys the model does not know
+    are kept in ``extra`` so newer/older config files round-trip untouched.
+    """
+
+    __slots__ = ()
+    _FIELDS: tuple[tuple[str, str], ...] = ()
+    _KNOWN: frozenset = frozenset()
+
+    @classmethod
+    def _extra(cls, data: dict) -> dict:
+        known = cls._KNOWN
+        if known.issuperset(data):
+            return {}
+        return {key: value for key, value in data.items() if key not in known}
+
+    def to_dict(self) -> dict:
+        data = dict(self.extra)
+        data.update(zip(self._KEYS, self._VALUES(self)))
+        return data
+
+
+_DISPLAY_MODES = frozenset({"fit", "fill", "stretch"})
+_ROTATIONS = frozenset({0, 90, 180, 270})
+
+
+@dataclass(slots=True)
+class StreamConfig(_JsonModel):
+    id: str
+    name: str
+    port: int
+    latency: int = 120
+    mute_audio: bool = False
+    display_mode: str = "fit"
+    rotate: int = 0
+    source: str = "srt"
+    source_route_id: str = ""
+    udp_addr: str = ""
+    udp_port: int = 0
+    omt_source: str = ""
+    priority: int = 0
+    keep_ingest: bool = False
+    switcher: bool = False
+    switcher_port: int = 0
+    extra: dict = field(default_factory=dict)
+
+    _FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("id", "id"),
+        ("name", "name"),
+        ("port", "port"),
+        ("latency", "latency"),
+        ("muteAudio", "mute_audio"),
+        ("displayMode", "display_mode"),
+        ("rotate", "rotate"),
+        ("source", "source"),
+        ("sourceRouteId", "source_route_id"),
+        ("udpAddr", "udp_addr"),
+        ("udpPort", "udp_port"),
+        ("omtSource", "omt_source"),
+        ("priority", "priority"),
+        ("keepIngest", "keep_ingest"),
+        ("switcher", "switcher"),
+        ("switcherPort", "switcher_port"),
+    )
+    _KNOWN: ClassVar[frozenset] = frozenset(key for key, _ in _FIELDS)
+    _KEYS: ClassVar[tuple[str, ...]] = tuple(key for key, _ in _FIELDS)
+    _VALUES: ClassVar[Callable] = operator.attrgetter(*(attr for _, attr in _FIELDS))
+
+    @classmethod
+    def from_dict(cls, data: dict, index: int = 0) -> "StreamConfig":
+        get = data.get
+        stream_id = str(get("id") or f"stream-{index + 1}")
+        mode = str(get("displayMode") or "fit").strip().lower()
+        rotate = _as_int(get("rotate"), 0)
+        source = str(get("source") or "srt").strip().lower()
+        return cls(
+            stream_id,
+            str(get("name") or stream_id),
+            _as_int(get("port"), 9000 + index + 1),
+            _as_int(get("latency"), 120),
+            bool(get("muteAudio", False)),
+            mode if mode in _DISPLAY_MODES else "fit",
+            rotate if rotate in _ROTATIONS else 0,
+            source if source in VALID_STREAM_SOURCES else "srt",
+            str(get("sourceRouteId") or ""),
+            str(get("udpAddr") or "").strip(),
+            _as_int(get("udpPort"), 0),
+            str(get("omtSource") or "").strip(),
+            _as_int(get("priority"), 0),
+            bool(get("keepIngest", False)),
+            bool(get("switcher", False)),
+            _as_int(get("switcherPort"), 0),
+            cls._extra(data),
+        )
+
+
+# Seconds a route started for streams keeps running once nobody reads it.
+ROUTE_IDLE_TIMEOUT = 30
+
+
+@dataclass(slots=True)
+class RouteConfig(_JsonModel):
+    id: str
+    name: str
+    input_port: int = 9001
+    input_latency: int = 120
+    multicast_addr: str = "239.10.10.10"
+    multicast_port: int = 1234
+    pkt_size: int = 1316
+    ttl: int = 1
+    idle_timeout: int = ROUTE_IDLE_TIMEOUT
+    extra: dict = field(default_factory=dict)
+
+    _FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("id", "id"),
+        ("name", "name"),
+        ("inputPort", "input_port"),
+        ("inputLatency", "input_latency"),
+        ("multicastAddr", "multicast_addr"),
+        ("multicastPort", "multicast_port"),
+        ("pktSize", "pkt_size"),
+        ("ttl", "ttl"),
+        ("idleTimeout", "idle_timeout"),
+    )
+    _KNOWN: ClassVar[frozenset] = frozenset(key for key, _ in _FIELDS)
+    _KEYS: ClassVar[tuple[str, ...]] = tuple(key for key, _ in _FIELDS)
+    _VALUES: ClassVar[Callable] = operator.attrgetter(*(attr for _, attr in _FIELDS))
+
+    @classmethod
+    def from_dict(cls, data: dict, index: int = 0) -> "RouteConfig":
+        route_id = str(data.get("id") or f"route-{index + 1}")
+        return cls(
+            id=route_id,
+            name=str(data.get("name") or route_id),
+            input_port=_as_int(data.get("inputPort"), 9001),
+            input_latency=_as_int(data.get("inputLatency"), 120),
+            multicast_addr=str(data.get("multicastAddr") or "").strip() or "239.10.10.10",
+            multicast_port=_as_int(data.get("multicastPort"), 1234),
+            pkt_size=_as_int(data.get("pktSize"), 1316),
+            ttl=_as_int(data.get("ttl"), 1),
+            # 0 is meaningful here (never stop), not "unset".
+            idle_timeout=max(0, _as_int(data.get("idleTimeout", ROUTE_IDLE_TIMEOUT), 0)),
+            extra=cls._extra(data),
+        )
+
+
+# Legacy SRT-sender fields and the in-development audio fields.
+_LEGACY_SENDER_KEYS = frozenset(
+    {
         "host", "port", "latency", "bitrateK", "encoder", "includeSystemAudio",
         "noAudio", "audioDevice", "audioSampleRate", "audioChannels",
+    }
+)
+
+
+@dataclass(slots=True)
+class SenderConfig(_JsonModel):
+    display_id: str = ""
+    name: str = "SRT Multiview"
+    fps: int = 30
+    pixel_format: str = "uyvy422"
+    clock_output: bool = False
+    reference_level: float = 1.0
+    extra: dict = field(default_factory=dict)
+
+    _FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("displayId", "display_id"),
+        ("name", "name"),
+        ("fps", "fps"),
+        ("pixelFormat", "pixel_format"),
+        ("clockOutput", "clock_output"),
+        ("referenceLevel", "reference_level"),
+    )
+    _KNOWN: ClassVar[frozenset] = frozenset(key for key, _ in _FIELDS)
+    _KEYS: ClassVar[tuple[str, ...]] = tuple(key for key, _ in _FIELDS)
+    _VALUES: ClassVar[Callable] = operator.attrgetter(*(attr for _, attr in _FIELDS))
+
+    @classmethod
+    def from_dict(cls, data: dict, *, reset_display_bindings: bool = False) -> "SenderConfig":
+        pixel_format = str(data.get("pixelFormat") or "uyvy422").strip().lower()
+        extra = {k: v for k, v in cls._extra(data).items() if k not in _LEGACY_SENDER_KEYS}
+        return cls(
+            display_id="" if reset_display_bindings else str(data.get("displayId") or ""),
+            name=str(data.get("name") or "SRT Multiview").strip() or "SRT Multiview",
+            fps=max(1, min(60, _as_int(data.get("fps"), 30))),
+            pixel_format=pixel_format if pixel_format in VALID_OMT_PIXEL_FORMATS else "uyvy422",
+            clock_output=bool(data.get("clockOutput", False)),
+            reference_level=_as_float(data.get("referenceLevel", 1.0), 1.0),
+            extra=extra,
+        )
+
+
+@dataclass(slots=True)
+class ReceiverConfig(_JsonModel):
+    decode: str = "cpu"
+    stats: bool = False
+    max_concurrent_starts: int = 4
+    launch_settle: float = 0.5
+    shared_decode: bool = False
+    replace_timeout: float = 10.0
+    extra: dict = field(default_factory=dict)
+
+    _FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("decode", "decode"),
+        ("stats", "stats"),
+        ("maxConcurrentStarts", "max_concurrent_starts"),
+        ("launchSettle", "launch_settle"),
+        ("sharedDecode", "shared_decode"),
+        ("replaceTimeout", "replace_timeout"),
+    )
+    _KNOWN: ClassVar[frozenset] = frozenset(key for key, _ in _FIELDS)
+    _KEYS: ClassVar[tuple[str, ...]] = tuple(key for key, _ in _FIELDS)
+    _VALUES: ClassVar[Callable] = operator.attrgetter(*(attr for _, attr in _FIELDS))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReceiverConfig":
+        decode = str(data.get("decode") or "cpu").strip().lower()
+        if decode == "gpu":
+            decode = "auto"
+        return cls(
+            decode=decode if decode in VALID_RECEIVER_DECODES else "cpu",
+            stats=bool(data.get("stats", False)),
+            max_concurrent_starts=max(1, min(64, _as_int(data.get("maxConcurrentStarts"), 4))),
+            launch_settle=max(0.0, _as_float(data.get("launchSettle", 0.5), 0.5)),
+            shared_decode=bool(data.get("sharedDecode", False)),
+            replace_timeout=max(1.0, _as_float(data.get("replaceTimeout", 10.0), 10.0)),
+            extra=cls._extra(data),
+        )
+
+
+MOSAIC_MAX_GRID = 8
+
+
+@dataclass(slots=True)
+class MosaicConfig(_JsonModel):
+    """A grid of streams composited onto one display by a single ffmpeg."""
+
+    id: str
+    name: str
+    display_id: str = ""
+    columns: int = 2
+    rows: int = 2
+    tiles: list[tuple[str, str]] = field(default_factory=list)
+    show_labels: bool = True
+    fps: int = 25
+    extra: dict = field(default_factory=dict)
+
+    _FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("id", "id"),
+        ("name", "name"),
+        ("displayId", "display_id"),
+        ("columns", "columns"),
+        ("rows", "rows"),
+        ("tiles", "tiles"),
+        ("showLabels", "show_labels"),
+        ("fps", "fps"),
+    )
+    _KNOWN: ClassVar[frozenset] = frozenset(key for key, _ in _FIELDS)
+    _KEYS: ClassVar[tuple[str, ...]] = tuple(key for key, _ in _FIELDS)
+    _VALUES: ClassVar[Callable] = operator.attrgetter(*(attr for _, attr in _FIELDS))
+
+    @classmethod
+    def from_dict(cls, data: dict, index: int = 0, *, reset_display_bindings: bool = False) -> "MosaicConfig":
+        mosaic_id = str(data.get("id") or f"mosaic-{index + 1}")
+        columns = max(1, min(MOSAIC_MAX_GRID, _as_int(data.get("columns"), 2)))
+        rows = max(1, min(MOSAIC_MAX_GRID, _as_int(data.get("rows"), 2)))
+        tiles = []
+        for tile in list(data.get("tiles") or [])[: columns * rows]:
+            tile = tile if isinstance(tile, dict) else {"streamId": tile}
+            tiles.append((str(tile.get("streamId") or ""), str(tile.get("label") or "").strip()))
+        tiles.extend([("", "")] * (columns * rows - len(tiles)))
+        return cls(
+            id=mosaic_id,
+            name=str(data.get("name") or mosaic_id),
+            display_id="" if reset_display_bindings else str(data.get("displayId") or ""),
+            columns=columns,
+            rows=rows,
+            tiles=tiles,
+            show_labels=bool(data.get("showLabels", True)),
+            fps=max(1, min(60, _as_int(data.get("fps"), 25))),
+            extra=cls._extra(data),
+        )
+
+    def to_dict(self) -> dict:
+        data = _JsonModel.to_dict(self)
+        data["tiles"] = [{"streamId": stream_id, "label": label} for stream_id, label in self.tiles]
+        return data
+
+
+@dataclass(slots=True)
+class WallConfig(_JsonModel):
+    """One stream spread over a rectangle of displays (video wall)."""
+
+    id: str
+    name: str
+    stream_id: str = ""
+    display_ids: list[str] = field(default_factory=list)
+    bezel_x: int = 0
+    bezel_y: int = 0
+    extra: dict = field(default_factory=dict)
+
+    _FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("id", "id"),
+        ("name", "name"),
+        ("streamId", "stream_id"),
+        ("displayIds", "display_ids"),
+        ("bezelX", "bezel_x"),
+        ("bezelY", "bezel_y"),
+    )
+    _KNOWN: ClassVar[frozenset] = frozenset(key for key, _ in _FIELDS)
+    _KEYS: ClassVar[tuple[str, ...]] = tuple(key for key, _ in _FIELDS)
+    _VALUES: ClassVar[Callable] = operator.attrgetter(*(attr for _, attr in _FIELDS))
+
+    @classmethod
+    def from_dict(cls, data: dict, index: int = 0, *, reset_display_bindings: bool = False) -> "WallConfig":
+        wall_id = str(data.get("id") or f"wall-{index + 1}")
+        display_ids = data.get("displayIds") or []
+        if reset_display_bindings or not isinstance(display_ids, list):
+            display_ids = []
+        return cls(
+            id=wall_id,
+            name=str(data.get("name") or wall_id),
+            stream_id=str(data.get("streamId") or ""),
+            display_ids=list(dict.fromkeys(str(d) for d in display_ids if d)),
+            bezel_x=max(0, min(1000, _as_int(data.get("bezelX"), 0))),
+            bezel_y=max(0, min(1000, _as_int(data.get("bezelY"), 0))),
+            extra=cls._extra(data),
+        )
+
+    def to_dict(self) -> dict:
+        data = _JsonModel.to_dict(self)
+        data["displayIds"] = list(self.display_ids)
+        return data
+
+
+def _normalize_sections(config: dict) -> None:
+    """Normalize the plain-dict sections (watchdog, headless, metrics) in place."""
+    watchdog = dict(config.get("watchdog") or {})
+    watchdog["enabled"] = bool(watchdog.get("enabled", True))
+    try:
+        watchdog["maxAttempts"] = max(1, int(watchdog.get("maxAttempts") or 5))
+    except (TypeError, ValueError):
+        watchdog["maxAttempts"] = 5
+    for key, default in (
+        ("baseDelay", 1.0),
+        ("maxDelay", 30.0),
+        ("stableAfter", 30.0),
+        ("circuitCooldown", 300.0),
+        ("stallTimeout", 10.0),
     ):
-        sender.pop(legacy, None)
-    config["sender"] = sender
-
-    receiver = dict(config.get("receiver") or {})
-    receiver.setdefault("decode", "cpu")
-    decode = str(receiver.get("decode") or "cpu").strip().lower()
-    if decode == "gpu":
-        decode = "auto"
-    if decode not in VALID_RECEIVER_DECODES:
-        decode = "cpu"
-    receiver["decode"] = decode
-    config["receiver"] = receiver
-
-    mapping = {} if reset_display_bindings else (config.get("mapping") or {})
-    config["mapping"] = {str(k): str(v) for k, v in mapping.items() if v is not None}
-
-    streams = config.get("streams") or []
-    normalized_streams = []
-    for i, s in enumerate(streams):
-        if not isinstance(s, dict):
-            continue
-        stream = dict(s)
-        stream.setdefault("id", f"stream-{i + 1}")
-        stream.setdefault("name", stream["id"])
-        stream.setdefault("port", 9000 + i + 1)
-        stream.setdefault("latency", 120)
-        stream.setdefault("muteAudio", False)
-        stream.setdefault("displayMode", "fit")
-        stream.setdefault("rotate", 0)
-        stream.setdefault("source", "srt")
-        stream.setdefault("sourceRouteId", "")
-        stream.setdefault("udpAddr", "")
-        stream.setdefault("udpPort", 0)
-        stream.setdefault("omtSource", "")
-        stream["id"] = str(stream.get("id") or f"stream-{i + 1}")
-        stream["name"] = str(stream.get("name") or stream["id"])
-        try:
-            stream["port"] = int(stream.get("port") or (9000 + i + 1))
-        except (TypeError, ValueError):
-            stream["port"] = 9000 + i + 1
-        try:
-            stream["latency"] = int(stream.get("latency") or 120)
-        except (TypeError, ValueError):
-            stream["latency"] = 120
-        stream["muteAudio"] = bool(stream.get("muteAudio", False))
-        mode = str(stream.get("displayMode") or "fit").strip().lower()
-        if mode not in {"fit", "fill", "stretch"}:
-            mode = "fit"
-        stream["displayMode"] = mode
-        try:
-            rotate = int(stream.get("rotate") or 0)
-        except (TypeError, ValueError):
-            rotate = 0
-        if rotate not in {0, 90, 180, 270}:
-            rotate = 0
-        stream["rotate"] = rotate
-        source = str(stream.get("source") or "srt").strip().lower()
-        if source not in VALID_STREAM_SOURCES:
-            source = "srt"
-        stream["source"] = source
-        stream["sourceRouteId"] = str(stream.get("sourceRouteId") or "")
-        stream["udpAddr"] = str(stream.get("udpAddr") or "").strip()
         try:
-            stream["udpPort"] = int(stream.get("udpPort") or 0)
+            watchdog[key] = max(0.0, float(watchdog.get(key, default)))
         except (TypeError, ValueError):
-            stream["udpPort"] = 0
-        stream["omtSource"] = str(stream.get("omtSource") or "").strip()
-        normalized_streams.append(stream)
+            watchdog[key] = default
+    watchdog["stallRecycle"] = bool(watchdog.get("stallRecycle", False))
+    config["watchdog"] = watchdog
+
+    headless = dict(config.get("headless") or {})
+    headless["controlHost"] = str(headless.get("controlHost") or "127.0.0.1").strip() or "127.0.0.1"
+    try:
+        headless["controlPort"] = int(headless.get("controlPort") or 8765)
+    except (TypeError, ValueError):
+        headless["controlPort"] = 8765
+    if not 0 < headless["controlPort"] < 65536:
+        headless["controlPort"] = 8765
+    config["headless"] = headless
+
+    metrics = dict(config.get("metrics") or {})
+    metrics["enabled"] = bool(metrics.get("enabled", False))
+    metrics["host"] = str(metrics.get("host") or "127.0.0.1").strip() or "127.0.0.1"
+    try:
+        metrics["port"] = int(metrics.get("port") or 9464)
+    except (TypeError, ValueError):
+        metrics["port"] = 9464
+    if not 0 < metrics["port"] < 65536:
+        metrics["port"] = 9464
+    config["metrics"] = metrics
+
+
+_MODEL_KEYS = frozenset({"streams", "routes", "sender", "receiver", "mapping", "displayNames", "mosaics", "walls"})
 
-    config["streams"] = normalized_streams
-    return config
+
+@dataclass(slots=True)
+class ConfigModel:
+    """Validated configuration with O(1) lookups by id.
+
+    Built once at the load / edit boundary and kept as ``config_store.model``;
+    other top-level sections stay normalized dicts in ``options``.
+    """
+
+    streams: list[StreamConfig]
+    routes: list[RouteConfig]
+    sender: SenderConfig
+    receiver: ReceiverConfig
+    mapping: dict[str, str]
+    display_names: dict[str, str]
+    options: dict
+    mosaics: list[MosaicConfig] = field(default_factory=list)
+    walls: list[WallConfig] = field(default_factory=list)
+    streams_by_id: dict[str, StreamConfig] = field(init=False, repr=False)
+    routes_by_id: dict[str, RouteConfig] = field(init=False, repr=False)
+    mosaics_by_id: dict[str, MosaicConfig] = field(init=False, repr=False)
+    walls_by_id: dict[str, WallConfig] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.reindex()
+
+    def reindex(self) -> None:
+        self.streams_by_id = {stream.id: stream for stream in self.streams}
+        self.routes_by_id = {route.id: route for route in self.routes}
+        self.mosaics_by_id = {mosaic.id: mosaic for mosaic in self.mosaics}
+        self.walls_by_id = {wall.id: wall for wall in self.walls}
+
+    @classmethod
+    def from_dict(cls, config: dict | None) -> "ConfigModel":
+        config = dict(config or {})
+        reset_display_bindings = _config_display_schema_version(config) != DISPLAY_ID_SCHEMA_VERSION
+
+        options = copy.deepcopy({key: value for key, value in config.items() if key not in _MODEL_KEYS})
+        options["displayIdSchemaVersion"] = DISPLAY_ID_SCHEMA_VERSION
+        options["excludePrimaryDisplay"] = bool(options.get("excludePrimaryDisplay", True))
+        options["autoStartReceiver"] = bool(options.get("autoStartReceiver", False))
+        options["autoStartSender"] = bool(options.get("autoStartSender", False))
+        options["keepChildrenOnExit"] = bool(options.get("keepChildrenOnExit", False))
+        _normalize_sections(options)
+
+        display_names = config.get("displayNames") or {}
+        if reset_display_bindings or not isinstance(display_names, dict):
+            display_names = {}
+        mapping = {} if reset_display_bindings else (config.get("mapping") or {})
+
+        routes = config.get("routes") or []
+        streams = config.get("streams") or []
+        mosaics = config.get("mosaics") or []
+        walls = config.get("walls") or []
+        stream_models = [StreamConfig.from_dict(s, i) for i, s in enumerate(streams) if isinstance(s, dict)]
+        _assign_switcher_ports(stream_models)
+        return cls(
+            streams=stream_models,
+            routes=[
+                RouteConfig.from_dict(r, i) for i, r in enumerate(routes if isinstance(routes, list) else [])
+                if isinstance(r, dict)
+            ],
+            sender=SenderConfig.from_dict(dict(config.get("sender") or {}), reset_display_bindings=reset_display_bindings),
+            receiver=ReceiverConfig.from_dict(dict(config.get("receiver") or {})),
+            mapping={str(k): str(v) for k, v in mapping.items() if v is not None},
+            display_names={str(k): str(v) for k, v in display_names.items() if v is not None},
+            options=options,
+            mosaics=[
+                MosaicConfig.from_dict(m, i, reset_display_bindings=reset_display_bindings)
+                for i, m in enumerate(mosaics if isinstance(mosaics, list) else [])
+                if isinstance(m, dict)
+            ],
+            walls=[
+                WallConfig.from_dict(w, i, reset_display_bindings=reset_display_bindings)
+                for i, w in enumerate(walls if isinstance(walls, list) else [])
+                if isinstance(w, dict)
+            ],
+        )
+
+    def to_dict(self) -> dict:
+        # The model outlives the dicts it hands out: callers may edit those.
+        config = copy.deepcopy(self.options)
+        config["streams"] = [stream.to_dict() for stream in self.streams]
+        config["mapping"] = dict(self.mapping)
+        config["displayNames"] = dict(self.display_names)
+        config["routes"] = [route.to_dict() for route in self.routes]
+        config["sender"] = self.sender.to_dict()
+        config["receiver"] = self.receiver.to_dict()
+        config["mosaics"] = [mosaic.to_dict() for mosaic in self.mosaics]
+        config["walls"] = [wall.to_dict() for wall in self.walls]
+        return config
+
+
+def _assign_switcher_ports(streams: list[StreamConfig]) -> None:
+    """Give switcher streams a unique loopback port, kept once saved."""
+    used: set[int] = set()
+    pending: list[StreamConfig] = []
+    for stream in streams:
+        if not stream.switcher:
+            continue
+        if 0 < stream.switcher_port < 65536 and stream.switcher_port not in used:
+            used.add(stream.switcher_port)
+        else:
+            pending.append(stream)
+    port = SWITCHER_PORT_BASE
+    for stream in pending:
+        while port in used:
+            port += 1
+        stream.switcher_port = port
+        used.add(port)
+
+
+def normalize_config(config: dict) -> dict:
+    """Validate a config coming from outside (file, API, tests) into its JSON form.
+
+    Code paths inside the app get configs that already went through
+    :func:`load_config` or :meth:`ConfigStore.commit` and do not call this.
+    """
+    return ConfigModel.from_dict(config).to_dict()
+
+
+def index_by_id(items) -> dict:
+    """``{str(item["id"]): item}`` for a list of config/display dicts."""
+    return {str(item.get("id")): item for item in items or [] if isinstance(item, dict)}
 
 
 def save_config(config: dict) -> None:
-    config = normalize_config(config)
+    """Write an already normalized ``config`` synchronously."""
+    _write_config(config)
+    config_store.mark_written(config)
+
+
+def _write_config(config: dict) -> None:
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = CONFIG_PATH.with_suffix(CONFIG_PATH.suffix + ".tmp")
     with open(tmp_path, "w", encoding="utf-8") as f:
@@ -489,17 +1069,126 @@ def save_config(config: dict) -> None:
     os.replace(tmp_path, CONFIG_PATH)
 
 
-def get_displays(exclude_primary: bool = False, *, name_overrides: dict[str, str] | None = None) -> list[dict]:
-    if sys.platform == "win32":
-        try:
-            return _get_displays_windows(exclude_primary=exclude_primary, name_overrides=name_overrides)
-        except Exception:
-            return []
+def _section_digests(config: dict) -> dict[str, str]:
+    return {
+        key: hashlib.sha1(json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+        for key, value in config.items()
+    }
 
-    monitors = get_monitors()
-    displays = []
-    overrides = name_overrides or {}
 
+class ConfigStore:
+    """Coalesced background writer for ``config.json``.
+
+    Holds the validated :class:`ConfigModel` as ``model``; a burst of
+    :meth:`submit` calls costs one write, made only if a section changed.
+    """
+
+    def __init__(self, delay: float = 0.5):
+        self.delay = float(delay)
+        self.writes = 0
+        self.skipped = 0
+        self.last_changed: tuple[str, ...] = ()
+        self.last_error: str | None = None
+        self._cond = threading.Condition()
+        self.model: ConfigModel | None = None
+        self._pending: ConfigModel | None = None
+        self._due = 0.0
+        self._writing = False
+        self._written: dict[str, str] = {}
+        self._thread: threading.Thread | None = None
+
+    def mark_written(self, config: dict) -> None:
+        """Record the normalized ``config`` as the on-disk content."""
+        digests = _section_digests(config)
+        with self._cond:
+            self._written = digests
+
+    def dirty_sections(self, config: dict | None = None) -> list[str]:
+        """Sections of ``config`` (default: the current model) that differ from disk."""
+        if config is None:
+            config = self.snapshot()
+        digests = _section_digests(config)
+        with self._cond:
+            written = dict(self._written)
+        return sorted(key for key in set(digests) | set(written) if digests.get(key) != written.get(key))
+
+    def commit(self, config: dict) -> dict:
+        """Validate ``config`` into the current model and return its JSON form."""
+        model = ConfigModel.from_dict(config)
+        with self._cond:
+            self.model = model
+        return model.to_dict()
+
+    def snapshot(self) -> dict:
+        """A fresh JSON-form copy of the current model, safe to hand to another thread."""
+        model = self.model
+        return model.to_dict() if model is not None else normalize_config({})
+
+    def submit(self, config: dict, *, delay: float | None = None) -> dict:
+        """Commit ``config`` and schedule its write; returns the normalized dict."""
+        model = ConfigModel.from_dict(config)
+        with self._cond:
+            self.model = model
+            self._pending = model
+            self._due = time.monotonic() + (self.delay if delay is None else max(0.0, float(delay)))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="srt-multiview-config", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return model.to_dict()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Write any pending snapshot now; ``False`` if still busy after ``timeout``."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._due = 0.0
+            self._cond.notify_all()
+            while self._pending is not None or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None or time.monotonic() < self._due:
+                    if self._pending is None:
+                        self._cond.wait()
+                    else:
+                        self._cond.wait(max(0.0, self._due - time.monotonic()))
+                model, self._pending = self._pending, None
+                self._writing = True
+                written = dict(self._written)
+            try:
+                snapshot = model.to_dict()
+                digests = _section_digests(snapshot)
+                changed = tuple(sorted(k for k in set(digests) | set(written) if digests.get(k) != written.get(k)))
+                if changed:
+                    # Same temp file + fsync + os.replace as save_config.
+                    _write_config(snapshot)
+                    self.last_error = None
+            except OSError as e:
+                changed, digests = (), written
+                self.last_error = str(e)
+            with self._cond:
+                if changed:
+                    self._written = digests
+                    self.last_changed = changed
+                    self.writes += 1
+                elif self.last_error is None:
+                    self.skipped += 1
+                self._writing = False
+                self._cond.notify_all()
+
+
+config_store = ConfigStore()
+atexit.register(config_store.flush)
+
+
+def _monitor_displays(monitors: list, exclude_primary: bool, overrides: dict[str, str]) -> list[dict]:
+    displays = []
     pending: list[tuple[str, int, object]] = []
     for i, m in enumerate(monitors):
         is_primary = bool(getattr(m, "is_primary", False))
@@ -545,162 +1234,1880 @@ def get_displays(exclude_primary: bool = False, *, name_overrides: dict[str, str
     return _sort_displays(displays)
 
 
-@dataclass
-class PlayerLaunchResult:
-    ok: bool
-    reason: str | None = None
+def _enumerate_displays() -> list:
+    """Full (uncached) walk: display dicts on Windows, screeninfo monitors elsewhere."""
+    if sys.platform == "win32":
+        try:
+            return _get_displays_windows()
+        except Exception:
+            return []
+    return list(get_monitors())
 
 
-class PlayerManager:
-    def __init__(self, ffplay_path: Path):
-        self.ffplay_path = ffplay_path
-        self.players: dict[str, subprocess.Popen] = {}
-        self.player_logs: dict[str, dict] = {}
+def _display_fingerprint(raw: list) -> tuple:
+    if sys.platform == "win32":
+        return tuple(
+            (d["id"], d["name"], d["x"], d["y"], d["width"], d["height"], d["isPrimary"]) for d in raw
+        )
+    return tuple(
+        (getattr(m, "name", None), m.x, m.y, m.width, m.height, bool(getattr(m, "is_primary", False))) for m in raw
+    )
 
-    def _set_log_info(self, stream_id: str, **kwargs) -> None:
-        info = dict(self.player_logs.get(stream_id) or {})
-        info.setdefault("stderr", deque(maxlen=120))
-        info.update(kwargs)
-        self.player_logs[stream_id] = info
 
-    def _capture_stderr(self, stream_id: str, proc: subprocess.Popen) -> None:
-        stderr = getattr(proc, "stderr", None)
-        if stderr is None:
-            return
-        try:
-            for line in stderr:
-                text = str(line).rstrip()
-                if not text:
-                    continue
-                info = self.player_logs.get(stream_id)
-                if not info:
-                    continue
-                buffer = info.get("stderr")
-                if isinstance(buffer, deque):
-                    buffer.append(text)
-        except Exception:
-            pass
-        finally:
+def _topology_hint():
+    """Cheap value that changes with the topology, ``None`` when unavailable.
+
+    Windows: monitor count and virtual screen rectangle. Linux: DRM connector
+    status. A change triggers a full re-enumeration.
+    """
+    try:
+        if sys.platform == "win32":
+            metrics = ctypes.windll.user32.GetSystemMetrics
+            # SM_XVIRTUALSCREEN .. SM_CMONITORS
+            return tuple(int(metrics(i)) for i in (76, 77, 78, 79, 80))
+        if sys.platform.startswith("linux"):
+            hint = []
+            for connector in sorted(Path("/sys/class/drm").glob("card*-*")):
+                status = (connector / "status").read_text().strip()
+                modes = (connector / "modes").read_text() if status == "connected" else ""
+                hint.append((connector.name, status, modes))
+            return tuple(hint) or None
+    except (OSError, AttributeError, ValueError):
+        return None
+    return None
+
+
+class DisplayTopology:
+    """Cached display enumeration with a generation counter.
+
+    Re-enumerates only on :meth:`refresh`, :meth:`invalidate` or :meth:`watch`;
+    a real change bumps ``generation`` and sends a ``"displays"`` state event.
+    """
+
+    def __init__(self, poll_interval: float = 2.0, probe_interval: float = 15.0):
+        self.poll_interval = poll_interval
+        self.probe_interval = probe_interval
+        self.generation = 0
+        self.probes = 0
+        self._lock = threading.Lock()
+        self._raw: list | None = None
+        self._fingerprint: tuple | None = None
+        self._stale = True
+        self._watch_thread: threading.Thread | None = None
+
+    def invalidate(self) -> None:
+        """Re-enumerate on the next read."""
+        with self._lock:
+            self._stale = True
+
+    def refresh(self) -> bool:
+        """Re-enumerate now (e.g. on Qt screen signals); ``True`` when the topology changed."""
+        with self._lock:
+            changed = self._probe_locked()
+        if changed:
+            _notify_state("displays", "", True)
+        return changed
+
+    def _probe_locked(self) -> bool:
+        raw = _enumerate_displays()
+        fingerprint = _display_fingerprint(raw)
+        self.probes += 1
+        self._stale = False
+        previous, self._fingerprint, self._raw = self._fingerprint, fingerprint, raw
+        if fingerprint == previous:
+            return False
+        self.generation += 1
+        return previous is not None
+
+    def displays(self, exclude_primary: bool = False, *, name_overrides: dict[str, str] | None = None) -> list[dict]:
+        """Fresh display dicts from the cached enumeration."""
+        changed = False
+        with self._lock:
+            if self._stale:
+                changed = self._probe_locked()
+            raw = self._raw or []
+        if changed:
+            _notify_state("displays", "", True)
+
+        overrides = name_overrides or {}
+        if sys.platform != "win32":
+            return _monitor_displays(raw, exclude_primary, overrides)
+        return _windows_displays(raw, exclude_primary, overrides)
+
+    def watch(self) -> None:
+        """Start the background topology poll (once)."""
+        with self._lock:
+            if self._watch_thread is not None:
+                return
+            self._watch_thread = threading.Thread(target=self._watch_loop, name="srt-multiview-displays", daemon=True)
+            self._watch_thread.start()
+
+    def _watch_loop(self) -> None:
+        hint = _topology_hint()
+        last_probe = time.monotonic()
+        while True:
+            time.sleep(self.poll_interval)
+            # The cheap hint catches most changes; a periodic full probe backs it up.
+            current = _topology_hint()
+            now = time.monotonic()
+            if current == hint and now - last_probe < self.probe_interval:
+                continue
+            hint, last_probe = current, now
             try:
-                stderr.close()
+                self.refresh()
             except Exception:
                 pass
 
-    def debug_info(self, stream_id: str) -> dict:
-        info = dict(self.player_logs.get(stream_id) or {})
-        proc = self.players.get(stream_id)
-        if proc is not None:
-            info["running"] = proc.poll() is None
-            info["pid"] = proc.pid
-            if proc.poll() is not None:
-                info["returncode"] = proc.returncode
-        info.setdefault("path", str(self.ffplay_path))
-        stderr_lines = info.get("stderr")
-        if isinstance(stderr_lines, deque):
-            info["stderr"] = list(stderr_lines)
-        elif not isinstance(stderr_lines, list):
-            info["stderr"] = []
-        return info
 
-    def stop_player(self, stream_id: str) -> None:
-        proc = self.players.get(stream_id)
-        _terminate_proc(proc)
-        self.players.pop(stream_id, None)
-        info = self.player_logs.get(stream_id)
-        if info is not None:
-            info["running"] = False
-            if proc is not None and proc.poll() is not None:
-                info["returncode"] = proc.returncode
+display_topology = DisplayTopology()
 
-    def stop_all(self) -> None:
-        for stream_id in list(self.players.keys()):
-            self.stop_player(stream_id)
 
-    def clear_logs(self, stream_id: str) -> None:
-        self.player_logs.pop(stream_id, None)
+def get_displays(exclude_primary: bool = False, *, name_overrides: dict[str, str] | None = None) -> list[dict]:
+    return display_topology.displays(exclude_primary, name_overrides=name_overrides)
 
-    def _input_args(self, stream: dict) -> tuple[list[str], str | None]:
-        """Return ffplay/ffmpeg input args (everything that goes before any output)."""
-        source = str(stream.get("source") or "srt").strip().lower()
-        if source not in {"srt", "udp", "omt"}:
-            source = "srt"
 
-        if source == "udp":
-            addr = str(stream.get("udpAddr") or "").strip()
-            udp_port = int(stream.get("udpPort") or 0)
-            if not addr or udp_port <= 0:
-                return ([], "Source UDP invalide")
-            return (["-i", f"udp://@{addr}:{udp_port}"], None)
-
-        if source == "omt":
-            name = str(stream.get("omtSource") or "").strip()
-            if not name:
-                return ([], "Source OMT vide")
-            return (["-f", "libomt", "-i", name], None)
-
-        latency_ms = int(stream.get("latency", 120))
-        port = int(stream.get("port"))
-        return (["-i", f"srt://0.0.0.0:{port}?mode=listener&latency={latency_ms * 1000}"], None)
-
-    def _vf(self, stream: dict, display: dict, *, hwaccel: str = "cpu") -> str:
-        display_w = int(display["width"])
-        display_h = int(display["height"])
-        mode = str(stream.get("displayMode") or "fit").strip().lower()
-        if mode not in {"fit", "fill", "stretch"}:
-            mode = "fit"
+_LINE_SPLIT_RE = re.compile(rb"[\r\n]")
 
-        try:
-            rotate = int(stream.get("rotate") or 0)
-        except Exception:
-            rotate = 0
-        if rotate not in {0, 90, 180, 270}:
-            rotate = 0
-
-        if mode == "stretch":
-            vf = f"scale={display_w}:{display_h}"
-        elif mode == "fill":
-            vf = (
-                f"scale={display_w}:{display_h}:force_original_aspect_ratio=increase,"
-                f"crop={display_w}:{display_h}"
-            )
-        else:
-            vf = (
-                f"scale={display_w}:{display_h}:force_original_aspect_ratio=decrease,"
-                f"pad={display_w}:{display_h}:(ow-iw)/2:(oh-ih)/2"
-            )
 
-        if rotate == 90:
-            vf = f"transpose=1,{vf}"
-        elif rotate == 270:
-            vf = f"transpose=2,{vf}"
-        elif rotate == 180:
-            vf = f"hflip,vflip,{vf}"
+def _pidfd_supported() -> bool:
+    if not sys.platform.startswith("linux") or not hasattr(os, "pidfd_open"):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False
+    return True
 
-        hwaccel = str(hwaccel or "cpu").strip().lower()
-        if hwaccel == "h264_qsv":
-            return f"hwdownload,format=nv12,format=yuv420p,{vf}"
-        if hwaccel in {"auto", "dxva2", "h264_amf", "h264_cuvid"}:
-            return f"format=yuv420p,{vf}"
-        return vf
 
-    def start_player(self, stream: dict, display: dict, *, hwaccel: str = "cpu") -> PlayerLaunchResult:
-        if not self.ffplay_path.exists():
-            return PlayerLaunchResult(ok=False, reason=f"ffplay introuvable: {self.ffplay_path}")
+def _install_child_watcher(loop: asyncio.AbstractEventLoop) -> None:
+    """Use pidfd exit notifications for children on Python 3.10/3.11 on Linux.
 
-        stream_id = str(stream.get("id"))
-        self.stop_player(stream_id)
+    Their default watcher parks one ``waitpid`` thread per child.
+    """
+    if sys.version_info >= (3, 12) or not _pidfd_supported():
+        return
+    watcher_cls = getattr(asyncio, "PidfdChildWatcher", None)
+    if watcher_cls is None:
+        return
+    try:
+        watcher = watcher_cls()
+        watcher.attach_loop(loop)
+        asyncio.set_child_watcher(watcher)
+    except Exception:
+        pass
 
-        input_args, input_err = self._input_args(stream)
-        if input_err:
-            return PlayerLaunchResult(ok=False, reason=input_err)
 
-        hwaccel = str(hwaccel or "cpu").strip().lower()
-        if hwaccel == "gpu":
-            hwaccel = "auto"
-        if hwaccel not in VALID_RECEIVER_DECODES:
-            hwaccel = "cpu"
+@dataclass
+class ProcessEvent:
+    key: str
+    kind: str
+    pid: int | None = None
+    returncode: int | None = None
+    line: str | None = None
+
+
+class SupervisedProcess:
+    """Popen-like handle on a child owned by :class:`ProcessSupervisor`.
+
+    Signals are marshalled onto the supervisor loop, except :meth:`signal_tree`.
+    """
+
+    def __init__(
+        self,
+        supervisor: "ProcessSupervisor",
+        key: str,
+        proc: asyncio.subprocess.Process,
+        *,
+        own_group: bool = False,
+        job: int | None = None,
+    ):
+        self._supervisor = supervisor
+        self._proc = proc
+        self._exited = threading.Event()
+        self._own_group = own_group
+        self._job = job
+        self.key = key
+        self.pid: int = proc.pid
+        self.returncode: int | None = None
+        self.started_at = time.monotonic()
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int | None:
+        if not self._exited.wait(timeout):
+            raise subprocess.TimeoutExpired(self.key, timeout)
+        return self.returncode
+
+    def terminate(self) -> None:
+        self._supervisor._call_soon(self._send, "terminate")
+
+    def kill(self) -> None:
+        self._supervisor._call_soon(self._send, "kill")
+
+    def _send(self, action: str) -> None:
+        if self.returncode is not None:
+            return
+        try:
+            getattr(self._proc, action)()
+        except (ProcessLookupError, OSError):
+            pass
+
+    def signal_tree(self, *, kill: bool = False) -> None:
+        if self.returncode is not None or self._proc.returncode is not None:
+            return
+        if sys.platform == "win32":
+            job = self._job
+            if job is not None and _win_dll("kernel32").TerminateJobObject(job, 1):
+                return
+            _taskkill(self.pid)
+        elif self._own_group:
+            try:
+                os.killpg(self.pid, signal.SIGKILL if kill else signal.SIGTERM)
+                return
+            except OSError:
+                pass
+        self.kill() if kill else self.terminate()
+
+    def _mark_exited(self, returncode: int | None) -> None:
+        self.returncode = returncode
+        job, self._job = self._job, None
+        if job is not None:
+            _win_dll("kernel32").CloseHandle(job)
+        self._exited.set()
+
+
+class ProcessSupervisor:
+    """Single background asyncio loop owning every FFmpeg/ffplay child.
+
+    Subscribers get ``log``/``exit`` events on the loop thread: callbacks
+    must be quick and must not block.
+    """
+
+    def __init__(self):
+        # Windows: children die with the app (config keepChildrenOnExit: false).
+        self.kill_on_close = True
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._children: dict[str, SupervisedProcess] = {}
+        self._subscribers: list[Callable[[ProcessEvent], None]] = []
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self._thread is not None and self._thread.is_alive():
+                return self._loop
+            loop = asyncio.new_event_loop()
+            _install_child_watcher(loop)
+            ready = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=_run, name="srt-multiview-supervisor", daemon=True)
+            self._thread.start()
+            ready.wait()
+            return loop
+
+    def _call_soon(self, callback: Callable, *args) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass
+
+    def run_later(self, delay: float, callback: Callable[[], None]) -> None:
+        """Run ``callback`` on the loop's worker pool after ``delay`` seconds.
+
+        The loop thread itself never runs blocking work, so callbacks are free
+        to call back into the managers (which wait on :meth:`spawn`).
+        """
+        loop = self._ensure_loop()
+
+        def _guarded() -> None:
+            try:
+                callback()
+            except Exception:
+                pass
+
+        def _fire() -> None:
+            loop.run_in_executor(None, _guarded)
+
+        loop.call_soon_threadsafe(loop.call_later, max(0.0, float(delay)), _fire)
+
+    def subscribe(self, callback: Callable[[ProcessEvent], None]) -> None:
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ProcessEvent], None]) -> None:
+        with self._lock:
+            try:
+                self._subscribers.remove(callback)
+            except ValueError:
+                pass
+
+    def _emit(self, event: ProcessEvent) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                pass
+
+    def get(self, key: str) -> SupervisedProcess | None:
+        with self._lock:
+            return self._children.get(key)
+
+    def children(self) -> dict[str, SupervisedProcess]:
+        with self._lock:
+            return dict(self._children)
+
+    def adopt(self, handle: SupervisedProcess, key: str) -> None:
+        """Move a running child under ``key``; its exit is then reported there."""
+        with self._lock:
+            if self._children.get(handle.key) is handle:
+                self._children.pop(handle.key, None)
+            handle.key = key
+            self._children[key] = handle
+
+    def spawn(
+        self,
+        key: str,
+        args: list[str],
+        *,
+        stdin: bool = False,
+        on_line: Callable[[str], None] | None = None,
+        on_stdout_line: Callable[[str], None] | None = None,
+        **popen_kwargs,
+    ) -> SupervisedProcess:
+        """Start ``args`` on the supervisor loop and return its handle once it exists.
+
+        Lines ``on_line`` returns ``True`` for, and stdout lines, are not broadcast.
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._spawn(
+                key,
+                list(args),
+                stdin=stdin,
+                on_line=on_line,
+                on_stdout_line=on_stdout_line,
+                popen_kwargs=popen_kwargs,
+            ),
+            loop,
+        )
+        return future.result()
+
+    async def _spawn(
+        self,
+        key: str,
+        args: list[str],
+        *,
+        stdin: bool,
+        on_line: Callable[[str], None] | None,
+        on_stdout_line: Callable[[str], None] | None,
+        popen_kwargs: dict,
+    ) -> SupervisedProcess:
+        # One process group per child so a stop reaches its whole tree.
+        own_group = sys.platform != "win32" and popen_kwargs.setdefault("start_new_session", True)
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=subprocess.PIPE if stdin else subprocess.DEVNULL,
+            stdout=subprocess.PIPE if on_stdout_line is not None else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            **popen_kwargs,
+        )
+        job = None
+        if sys.platform == "win32":
+            try:
+                job = _create_kill_job(proc.pid, kill_on_close=self.kill_on_close)
+            except Exception:
+                job = None
+        handle = SupervisedProcess(self, key, proc, own_group=bool(own_group), job=job)
+        with self._lock:
+            self._children[key] = handle
+        self._emit(ProcessEvent(key=key, kind="spawn", pid=handle.pid))
+        asyncio.ensure_future(self._watch(handle, on_line, on_stdout_line))
+        return handle
+
+    async def _watch(
+        self,
+        handle: SupervisedProcess,
+        on_line: Callable[[str], None] | None,
+        on_stdout_line: Callable[[str], None] | None = None,
+    ) -> None:
+        proc = handle._proc
+        try:
+            readers = []
+            if proc.stderr is not None:
+                readers.append(self._read_lines(handle, proc.stderr, on_line))
+            if proc.stdout is not None and on_stdout_line is not None:
+
+                def consume(text: str) -> bool:
+                    try:
+                        on_stdout_line(text)
+                    except Exception:
+                        pass
+                    return True
+
+                readers.append(self._read_lines(handle, proc.stdout, consume))
+            await asyncio.gather(*readers)
+            returncode = await proc.wait()
+        except Exception:
+            returncode = proc.returncode
+        handle._mark_exited(returncode)
+        with self._lock:
+            if self._children.get(handle.key) is handle:
+                self._children.pop(handle.key, None)
+        self._emit(ProcessEvent(key=handle.key, kind="exit", pid=handle.pid, returncode=returncode))
+
+    async def _read_lines(
+        self,
+        handle: SupervisedProcess,
+        reader: asyncio.StreamReader,
+        on_line: Callable[[str], None] | None,
+    ) -> None:
+        pending = b""
+        while True:
+            chunk = await reader.read(4096)
+            if not chunk:
+                break
+            parts = _LINE_SPLIT_RE.split(pending + chunk)
+            pending = parts.pop()
+            for raw in parts:
+                self._dispatch_line(handle, raw, on_line)
+        if pending:
+            self._dispatch_line(handle, pending, on_line)
+
+    def _dispatch_line(self, handle: SupervisedProcess, raw: bytes, on_line: Callable[[str], None] | None) -> None:
+        text = raw.decode("utf-8", errors="replace").rstrip()
+        if not text:
+            return
+        if on_line is not None:
+            try:
+                if on_line(text) is True:
+                    return
+            except Exception:
+                pass
+        self._emit(ProcessEvent(key=handle.key, kind="log", pid=handle.pid, line=text))
+
+
+supervisor = ProcessSupervisor()
+
+
+# Start/stop work (Popen, taskkill, terminate + wait) runs here so callers
+# such as the Qt thread only ever hold a Future.
+control_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="srt-multiview-control")
+
+
+def run_in_control(fn: Callable, *args, **kwargs) -> Future:
+    return control_executor.submit(fn, *args, **kwargs)
+
+
+class _KeyedLocks:
+    """One re-entrant lock per child id: start/stop/restart of a child never interleave."""
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self._locks: dict[str, threading.RLock] = {}
+
+    def __call__(self, key: str) -> threading.RLock:
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.RLock()
+            return lock
+
+
+@dataclass
+class StateEvent:
+    kind: str
+    child_id: str
+    running: bool
+    returncode: int | None = None
+
+
+_state_listeners: list[Callable[[StateEvent], None]] = []
+_state_listeners_lock = threading.Lock()
+
+
+def subscribe_state_changes(callback: Callable[[StateEvent], None]) -> None:
+    """Register ``callback`` for player/route/sender state changes.
+
+    Callbacks run on the supervisor thread; GUI code must hop back to its own
+    thread (e.g. through a Qt signal) before touching widgets.
+    """
+    with _state_listeners_lock:
+        if callback not in _state_listeners:
+            _state_listeners.append(callback)
+
+
+def unsubscribe_state_changes(callback: Callable[[StateEvent], None]) -> None:
+    with _state_listeners_lock:
+        try:
+            _state_listeners.remove(callback)
+        except ValueError:
+            pass
+
+
+def _notify_state(kind: str, child_id: str, running: bool, returncode: int | None = None) -> None:
+    with _state_listeners_lock:
+        listeners = list(_state_listeners)
+    event = StateEvent(kind=kind, child_id=child_id, running=running, returncode=returncode)
+    for callback in listeners:
+        try:
+            callback(event)
+        except Exception:
+            pass
+
+
+@dataclass
+class RestartPolicy:
+    enabled: bool = True
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    jitter: float = 0.25
+    stable_after: float = 30.0
+    circuit_cooldown: float = 300.0
+
+    def delay_for(self, attempt: int) -> float:
+        base = min(self.max_delay, self.base_delay * (2 ** max(0, attempt - 1)))
+        spread = base * max(0.0, self.jitter)
+        return max(0.0, base + random.uniform(-spread, spread))
+
+
+@dataclass
+class _RestartState:
+    restart: Callable[[], bool]
+    armed: bool = True
+    attempts: int = 0
+    restarts: int = 0
+    last_exit_code: int | None = None
+    last_start_at: float = 0.0
+    next_restart_at: float | None = None
+    circuit_open_until: float | None = None
+    generation: int = 0
+
+
+class RestartWatchdog:
+    """Restart crashed children with exponential backoff and a circuit breaker.
+
+    Managers ``arm`` a key with a restart callable on start and ``disarm`` it
+    on an intentional stop.
+    """
+
+    def __init__(self, policy: RestartPolicy | None = None):
+        self.policy = policy or RestartPolicy()
+        self._lock = threading.Lock()
+        self._states: dict[str, _RestartState] = {}
+
+    def arm(self, key: str, restart: Callable[[], bool]) -> None:
+        with self._lock:
+            previous = self._states.get(key)
+            state = _RestartState(restart=restart, last_start_at=time.monotonic())
+            if previous is not None:
+                state.restarts = previous.restarts
+                state.last_exit_code = previous.last_exit_code
+                state.generation = previous.generation + 1
+            self._states[key] = state
+
+    def disarm(self, key: str) -> None:
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return
+            state.armed = False
+            state.attempts = 0
+            state.next_restart_at = None
+            state.circuit_open_until = None
+            state.generation += 1
+
+    def is_armed(self, key: str) -> bool:
+        with self._lock:
+            state = self._states.get(key)
+            return bool(state and state.armed)
+
+    def armed_keys(self, prefix: str = "") -> list[str]:
+        with self._lock:
+            return [k for k, st in self._states.items() if st.armed and k.startswith(prefix)]
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._states.pop(key, None)
+
+    def on_exit(self, key: str, returncode: int | None) -> bool:
+        """Record an unexpected exit; return ``True`` when a restart is scheduled."""
+        policy = self.policy
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or not state.armed:
+                return False
+            now = time.monotonic()
+            state.last_exit_code = returncode
+            if not policy.enabled:
+                state.armed = False
+                return False
+            # A child that stayed up long enough starts a fresh backoff.
+            if now - state.last_start_at >= policy.stable_after:
+                state.attempts = 0
+            state.attempts += 1
+            if state.attempts > max(1, policy.max_attempts):
+                # Circuit open: one half-open retry per cooldown.
+                delay = max(1.0, policy.circuit_cooldown)
+                state.circuit_open_until = now + delay
+                state.attempts = max(1, policy.max_attempts)
+            else:
+                delay = policy.delay_for(state.attempts)
+                state.circuit_open_until = None
+            state.next_restart_at = now + delay
+            state.generation += 1
+            generation = state.generation
+        supervisor.run_later(delay, lambda: self._fire(key, generation))
+        return True
+
+    def _fire(self, key: str, generation: int) -> None:
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or not state.armed or state.generation != generation:
+                return
+            state.next_restart_at = None
+            state.circuit_open_until = None
+            state.restarts += 1
+            state.last_start_at = time.monotonic()
+            restart = state.restart
+        try:
+            ok = bool(restart())
+        except Exception:
+            ok = False
+        if not ok:
+            self.on_exit(key, None)
+
+    def pending(self, key: str) -> bool:
+        with self._lock:
+            state = self._states.get(key)
+            return bool(state and state.armed and state.next_restart_at is not None)
+
+    def info(self, key: str) -> dict:
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return {"restarts": 0, "restart_attempts": 0, "last_exit_code": None, "restart_pending": False}
+            now = time.monotonic()
+            return {
+                "restarts": state.restarts,
+                "restart_attempts": state.attempts,
+                "last_exit_code": state.last_exit_code,
+                "restart_pending": bool(state.armed and state.next_restart_at is not None),
+                "next_restart_in": (
+                    max(0.0, state.next_restart_at - now) if state.next_restart_at is not None else None
+                ),
+                "circuit_open": bool(state.circuit_open_until and state.circuit_open_until > now),
+            }
+
+
+restart_watchdog = RestartWatchdog()
+
+
+def _exit_reason(stderr_lines, returncode: int | None) -> str:
+    last_line = ""
+    if stderr_lines:
+        try:
+            last_line = str(stderr_lines[-1])
+        except IndexError:
+            last_line = ""
+    reason = f"Arrêt inattendu (code {returncode if returncode is not None else '?'})"
+    return f"{reason}: {last_line}" if last_line else reason
+
+
+def configure_supervisor(config: dict) -> None:
+    """Apply ``keepChildrenOnExit`` to children spawned from now on."""
+    supervisor.kill_on_close = not bool((config or {}).get("keepChildrenOnExit", False))
+
+
+def configure_watchdog(config: dict) -> None:
+    """Apply the ``watchdog`` section of ``config`` to :data:`restart_watchdog`."""
+    section = (config or {}).get("watchdog") or {}
+    defaults = RestartPolicy()
+    try:
+        restart_watchdog.policy = RestartPolicy(
+            enabled=bool(section.get("enabled", defaults.enabled)),
+            max_attempts=int(section.get("maxAttempts", defaults.max_attempts)),
+            base_delay=float(section.get("baseDelay", defaults.base_delay)),
+            max_delay=float(section.get("maxDelay", defaults.max_delay)),
+            jitter=defaults.jitter,
+            stable_after=float(section.get("stableAfter", defaults.stable_after)),
+            circuit_cooldown=float(section.get("circuitCooldown", defaults.circuit_cooldown)),
+        )
+    except (TypeError, ValueError):
+        restart_watchdog.policy = defaults
+    try:
+        player_manager.stall_timeout = max(0.0, float(section.get("stallTimeout", 10.0)))
+    except (TypeError, ValueError):
+        player_manager.stall_timeout = 10.0
+    player_manager.stall_recycle = bool(section.get("stallRecycle", False))
+    if player_manager.players:
+        player_manager._ensure_stall_monitor()
+
+
+def configure_player_stats(config: dict) -> None:
+    """Turn the per-stream ffplay stats history on or off (``receiver.stats``)."""
+    enabled = bool((config.get("receiver") or {}).get("stats", False))
+    player_manager.stats_enabled = enabled
+    if not enabled:
+        player_manager.stats_history.clear()
+
+
+class LaunchScheduler:
+    """Admit player launches a few at a time, highest ``priority`` first.
+
+    A finished launch keeps its slot ``settle`` more seconds; every queue
+    change is published as a ``queue`` state event.
+    """
+
+    def __init__(self, max_concurrent: int = 4, settle: float = 0.5):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.settle = max(0.0, float(settle))
+        self._cond = threading.Condition()
+        self._queue: list[tuple[int, int, str]] = []
+        self._seq = itertools.count()
+        self._cancelled: set[int] = set()
+        self._active = 0
+        self._cooling: list[float] = []
+
+    def configure(self, max_concurrent: int, settle: float) -> None:
+        with self._cond:
+            self.max_concurrent = max(1, int(max_concurrent))
+            self.settle = max(0.0, float(settle))
+            self._cond.notify_all()
+
+    def _free_slots(self, now: float) -> int:
+        self._cooling = [until for until in self._cooling if until > now]
+        return self.max_concurrent - self._active - len(self._cooling)
+
+    def _remove(self, entry: tuple[int, int, str]) -> None:
+        self._queue.remove(entry)
+        heapq.heapify(self._queue)
+        self._cancelled.discard(entry[1])
+        self._cond.notify_all()
+
+    def acquire(self, key: str, priority: int = 0, cancel: threading.Event | None = None) -> bool:
+        """Wait for a launch slot; ``False`` if cancelled while queued."""
+        entry = (-int(priority), next(self._seq), key)
+        with self._cond:
+            heapq.heappush(self._queue, entry)
+        self._announce()
+        try:
+            with self._cond:
+                while True:
+                    if entry[1] in self._cancelled or (cancel is not None and cancel.is_set()):
+                        self._remove(entry)
+                        return False
+                    now = time.monotonic()
+                    if self._queue[0] == entry and self._free_slots(now) > 0:
+                        heapq.heappop(self._queue)
+                        self._active += 1
+                        self._cond.notify_all()
+                        return True
+                    # Wake up when a settle window ends, and poll ``cancel``.
+                    timeout = min([0.25] + [until - now for until in self._cooling])
+                    self._cond.wait(max(0.01, timeout))
+        finally:
+            self._announce(key)
+
+    def release(self) -> None:
+        with self._cond:
+            self._active = max(0, self._active - 1)
+            if self.settle > 0:
+                self._cooling.append(time.monotonic() + self.settle)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, key: str, priority: int = 0, cancel: threading.Event | None = None):
+        granted = self.acquire(key, priority, cancel)
+        try:
+            yield granted
+        finally:
+            if granted:
+                self.release()
+
+    def cancel(self, key: str) -> None:
+        """Drop the queued (not yet admitted) launches of ``key``."""
+        self.cancel_matching(lambda k: k == key)
+
+    def cancel_matching(self, predicate: Callable[[str], bool]) -> None:
+        with self._cond:
+            self._cancelled.update(seq for _, seq, key in self._queue if predicate(key))
+            self._cond.notify_all()
+
+    def position(self, key: str) -> int | None:
+        """1-based place of ``key`` in the queue, ``None`` when not waiting."""
+        with self._cond:
+            for index, (_, _, queued) in enumerate(sorted(self._queue), start=1):
+                if queued == key:
+                    return index
+        return None
+
+    def _announce(self, left: str | None = None) -> None:
+        with self._cond:
+            keys = [key for _, _, key in self._queue]
+        if left is not None and left not in keys:
+            keys.append(left)
+        for key in keys:
+            _notify_state("queue", key.partition(":")[2], False)
+
+
+launch_scheduler = LaunchScheduler()
+
+
+def configure_launch_scheduler(config: dict) -> None:
+    receiver = config.get("receiver") or {}
+    launch_scheduler.configure(int(receiver.get("maxConcurrentStarts") or 4), float(receiver.get("launchSettle", 0.5)))
+
+
+_FFPLAY_STATUS_RE = re.compile(
+    r"^\s*(?P<clock>nan|-?inf|-?\d+(?:\.\d+)?)\s+(?P<label>A-V|M-V|M-A)?\s*:\s*"
+    r"(?P<diff>nan|-?inf|-?\d+(?:\.\d+)?)\s+fd=\s*(?P<fd>-?\d+)\s+"
+    r"aq=\s*(?P<aq>-?\d+)KB\s+vq=\s*(?P<vq>-?\d+)KB\s+sq=\s*(?P<sq>-?\d+)B"
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (seconds) with constant memory."""
+
+    BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 20.0, 30.0, 60.0)
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        self._lock = threading.Lock()
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.last: float | None = None
+
+    def observe(self, value: float) -> None:
+        value = max(0.0, float(value))
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.total += value
+            self.last = value
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile (``inf`` past the last)."""
+        with self._lock:
+            if not self.count:
+                return None
+            target = max(1, int(round(q * self.count)))
+            seen = 0
+            for i, n in enumerate(self.counts):
+                seen += n
+                if seen >= target:
+                    return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            cumulative = []
+            running = 0
+            for bound, n in zip(self.buckets + (float("inf"),), self.counts):
+                running += n
+                cumulative.append((bound, running))
+            return {"buckets": cumulative, "count": self.count, "sum": self.total, "last": self.last}
+
+
+PROGRESS_HISTORY = 120
+
+
+def _progress_value(key: str, value: str) -> float | int | None:
+    value = value.strip()
+    if not value or value == "N/A":
+        return None
+    try:
+        if key == "bitrate":
+            # "1234.5kbits/s" -> bits/s
+            number = value.lower().removesuffix("/s")
+            scale = 1000.0 if number.endswith("kbits") else 1.0
+            return float(number.removesuffix("kbits").removesuffix("bits")) * scale
+        if key == "speed":
+            return float(value.lower().removesuffix("x"))
+        if key == "fps":
+            return float(value)
+        return int(value)
+    except ValueError:
+        return None
+
+
+class ProgressTelemetry:
+    """Fold ffmpeg ``-progress`` key=value blocks into a fixed-size ring buffer.
+
+    Each block ends with a ``progress=continue|end`` line; one sample per
+    block (``-stats_period``) is kept, oldest first.
+    """
+
+    FIELDS = {
+        "frame": "frames",
+        "fps": "fps",
+        "bitrate": "bitrate",
+        "total_size": "total_size",
+        "speed": "speed",
+        "dup_frames": "frames_duplicated",
+        "drop_frames": "frames_dropped",
+    }
+
+    def __init__(self, maxlen: int = PROGRESS_HISTORY):
+        self._block: dict[str, float | int | None] = {}
+        self.history: deque = deque(maxlen=maxlen)
+        self.last: dict | None = None
+
+    def feed(self, line: str) -> None:
+        key, sep, value = line.partition("=")
+        if not sep:
+            return
+        key = key.strip()
+        if key == "progress":
+            sample = {"t": time.time(), **self._block}
+            self._block = {}
+            self.history.append(sample)
+            self.last = sample
+            return
+        field = self.FIELDS.get(key)
+        if field is not None:
+            self._block[field] = _progress_value(key, value)
+
+    def snapshot(self) -> dict:
+        return {"last": dict(self.last) if self.last else None, "history": list(self.history)}
+
+
+STARTUP_PHASES = ("connect", "first_frame")
+PLAYER_STATS_HISTORY = 300
+PLAYER_STATS_PERIOD = 1.0
+STALL_CHECK_PERIOD = 1.0
+# Smallest A-V / M-V change counted as a presented frame: the status line
+# prints 3 decimals and the two clocks are read a few µs apart.
+STALL_DRIFT_STEP = 0.002
+
+
+def _status_float(value: str) -> float | None:
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if number == number and abs(number) != float("inf") else None
+
+
+class _StartupProbe:
+    """Follow one ffplay launch from spawn to first displayed frame, then its heartbeat."""
+
+    __slots__ = (
+        "spawned_at", "connected_at", "first_frame_at", "last_beat_at",
+        "last_clock", "last_drift", "last_drops", "realtime",
+    )
+
+    def __init__(self, *, realtime: bool = False):
+        self.spawned_at = time.monotonic()
+        self.connected_at: float | None = None
+        self.first_frame_at: float | None = None
+        self.last_beat_at: float | None = None
+        self.last_clock: str | None = None
+        self.last_drift: float | None = None
+        self.last_drops: int | None = None
+        self.realtime = realtime
+
+    def beat(self, match: re.Match) -> bool:
+        """Record a heartbeat if the line shows playback progressing."""
+        clock = match.group("clock")
+        moved = clock != self.last_clock
+        self.last_clock = clock
+        drift = _status_float(match.group("diff"))
+        drops = int(match.group("fd"))
+        drift_moved = (
+            drift is not None and self.last_drift is not None and abs(drift - self.last_drift) >= STALL_DRIFT_STEP
+        )
+        dropped = self.last_drops is not None and drops != self.last_drops
+        self.last_drift, self.last_drops = drift, drops
+        if self.first_frame_at is None or not moved:
+            return False
+        # ffplay extrapolates its clocks between frames: a moving master clock
+        # alone does not prove frames are still presented. Queues are printed
+        # in whole KB, often 0 at low bitrate: one signal among others.
+        queued = int(match.group("vq")) + int(match.group("aq")) > 0
+        if self.realtime:
+            # -sync ext slews the clock when queues run dry: the A-V/M-V
+            # difference drifts on a frozen picture too.
+            alive = queued or dropped
+        elif match.group("label") == "M-A":
+            # The audio clock is re-anchored by the samples actually played.
+            alive = True
+        else:
+            # The difference moves when a frame re-anchors the video clock.
+            alive = drift_moved or dropped or queued
+        if not alive:
+            return False
+        self.last_beat_at = time.monotonic()
+        return True
+
+    def feed(self, match: re.Match) -> list[str]:
+        phases: list[str] = []
+        now = time.monotonic()
+        clock = match.group("clock")
+        # The clock label stays blank until the input is probed, and the
+        # master clock reads nan until the first frame is presented.
+        has_frame = clock not in {"nan", "inf", "-inf"}
+        if self.connected_at is None and (match.group("label") or has_frame):
+            self.connected_at = now
+            phases.append("connect")
+        if self.first_frame_at is None and has_frame:
+            self.first_frame_at = now
+            phases.append("first_frame")
+        return phases
+
+
+@dataclass
+class PlayerLaunchResult:
+    ok: bool
+    reason: str | None = None
+
+
+def _stream_input_args(stream: dict) -> tuple[list[str], str | None]:
+    """Return ffplay/ffmpeg input args (everything that goes before any output)."""
+    source = str(stream.get("source") or "srt").strip().lower()
+    if source not in {"srt", "udp", "omt", "slate"}:
+        source = "srt"
+
+    if source == "slate":
+        text = _filter_escape(str(stream.get("name") or stream.get("id") or ""))
+        graph = (
+            f"color=c=0x101820:s=1280x720:r={SWITCHER_FPS},drawtext=text={text}:expansion=none{_drawtext_font()}"
+            ":fontsize=48:fontcolor=white:x=(w-tw)/2:y=(h-th)/2"
+        )
+        return (["-f", "lavfi", "-i", graph], None)
+
+    if source == "udp":
+        addr = str(stream.get("udpAddr") or "").strip()
+        udp_port = int(stream.get("udpPort") or 0)
+        if not addr or udp_port <= 0:
+            return ([], "Source UDP invalide")
+        return (["-i", f"udp://@{addr}:{udp_port}"], None)
+
+    if source == "omt":
+        name = str(stream.get("omtSource") or "").strip()
+        if not name:
+            return ([], "Source OMT vide")
+        return (["-f", "libomt", "-i", name], None)
+
+    latency_ms = int(stream.get("latency", 120))
+    port = int(stream.get("port"))
+    return (["-i", f"srt://0.0.0.0:{port}?mode=listener&latency={latency_ms * 1000}"], None)
+
+
+def _fit_filter(stream: dict, width: int, height: int) -> str:
+    """Scale (fit/fill/stretch) and rotate ``stream`` into a ``width`` x ``height`` box."""
+    mode = str(stream.get("displayMode") or "fit").strip().lower()
+    if mode not in {"fit", "fill", "stretch"}:
+        mode = "fit"
+
+    try:
+        rotate = int(stream.get("rotate") or 0)
+    except Exception:
+        rotate = 0
+    if rotate not in {0, 90, 180, 270}:
+        rotate = 0
+
+    if mode == "stretch":
+        vf = f"scale={width}:{height}"
+    elif mode == "fill":
+        vf = (
+            f"scale={width}:{height}:force_original_aspect_ratio=increase,"
+            f"crop={width}:{height}"
+        )
+    else:
+        vf = (
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+        )
+
+    if rotate == 90:
+        vf = f"transpose=1,{vf}"
+    elif rotate == 270:
+        vf = f"transpose=2,{vf}"
+    elif rotate == 180:
+        vf = f"hflip,vflip,{vf}"
+    return vf
+
+
+def _input_shareable(stream: dict) -> bool:
+    """Whether two players can open ``stream``'s input at once (multicast, OMT, slate)."""
+    source = str(stream.get("source") or "srt").strip().lower()
+    if source in {"omt", "slate"}:
+        return True
+    if source != "udp":
+        return False
+    try:
+        return ipaddress.ip_address(str(stream.get("udpAddr") or "").strip()).is_multicast
+    except ValueError:
+        return False
+
+
+def _display_geometry(display: dict) -> tuple[int, int, int, int]:
+    return (int(display["x"]), int(display["y"]), int(display["width"]), int(display["height"]))
+
+
+def _overlaps(a: tuple[int, int, int, int], b: tuple[int, int, int, int]) -> bool:
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+def span_rect(displays: list[dict], others: list[dict] = ()) -> tuple[int, int, int, int] | None:
+    """Bounding box of ``displays`` if they tile it exactly, else ``None``.
+
+    One borderless window over that box then covers those displays and
+    nothing else: any gap, overlap, or other display (``others``) inside the
+    box rules it out.
+    """
+    rects = [_display_geometry(d) for d in displays]
+    if not rects:
+        return None
+    x0 = min(r[0] for r in rects)
+    y0 = min(r[1] for r in rects)
+    x1 = max(r[0] + r[2] for r in rects)
+    y1 = max(r[1] + r[3] for r in rects)
+    box = (x0, y0, x1 - x0, y1 - y0)
+    if sum(r[2] * r[3] for r in rects) != box[2] * box[3]:
+        return None
+    for i, rect in enumerate(rects):
+        if any(_overlaps(rect, other) for other in rects[i + 1 :]):
+            return None
+    ids = {str(d.get("id")) for d in displays}
+    if any(str(d.get("id")) not in ids and _overlaps(box, _display_geometry(d)) for d in others):
+        return None
+    return box
+
+
+def shared_decode_filter(members: list[tuple[dict, dict]], rect: tuple[int, int, int, int]) -> str:
+    """ffplay ``-vf`` graph showing one decoded input on each member display.
+
+    ``members`` are ``(stream, display)`` pairs spanning ``rect``; every
+    output is scaled and rotated with its own stream settings, then the
+    outputs are stacked at their display offsets inside the window.
+    """
+    labels = [f"v{index}" for index in range(len(members))]
+    chains = ["split=" + str(len(members)) + "".join(f"[s{index}]" for index in range(len(members)))]
+    layout = []
+    for index, (stream, display) in enumerate(members):
+        x, y, width, height = _display_geometry(display)
+        chains.append(f"[s{index}]{_fit_filter(stream, width, height)},setsar=1[{labels[index]}]")
+        layout.append(f"{x - rect[0]}_{y - rect[1]}")
+    chains.append("".join(f"[{label}]" for label in labels) + f"xstack=inputs={len(members)}:layout={'|'.join(layout)}")
+    return ";".join(chains)
+
+
+def wall_player_id(wall_id: str) -> str:
+    """Player id of the video wall ``wall_id``."""
+    return f"wall:{wall_id}"
+
+
+def wall_filter(
+    stream: dict, displays: list[dict], rect: tuple[int, int, int, int], bezel_x: int = 0, bezel_y: int = 0
+) -> str:
+    """ffplay ``-vf`` graph spreading ``stream`` over ``displays`` (a wall tiling ``rect``).
+
+    The image behind the bezels (``bezel_x`` / ``bezel_y`` per inner seam) is
+    skipped, so lines stay straight across them.
+    """
+    columns = sorted({int(d["x"]) for d in displays})
+    rows = sorted({int(d["y"]) for d in displays})
+    width = rect[2] + (len(columns) - 1) * bezel_x
+    height = rect[3] + (len(rows) - 1) * bezel_y
+    fit = f"{_fit_filter(stream, width, height)},setsar=1"
+
+    crops = []
+    layout = []
+    for display in displays:
+        x, y, w, h = _display_geometry(display)
+        crop_x = x - rect[0] + columns.index(x) * bezel_x
+        crop_y = y - rect[1] + rows.index(y) * bezel_y
+        crops.append(f"crop={w}:{h}:{crop_x}:{crop_y}")
+        layout.append(f"{x - rect[0]}_{y - rect[1]}")
+    if len(displays) == 1:
+        return f"{fit},{crops[0]}"
+
+    chains = [f"{fit},split={len(displays)}" + "".join(f"[s{i}]" for i in range(len(displays)))]
+    chains += [f"[s{i}]{crop}[v{i}]" for i, crop in enumerate(crops)]
+    chains.append(
+        "".join(f"[v{i}]" for i in range(len(displays))) + f"xstack=inputs={len(displays)}:layout={'|'.join(layout)}"
+    )
+    return ";".join(chains)
+
+
+class PlayerManager:
+    def __init__(self, ffplay_path: Path):
+        self.ffplay_path = ffplay_path
+        self.players: dict[str, SupervisedProcess] = {}
+        self.player_logs: dict[str, dict] = {}
+        self._stopping: set[int] = set()
+        self._probes: dict[str, _StartupProbe] = {}
+        self.startup_latency: dict[str, dict[str, LatencyHistogram]] = {}
+        self.startup_latency_all = {phase: LatencyHistogram() for phase in STARTUP_PHASES}
+        self.last_status: dict[str, dict] = {}
+        self.stats_enabled = False
+        self.stats_history: dict[str, deque] = {}
+        self.stall_timeout = 10.0
+        self.stall_recycle = False
+        self.stalled: dict[str, float] = {}
+        self.stall_count: dict[str, int] = {}
+        self._stall_monitor_lock = threading.Lock()
+        self._stall_monitor_running = False
+        # Geometry each player was started for, and players parked until
+        # their unplugged display comes back (see DisplayReconciler).
+        self.layouts: dict[str, tuple[int, int, int, int]] = {}
+        self.parked: set[str] = set()
+        # Shared decoders (see start_shared): group id -> member streams,
+        # member -> group id, and survivors queued for a relaunch after
+        # another member was stopped.
+        self.shared: dict[str, tuple[str, ...]] = {}
+        self.shared_of: dict[str, str] = {}
+        self.rejoining: set[str] = set()
+        # _lock guards the dicts (short sections, also taken on the supervisor
+        # loop); _key_locks serialise start/stop of one player and may be held
+        # across spawn/terminate, so the loop thread never takes them.
+        self._lock = threading.RLock()
+        self._key_locks = _KeyedLocks()
+        supervisor.subscribe(self._on_process_event)
+
+    def owner(self, stream_id: str) -> str:
+        """Id of the player process showing ``stream_id`` (its group when shared)."""
+        return self.shared_of.get(stream_id, stream_id)
+
+    def group_members(self, stream_id: str) -> tuple[str, ...]:
+        """Streams sharing a decoder with ``stream_id`` (itself included), or ``()``."""
+        return self.shared.get(self.owner(stream_id), ())
+
+    def _notify(self, stream_id: str, running: bool, returncode: int | None = None) -> None:
+        for member_id in self.shared.get(stream_id) or (stream_id,):
+            _notify_state("player", member_id, running, returncode)
+
+    def _on_player_line(self, stream_id: str, probe: _StartupProbe, stderr_lines: deque, text: str) -> bool:
+        if " fd=" not in text:
+            stderr_lines.append(text)
+            return False
+        match = _FFPLAY_STATUS_RE.match(text)
+        if match:
+            if probe.first_frame_at is None:
+                for phase in probe.feed(match):
+                    self._record_startup(stream_id, probe, phase)
+            if probe.beat(match) and stream_id in self.stalled and self._probes.get(stream_id) is probe:
+                self.stalled.pop(stream_id, None)
+                self._notify(stream_id, True)
+            if self._probes.get(stream_id) is probe:
+                sample = {
+                    "frames_dropped": int(match.group("fd")),
+                    "drift": _status_float(match.group("diff")),
+                    "audio_queue_kb": int(match.group("aq")),
+                    "video_queue_kb": int(match.group("vq")),
+                    "subtitle_queue_bytes": int(match.group("sq")),
+                }
+                self.last_status[stream_id] = sample
+                if self.stats_enabled:
+                    self._record_stats(stream_id, sample)
+        return True
+
+    def _record_stats(self, stream_id: str, sample: dict) -> None:
+        # ffplay prints its status line every ~30 ms: keep one sample per period.
+        history = self.stats_history.get(stream_id)
+        if history is None:
+            history = self.stats_history[stream_id] = deque(maxlen=PLAYER_STATS_HISTORY)
+        now = time.time()
+        if history and now - history[-1]["t"] < PLAYER_STATS_PERIOD:
+            return
+        history.append({"t": now, **sample})
+
+    def stats_summary(self, stream_id: str, window: float = 60.0) -> dict | None:
+        """Drops / drift / queue depth over the last ``window`` seconds (stats mode only)."""
+        stream_id = self.owner(stream_id)
+        history = self.stats_history.get(stream_id)
+        if not self.stats_enabled or not history or stream_id not in self.players:
+            return None
+        samples = list(history)
+        last = samples[-1]
+        recent = [x for x in samples if last["t"] - x["t"] <= window]
+        first = recent[0]
+        span = last["t"] - first["t"]
+        drops = max(0, last["frames_dropped"] - first["frames_dropped"])
+        drifts = [abs(x["drift"]) for x in recent if x.get("drift") is not None]
+        return {
+            "frames_dropped": last["frames_dropped"],
+            "drops_per_min": drops * 60.0 / span if span > 0 else 0.0,
+            "drift": last.get("drift"),
+            "max_drift": max(drifts) if drifts else None,
+            "video_queue_kb": last["video_queue_kb"],
+            "audio_queue_kb": last["audio_queue_kb"],
+            "window": span,
+        }
+
+    def telemetry(self, stream_id: str) -> dict:
+        """Last counters reported by the running player (empty when stopped)."""
+        stream_id = self.owner(stream_id)
+        if stream_id not in self.players:
+            return {}
+        return dict(self.last_status.get(stream_id) or {})
+
+    def _record_startup(self, stream_id: str, probe: _StartupProbe, phase: str) -> None:
+        at = probe.connected_at if phase == "connect" else probe.first_frame_at
+        if at is None:
+            return
+        latency = at - probe.spawned_at
+        with self._lock:
+            per_stream = self.startup_latency.setdefault(
+                stream_id, {name: LatencyHistogram() for name in STARTUP_PHASES}
+            )
+        per_stream[phase].observe(latency)
+        self.startup_latency_all[phase].observe(latency)
+        if phase == "first_frame" and self._probes.get(stream_id) is probe:
+            self._notify(stream_id, True)
+
+    def metrics_snapshot(self) -> dict:
+        """Copy of the process table, stall counters and startup histograms.
+
+        Taken under ``_lock`` so a reader on another thread (``/metrics``)
+        never iterates a dict the supervisor loop is changing.
+        """
+        with self._lock:
+            return {
+                "players": dict(self.players),
+                "shared_of": dict(self.shared_of),
+                "stall_count": dict(self.stall_count),
+                "startup_latency": {phase: hist.snapshot() for phase, hist in self.startup_latency_all.items()},
+            }
+
+    def is_stalled(self, stream_id: str) -> bool:
+        """``True`` while a running, once-ready player shows no playback progress."""
+        stream_id = self.owner(stream_id)
+        return stream_id in self.stalled and stream_id in self.players
+
+    def _ensure_stall_monitor(self) -> None:
+        with self._stall_monitor_lock:
+            if self._stall_monitor_running or self.stall_timeout <= 0:
+                return
+            self._stall_monitor_running = True
+        supervisor.run_later(STALL_CHECK_PERIOD, self._stall_tick)
+
+    def _stall_tick(self) -> None:
+        try:
+            self.check_stalls()
+        finally:
+            with self._stall_monitor_lock:
+                keep_going = bool(self.players) and self.stall_timeout > 0
+                self._stall_monitor_running = keep_going
+            if keep_going:
+                supervisor.run_later(STALL_CHECK_PERIOD, self._stall_tick)
+
+    def check_stalls(self) -> list[str]:
+        """Flag players without heartbeat for ``stall_timeout`` seconds; return the new ones."""
+        timeout = self.stall_timeout
+        if timeout <= 0:
+            return []
+        now = time.monotonic()
+        newly: list[str] = []
+        with self._lock:
+            players = list(self.players.items())
+        for stream_id, proc in players:
+            probe = self._probes.get(stream_id)
+            if probe is None or probe.first_frame_at is None or proc.poll() is not None:
+                continue
+            last = probe.last_beat_at or probe.first_frame_at
+            with self._lock:
+                if now - last < timeout or stream_id in self.stalled:
+                    continue
+                self.stalled[stream_id] = last
+                self.stall_count[stream_id] = self.stall_count.get(stream_id, 0) + 1
+            newly.append(stream_id)
+            info = self.player_logs.get(stream_id)
+            if info is not None and isinstance(info.get("stderr"), deque):
+                info["stderr"].append(f"[srt-multiview] image figée depuis {now - last:.0f}s")
+            self._notify(stream_id, True)
+            key = f"player:{stream_id}"
+            if self.stall_recycle and restart_watchdog.policy.enabled and restart_watchdog.is_armed(key):
+                # Not marked as stopping: the exit goes through the watchdog
+                # (backoff + circuit breaker) like a crash.
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+        return newly
+
+    def is_ready(self, stream_id: str) -> bool:
+        """``True`` once the running player has presented its first frame."""
+        stream_id = self.owner(stream_id)
+        proc = self.players.get(stream_id)
+        probe = self._probes.get(stream_id)
+        return bool(proc is not None and proc.poll() is None and probe and probe.first_frame_at is not None)
+
+    def _on_process_event(self, event: ProcessEvent) -> None:
+        prefix, _, stream_id = event.key.partition(":")
+        if prefix != "player" or event.kind not in {"spawn", "exit"}:
+            return
+        unexpected = False
+        with self._lock:
+            current = self.players.get(stream_id)
+            if current is not None and current.pid != event.pid:
+                self._stopping.discard(event.pid)
+                return
+            if event.kind == "spawn":
+                handle = supervisor.get(event.key)
+                if handle is not None and handle.pid == event.pid:
+                    self.players[stream_id] = handle
+            if event.kind == "exit":
+                self.players.pop(stream_id, None)
+                self.stalled.pop(stream_id, None)
+                info = self.player_logs.get(stream_id)
+                if info is not None:
+                    info["running"] = False
+                    info["returncode"] = event.returncode
+                if event.pid in self._stopping:
+                    self._stopping.discard(event.pid)
+                else:
+                    unexpected = True
+        if unexpected:
+            restart_watchdog.on_exit(event.key, event.returncode)
+        self._notify(stream_id, event.kind == "spawn", event.returncode)
+
+    def restart_pending(self, stream_id: str) -> bool:
+        return restart_watchdog.pending(f"player:{self.owner(stream_id)}")
+
+    def _set_log_info(self, stream_id: str, **kwargs) -> None:
+        info = dict(self.player_logs.get(stream_id) or {})
+        info.setdefault("stderr", deque(maxlen=120))
+        info.update(kwargs)
+        self.player_logs[stream_id] = info
+
+    def debug_info(self, stream_id: str) -> dict:
+        stream_id = self.owner(stream_id)
+        info = dict(self.player_logs.get(stream_id) or {})
+        proc = self.players.get(stream_id)
+        if proc is not None:
+            info["running"] = proc.poll() is None
+            info["pid"] = proc.pid
+            if proc.poll() is not None:
+                info["returncode"] = proc.returncode
+        info.setdefault("path", str(self.ffplay_path))
+        info.update(restart_watchdog.info(f"player:{stream_id}"))
+        probe = self._probes.get(stream_id)
+        info["ready"] = self.is_ready(stream_id)
+        startup: dict[str, float | None] = {phase: None for phase in STARTUP_PHASES}
+        if probe is not None:
+            if probe.connected_at is not None:
+                startup["connect"] = probe.connected_at - probe.spawned_at
+            if probe.first_frame_at is not None:
+                startup["first_frame"] = probe.first_frame_at - probe.spawned_at
+        info["startup"] = startup
+        info["startup_latency"] = {
+            phase: hist.snapshot() for phase, hist in (self.startup_latency.get(stream_id) or {}).items()
+        }
+        info["stalled"] = self.is_stalled(stream_id)
+        info["stalled_for"] = time.monotonic() - self.stalled[stream_id] if info["stalled"] else None
+        info["stalls"] = self.stall_count.get(stream_id, 0)
+        info["shared_with"] = list(self.shared.get(stream_id, ()))
+        info["stats"] = {
+            "enabled": self.stats_enabled,
+            "summary": self.stats_summary(stream_id),
+            "history": list(self.stats_history.get(stream_id) or []),
+        }
+        stderr_lines = info.get("stderr")
+        if isinstance(stderr_lines, deque):
+            info["stderr"] = list(stderr_lines)
+        elif not isinstance(stderr_lines, list):
+            info["stderr"] = []
+        return info
+
+    def _detach(self, stream_id: str):
+        with self._lock:
+            proc = self.players.pop(stream_id, None)
+            if proc is not None and proc.poll() is None:
+                self._stopping.add(proc.pid)
+        return proc
+
+    def _detached(self, stream_id: str, proc) -> None:
+        with self._lock:
+            info = self.player_logs.get(stream_id)
+            if info is not None:
+                info["running"] = False
+                if proc is not None and proc.poll() is not None:
+                    info["returncode"] = proc.returncode
+
+    def _stop_process(self, stream_id: str) -> None:
+        proc = self._detach(stream_id)
+        _terminate_proc(proc)
+        self._detached(stream_id, proc)
+
+    def _forget_layout(self, stream_id: str) -> None:
+        with self._lock:
+            self.layouts.pop(stream_id, None)
+            self.parked.discard(stream_id)
+            members = self.shared.pop(stream_id, ())
+            for member_id in members:
+                self.shared_of.pop(member_id, None)
+                self.layouts.pop(member_id, None)
+        # The group's exit event will no longer reach its members.
+        for member_id in members:
+            _notify_state("player", member_id, False)
+
+    def park(self, stream_ids) -> None:
+        """Mark stopped players to be started again when their display returns."""
+        with self._lock:
+            self.parked.update(stream_ids)
+
+    def layout_changed(self, stream_id: str, display: dict) -> bool:
+        with self._lock:
+            geometry = self.layouts.get(stream_id)
+        return geometry is not None and geometry != _display_geometry(display)
+
+    def reads(self, stream_id: str, stream: dict) -> bool:
+        """Whether the last player launched as ``stream_id`` opened ``stream``'s input."""
+        args, _err = _stream_input_args(stream)
+        command = (self.player_logs.get(stream_id) or {}).get("command") or ()
+        return bool(args) and args[-1] in command
+
+    def stop_player(self, stream_id: str) -> None:
+        with self._lock:
+            self.rejoining.discard(stream_id)
+        group_id = self.shared_of.get(stream_id)
+        if group_id is not None:
+            self._leave_shared(group_id, {stream_id})
+            return
+        launch_scheduler.cancel(f"player:{stream_id}")
+        with self._key_locks(stream_id):
+            restart_watchdog.disarm(f"player:{stream_id}")
+            self._forget_layout(stream_id)
+            self._stop_process(stream_id)
+
+    def stop_player_async(self, stream_id: str) -> Future:
+        return run_in_control(self.stop_player, stream_id)
+
+    def _leave_shared(self, group_id: str, leaving: set[str]) -> None:
+        """Stop the decoder ``leaving`` shared; the other members restart in the background."""
+        with self._lock:
+            members = self.shared.get(group_id, ())
+        self.stop_player(group_id)
+        rest = {member_id for member_id in members if member_id not in leaving}
+        if rest:
+            with self._lock:
+                self.rejoining.update(rest)
+            run_in_control(self._rejoin, rest)
+
+    def _rejoin(self, stream_ids: set[str]) -> None:
+        with self._lock:
+            stream_ids = stream_ids & self.rejoining
+            self.rejoining.difference_update(stream_ids)
+        if not stream_ids:
+            return
+        for stream_id, result in start_all(config_store.snapshot(), stream_ids=stream_ids).items():
+            if result.ok or result.reason == "CANCELLED":
+                continue
+            # Nobody waits on this start: leave the reason where the status views read it.
+            reason = "Écran absent" if result.reason == "NO_DISPLAY" else result.reason
+            self._set_log_info(stream_id, running=False, launch_error=reason)
+            _notify_state("player", stream_id, False)
+
+    def _begin_stop(self, stack: ExitStack, stream_ids=None) -> list[tuple[str, object]]:
+        """Lock, disarm and detach players for a batch stop (all if ``stream_ids`` is None)."""
+        if stream_ids is None:
+            launch_scheduler.cancel_matching(lambda key: key.startswith("player:"))
+            with self._lock:
+                stream_ids = set(self.players.keys())
+            stream_ids.update(key.partition(":")[2] for key in restart_watchdog.armed_keys("player:"))
+        else:
+            # Stopping any member of a shared decoder stops the whole group, as
+            # in stop_player; batch callers relaunch the survivors themselves
+            # (see DisplayReconciler.reconcile).
+            stream_ids = {self.owner(stream_id) for stream_id in stream_ids}
+            launch_scheduler.cancel_matching({f"player:{stream_id}" for stream_id in stream_ids}.__contains__)
+        detached = []
+        for stream_id in sorted(set(stream_ids)):
+            stack.enter_context(self._key_locks(stream_id))
+            restart_watchdog.disarm(f"player:{stream_id}")
+            self._forget_layout(stream_id)
+            detached.append((stream_id, self._detach(stream_id)))
+        return detached
+
+    def _end_stop(self, detached: list[tuple[str, object]]) -> None:
+        for stream_id, proc in detached:
+            self._detached(stream_id, proc)
+
+    def stop_many(self, stream_ids) -> None:
+        with ExitStack() as stack:
+            detached = self._begin_stop(stack, stream_ids)
+            terminate_processes([proc for _, proc in detached])
+            self._end_stop(detached)
+
+    def stop_all(self) -> None:
+        self.stop_many(None)
+
+    def stop_all_async(self) -> Future:
+        return run_in_control(self.stop_all)
+
+    def clear_logs(self, stream_id: str) -> None:
+        self.player_logs.pop(stream_id, None)
+        restart_watchdog.forget(f"player:{stream_id}")
+
+    def _input_args(self, stream: dict) -> tuple[list[str], str | None]:
+        return _stream_input_args(stream)
+
+    def _vf(self, stream: dict, display: dict, *, hwaccel: str = "cpu", graph: str | None = None) -> str:
+        vf = graph or _fit_filter(stream, int(display["width"]), int(display["height"]))
+
+        hwaccel = str(hwaccel or "cpu").strip().lower()
+        if hwaccel == "h264_qsv":
+            return f"hwdownload,format=nv12,format=yuv420p,{vf}"
+        if hwaccel in {"auto", "dxva2", "h264_amf", "h264_cuvid"}:
+            return f"format=yuv420p,{vf}"
+        return vf
+
+    def start_player(
+        self,
+        stream: dict,
+        display: dict,
+        *,
+        hwaccel: str = "cpu",
+        cancel: threading.Event | None = None,
+        graph: str | None = None,
+    ) -> PlayerLaunchResult:
+        stream_id = str(stream.get("id"))
+        key = f"player:{stream_id}"
+        stream = dict(stream)
+        display = dict(display)
+        # Queue before taking the key lock: a stop must be able to cancel us.
+        with launch_scheduler.slot(key, int(stream.get("priority") or 0), cancel) as granted:
+            if not granted:
+                return PlayerLaunchResult(ok=False, reason="CANCELLED")
+            with self._key_locks(stream_id):
+                restart_watchdog.disarm(key)
+                result = self._launch(stream, display, hwaccel=hwaccel, graph=graph)
+                if result.ok:
+                    restart_watchdog.arm(key, lambda: self._restart(stream, display, hwaccel, graph))
+                    with self._lock:
+                        self.layouts[stream_id] = _display_geometry(display)
+                        self.parked.discard(stream_id)
+        return result
+
+    def start_player_async(self, stream: dict, display: dict, *, hwaccel: str = "cpu") -> Future:
+        return run_in_control(self.start_player, dict(stream), dict(display), hwaccel=hwaccel)
+
+    def replace_player(
+        self,
+        stream: dict,
+        display: dict,
+        *,
+        hwaccel: str = "cpu",
+        timeout: float = 10.0,
+        cancel: threading.Event | None = None,
+        graph: str | None = None,
+    ) -> PlayerLaunchResult:
+        """Relaunch ``stream`` with new settings, make-before-break.
+
+        The old player keeps playing unless the new one shows a frame within
+        ``timeout`` seconds; the result says why a replacement was abandoned.
+        """
+        stream_id = str(stream.get("id"))
+        running = bool(self.status().get(stream_id))
+        args, _err = self._command(stream, display, hwaccel=hwaccel, graph=graph)
+        if running and args and args == (self.player_logs.get(stream_id) or {}).get("command"):
+            return PlayerLaunchResult(ok=True)
+        # Inputs only one process can open (SRT listener, unicast UDP) cannot
+        # overlap: relaunch those like any start, as a stream not playing alone.
+        if not _input_shareable(stream) or self.owner(stream_id) != stream_id or not running:
+            return self.start_player(stream, display, hwaccel=hwaccel, cancel=cancel, graph=graph)
+
+        key = f"player:{stream_id}"
+        stream = dict(stream)
+        display = dict(display)
+        with launch_scheduler.slot(key, int(stream.get("priority") or 0), cancel) as granted:
+            if not granted:
+                return PlayerLaunchResult(ok=False, reason="CANCELLED")
+            with self._key_locks(stream_id):
+                args, input_err = self._command(stream, display, hwaccel=hwaccel, graph=graph)
+                if input_err:
+                    return PlayerLaunchResult(ok=False, reason=input_err)
+
+                probe = _StartupProbe(realtime="-sync" in args)
+                ready = threading.Event()
+                stderr_lines: deque = deque(maxlen=120)
+
+                def on_line(text: str) -> bool:
+                    consumed = self._on_player_line(stream_id, probe, stderr_lines, text)
+                    if probe.first_frame_at is not None:
+                        ready.set()
+                    return consumed
+
+                # The candidate runs next to the old player under its own key.
+                try:
+                    candidate = supervisor.spawn(
+                        f"replace:{stream_id}", args, on_line=on_line, creationflags=_win_creationflags()
+                    )
+                except Exception as e:
+                    return PlayerLaunchResult(ok=False, reason=str(e))
+
+                deadline = time.monotonic() + max(0.0, float(timeout))
+                while not ready.wait(0.05):
+                    if candidate.poll() is not None or time.monotonic() >= deadline or (cancel and cancel.is_set()):
+                        break
+                if not ready.is_set():
+                    exited = candidate.poll() is not None
+                    _terminate_proc(candidate)
+                    if cancel and cancel.is_set():
+                        return PlayerLaunchResult(ok=False, reason="CANCELLED")
+                    if exited:
+                        reason = _exit_reason(stderr_lines, candidate.returncode)
+                    else:
+                        reason = f"Aucune image après {float(timeout):g} s"
+                    return PlayerLaunchResult(ok=False, reason=f"Remplacement annulé, l'ancien lecteur continue: {reason}")
+
+                # Swap: the old player's exit no longer matches and is ignored.
+                restart_watchdog.disarm(key)
+                with self._lock:
+                    old = self.players.get(stream_id)
+                    if old is not None and old.poll() is None:
+                        self._stopping.add(old.pid)
+                    supervisor.adopt(candidate, key)
+                    self.players[stream_id] = candidate
+                    self._probes[stream_id] = probe
+                    self.stalled.pop(stream_id, None)
+                    self.last_status.pop(stream_id, None)
+                    self.stats_history.pop(stream_id, None)
+                    self.layouts[stream_id] = _display_geometry(display)
+                    self._set_log_info(
+                        stream_id,
+                        path=str(self.ffplay_path),
+                        command=list(args),
+                        command_text=subprocess.list2cmdline(args),
+                        running=True,
+                        pid=candidate.pid,
+                        returncode=None,
+                        launch_error=None,
+                        stderr=stderr_lines,
+                    )
+                restart_watchdog.arm(key, lambda: self._restart(stream, display, hwaccel, graph))
+                _terminate_proc(old)
+                if candidate.poll() is not None:
+                    # Exited before the adoption: its exit event used the old key.
+                    self._on_process_event(
+                        ProcessEvent(key=key, kind="exit", pid=candidate.pid, returncode=candidate.returncode)
+                    )
+                else:
+                    self._notify(stream_id, True)
+        return PlayerLaunchResult(ok=True)
+
+    def start_wall(
+        self,
+        wall: dict,
+        stream: dict,
+        displays: list[dict],
+        *,
+        hwaccel: str = "cpu",
+        cancel: threading.Event | None = None,
+    ) -> PlayerLaunchResult:
+        """Spread ``stream`` over the displays of ``wall`` with one player.
+
+        A single borderless ffplay covers the whole wall and decodes once;
+        each display shows its crop (:func:`wall_filter`). All tiles come
+        from the same frame, so they start and stay in step.
+        """
+        rect = span_rect(displays)
+        if rect is None:
+            return PlayerLaunchResult(ok=False, reason="Écrans non contigus")
+        player_id = wall_player_id(str(wall.get("id") or ""))
+        graph = wall_filter(
+            stream, displays, rect, int(wall.get("bezelX") or 0), int(wall.get("bezelY") or 0)
+        )
+        display = {"id": player_id, "x": rect[0], "y": rect[1], "width": rect[2], "height": rect[3], "span": True}
+        return self.start_player(dict(stream, id=player_id), display, hwaccel=hwaccel, cancel=cancel, graph=graph)
+
+    def start_shared(
+        self,
+        members: list[tuple[dict, dict]],
+        *,
+        hwaccel: str = "cpu",
+        cancel: threading.Event | None = None,
+    ) -> PlayerLaunchResult:
+        """Show one source on several displays with a single decoding player.
+
+        ``members`` are ``(stream, display)`` pairs reading the same input on
+        displays tiling a rectangle; they keep their own ids for status and stop.
+        """
+        members = [(dict(stream), dict(display)) for stream, display in members]
+        member_ids = tuple(str(stream.get("id")) for stream, _ in members)
+        rect = span_rect([display for _, display in members])
+        if rect is None:
+            return PlayerLaunchResult(ok=False, reason="Écrans non contigus")
+        group_id = "shared:" + "+".join(sorted(member_ids))
+        key = f"player:{group_id}"
+        stream = dict(
+            members[0][0],
+            id=group_id,
+            muteAudio=all(bool(member.get("muteAudio")) for member, _ in members),
+        )
+        display = {"id": group_id, "x": rect[0], "y": rect[1], "width": rect[2], "height": rect[3], "span": True}
+        graph = shared_decode_filter(members, rect)
+        priority = max(int(member.get("priority") or 0) for member, _ in members)
+        # Members already playing are replaced; the other members of their old
+        # shared decoder restart in the background.
+        for old_group in dict.fromkeys(self.shared_of.get(member_id) for member_id in member_ids):
+            if old_group is not None:
+                self._leave_shared(old_group, set(member_ids))
+        for member_id in member_ids:
+            self.stop_player(member_id)
+        with launch_scheduler.slot(key, priority, cancel) as granted:
+            if not granted:
+                return PlayerLaunchResult(ok=False, reason="CANCELLED")
+            with self._key_locks(group_id):
+                restart_watchdog.disarm(key)
+                # Registered before the spawn so its events reach the members.
+                with self._lock:
+                    self.shared[group_id] = member_ids
+                    self.shared_of.update(dict.fromkeys(member_ids, group_id))
+                result = self._launch(stream, display, hwaccel=hwaccel, graph=graph)
+                if result.ok:
+                    restart_watchdog.arm(key, lambda: self._restart(stream, display, hwaccel, graph))
+                    with self._lock:
+                        for member, member_display in members:
+                            self.layouts[str(member.get("id"))] = _display_geometry(member_display)
+                            self.parked.discard(str(member.get("id")))
+                else:
+                    self._forget_layout(group_id)
+        return result
+
+    def _restart(self, stream: dict, display: dict, hwaccel: str, graph: str | None = None) -> bool:
+        stream_id = str(stream.get("id"))
+        key = f"player:{stream_id}"
+        with launch_scheduler.slot(key, int(stream.get("priority") or 0)) as granted:
+            if not granted:
+                return True
+            with self._key_locks(stream_id):
+                # A stop may have won the race after the watchdog picked this up.
+                if not restart_watchdog.is_armed(key):
+                    return True
+                return self._launch(stream, display, hwaccel=hwaccel, graph=graph).ok
+
+    def _command(
+        self, stream: dict, display: dict, *, hwaccel: str = "cpu", graph: str | None = None
+    ) -> tuple[list[str], str | None]:
+        input_args, input_err = self._input_args(stream)
+        if input_err:
+            return [], input_err
 
-        vf = self._vf(stream, display, hwaccel=hwaccel)
+        hwaccel = str(hwaccel or "cpu").strip().lower()
+        if hwaccel == "gpu":
+            hwaccel = "auto"
+        if hwaccel not in VALID_RECEIVER_DECODES:
+            hwaccel = "cpu"
+
+        vf = self._vf(stream, display, hwaccel=hwaccel, graph=graph)
 
         source = str(stream.get("source") or "srt").strip().lower()
         if source not in {"srt", "udp", "omt"}:
@@ -745,6 +3152,7 @@ class PlayerManager:
             "-hide_banner",
             "-loglevel",
             "warning",
+            "-stats",
             "-left",
             str(display["x"]),
             "-top",
@@ -755,7 +3163,8 @@ class PlayerManager:
             str(display["height"]),
             "-vf",
             vf,
-            "-fs",
+            # A window spanning several displays cannot be full screen.
+            "-noborder" if display.get("span") else "-fs",
         ])
 
         if source == "udp":
@@ -769,7 +3178,22 @@ class PlayerManager:
             args.append("-an")
 
         args.extend(input_args)
+        return args, None
+
+    def _launch(
+        self, stream: dict, display: dict, *, hwaccel: str = "cpu", graph: str | None = None
+    ) -> PlayerLaunchResult:
+        if not self.ffplay_path.exists():
+            return PlayerLaunchResult(ok=False, reason=f"ffplay introuvable: {self.ffplay_path}")
+
+        stream_id = str(stream.get("id"))
+        self._stop_process(stream_id)
+
+        args, input_err = self._command(stream, display, hwaccel=hwaccel, graph=graph)
+        if input_err:
+            return PlayerLaunchResult(ok=False, reason=input_err)
 
+        stderr_lines: deque = deque(maxlen=120)
         self._set_log_info(
             stream_id,
             path=str(self.ffplay_path),
@@ -779,25 +3203,28 @@ class PlayerManager:
             pid=None,
             returncode=None,
             launch_error=None,
-            stderr=deque(maxlen=120),
+            stderr=stderr_lines,
         )
 
         creationflags = _win_creationflags()
 
+        probe = _StartupProbe(realtime="-sync" in args)
+        self._probes[stream_id] = probe
+        self.stalled.pop(stream_id, None)
+        self.last_status.pop(stream_id, None)
+        self.stats_history.pop(stream_id, None)
+
         try:
-            proc = subprocess.Popen(
+            proc = supervisor.spawn(
+                f"player:{stream_id}",
                 args,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                bufsize=1,
+                on_line=lambda text: self._on_player_line(stream_id, probe, stderr_lines, text),
                 creationflags=creationflags,
             )
-            self.players[stream_id] = proc
-            self._set_log_info(stream_id, running=True, pid=proc.pid, launch_error=None)
-            threading.Thread(target=self._capture_stderr, args=(stream_id, proc), daemon=True).start()
+            with self._lock:
+                self.players[stream_id] = proc
+                self._set_log_info(stream_id, running=True, pid=proc.pid, launch_error=None)
+            self._ensure_stall_monitor()
             return PlayerLaunchResult(ok=True)
         except Exception as e:
             self._set_log_info(stream_id, running=False, returncode=None, launch_error=str(e))
@@ -805,15 +3232,19 @@ class PlayerManager:
 
     def status(self) -> dict[str, bool]:
         status: dict[str, bool] = {}
-        for stream_id, proc in list(self.players.items()):
-            alive = proc.poll() is None
-            status[stream_id] = alive
-            if not alive:
-                info = self.player_logs.get(stream_id)
-                if info is not None:
-                    info["running"] = False
-                    info["returncode"] = proc.returncode
-                self.players.pop(stream_id, None)
+        with self._lock:
+            for stream_id, proc in list(self.players.items()):
+                alive = proc.poll() is None
+                status[stream_id] = alive
+                if not alive:
+                    info = self.player_logs.get(stream_id)
+                    if info is not None:
+                        info["running"] = False
+                        info["returncode"] = proc.returncode
+                    self.players.pop(stream_id, None)
+            for group_id, member_ids in self.shared.items():
+                if group_id in status:
+                    status.update(dict.fromkeys(member_ids, status[group_id]))
         return status
 
 
@@ -831,16 +3262,84 @@ class SenderManager:
 
     def __init__(self, ffmpeg_path: Path):
         self.ffmpeg_path = ffmpeg_path
-        self.proc: subprocess.Popen | None = None
+        self.proc: SupervisedProcess | None = None
         self.last_error: str | None = None
+        self.stderr: deque = deque(maxlen=120)
+        self.progress = ProgressTelemetry()
+        self._stopping: set[int] = set()
+        self._lock = threading.RLock()
+        self._control_lock = threading.RLock()
+        supervisor.subscribe(self._on_process_event)
+
+    def _on_process_event(self, event: ProcessEvent) -> None:
+        if event.key != "sender" or event.kind not in {"spawn", "exit"}:
+            return
+        unexpected = False
+        with self._lock:
+            current = self.proc
+            if current is not None and current.pid != event.pid:
+                self._stopping.discard(event.pid)
+                return
+            if event.kind == "spawn":
+                handle = supervisor.get(event.key)
+                if handle is not None and handle.pid == event.pid:
+                    self.proc = handle
+            if event.kind == "exit":
+                self.proc = None
+                if event.pid in self._stopping:
+                    self._stopping.discard(event.pid)
+                else:
+                    self.last_error = _exit_reason(self.stderr, event.returncode)
+                    unexpected = True
+        if unexpected:
+            restart_watchdog.on_exit("sender", event.returncode)
+        _notify_state("sender", "sender", event.kind == "spawn", event.returncode)
+
+    def _detach(self):
+        with self._lock:
+            proc, self.proc = self.proc, None
+            if proc is not None and proc.poll() is None:
+                self._stopping.add(proc.pid)
+        return proc
+
+    def _stop_process(self) -> None:
+        _terminate_proc(self._detach())
+
+    def _begin_stop(self, stack: ExitStack) -> list[tuple[str, object]]:
+        stack.enter_context(self._control_lock)
+        restart_watchdog.disarm("sender")
+        return [("sender", self._detach())]
 
     def stop(self) -> None:
-        _terminate_proc(self.proc)
-        self.proc = None
+        with self._control_lock:
+            restart_watchdog.disarm("sender")
+            self._stop_process()
+
+    def stop_async(self) -> Future:
+        return run_in_control(self.stop)
 
     def status(self) -> bool:
         return bool(self.proc and self.proc.poll() is None)
 
+    def telemetry(self) -> dict:
+        """Last ``-progress`` sample of the running sender (empty when stopped)."""
+        if not self.status() or not self.progress.last:
+            return {}
+        return dict(self.progress.last)
+
+    def debug_info(self) -> dict:
+        proc = self.proc
+        info = {
+            "path": str(self.ffmpeg_path),
+            "running": bool(proc and proc.poll() is None),
+            "pid": proc.pid if proc is not None else None,
+            "last_error": self.last_error,
+            "stderr": list(self.stderr),
+            "progress": self.progress.snapshot(),
+        }
+        info.update(restart_watchdog.info("sender"))
+        return info
+
     def start(
         self,
         display: dict,
@@ -850,12 +3349,46 @@ class SenderManager:
         pixel_format: str = "uyvy422",
         clock_output: bool = False,
         reference_level: float = 1.0,
+    ) -> SenderLaunchResult:
+        display = dict(display)
+        options = {
+            "name": name,
+            "fps": fps,
+            "pixel_format": pixel_format,
+            "clock_output": clock_output,
+            "reference_level": reference_level,
+        }
+        with self._control_lock:
+            restart_watchdog.disarm("sender")
+            result = self._launch(display, **options)
+            if result.ok:
+                restart_watchdog.arm("sender", lambda: self._restart(display, options))
+        return result
+
+    def start_async(self, display: dict, **options) -> Future:
+        return run_in_control(self.start, dict(display), **options)
+
+    def _restart(self, display: dict, options: dict) -> bool:
+        with self._control_lock:
+            if not restart_watchdog.is_armed("sender"):
+                return True
+            return self._launch(display, **options).ok
+
+    def _launch(
+        self,
+        display: dict,
+        *,
+        name: str,
+        fps: int = 30,
+        pixel_format: str = "uyvy422",
+        clock_output: bool = False,
+        reference_level: float = 1.0,
     ) -> SenderLaunchResult:
         if not self.ffmpeg_path.exists():
             self.last_error = f"ffmpeg introuvable: {self.ffmpeg_path}"
             return SenderLaunchResult(ok=False, reason=self.last_error)
 
-        self.stop()
+        self._stop_process()
 
         capture_x = int(display.get("x", 0))
         capture_y = int(display.get("y", 0))
@@ -872,6 +3405,9 @@ class SenderManager:
             str(self.ffmpeg_path),
             "-hide_banner",
             "-loglevel", "warning",
+            "-nostats",
+            "-progress", "pipe:1",
+            "-stats_period", "1",
             "-fflags", "+nobuffer",
             "-flags", "low_delay",
             "-thread_queue_size", "512",
@@ -896,18 +3432,23 @@ class SenderManager:
 
         creationflags = _win_creationflags()
 
+        self.stderr = deque(maxlen=120)
+        self.progress = ProgressTelemetry()
+
         try:
-            self.proc = subprocess.Popen(
+            proc = supervisor.spawn(
+                "sender",
                 args,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+                stdin=True,
+                on_line=self.stderr.append,
+                on_stdout_line=self.progress.feed,
                 creationflags=creationflags,
             )
+            with self._lock:
+                self.proc = proc
             self.last_error = None
             return SenderLaunchResult(ok=True)
         except Exception as e:
-            self.proc = None
             self.last_error = str(e)
             return SenderLaunchResult(ok=False, reason=str(e))
 
@@ -921,31 +3462,241 @@ class RouteLaunchResult:
     reason: str | None = None
 
 
-class RouteManager:
+class _ChildManager:
+    """ffmpeg children of one ``kind``, keyed ``<kind>:<id>`` on the supervisor.
+
+    Tracks live handles from supervisor events, reports unexpected exits to
+    the watchdog, and handles stop, status and debug info. Subclasses launch
+    and drop their own per-child state in :meth:`_forget`.
+    """
+
+    kind = ""
+    # Launches wait in launch_scheduler: a stop also cancels queued ones.
+    queued = False
+
     def __init__(self, ffmpeg_path: Path):
         self.ffmpeg_path = ffmpeg_path
-        self.procs: dict[str, subprocess.Popen] = {}
+        self.procs: dict[str, SupervisedProcess] = {}
         self.last_error: dict[str, str] = {}
-
-    def stop_route(self, route_id: str) -> None:
-        proc = self.procs.get(route_id)
-        _terminate_proc(proc)
-        self.procs.pop(route_id, None)
+        self.logs: dict[str, deque] = {}
+        self.progress: dict[str, ProgressTelemetry] = {}
+        self._stopping: set[int] = set()
+        self._lock = threading.RLock()
+        self._key_locks = _KeyedLocks()
+        supervisor.subscribe(self._on_process_event)
+
+    def _on_process_event(self, event: ProcessEvent) -> None:
+        prefix, _, child_id = event.key.partition(":")
+        if prefix != self.kind or event.kind not in {"spawn", "exit"}:
+            return
+        unexpected = False
+        with self._lock:
+            current = self.procs.get(child_id)
+            if current is not None and current.pid != event.pid:
+                self._stopping.discard(event.pid)
+                return
+            if event.kind == "spawn":
+                handle = supervisor.get(event.key)
+                if handle is not None and handle.pid == event.pid:
+                    self.procs[child_id] = handle
+            if event.kind == "exit":
+                self.procs.pop(child_id, None)
+                if event.pid in self._stopping:
+                    self._stopping.discard(event.pid)
+                else:
+                    self.last_error[child_id] = _exit_reason(self.logs.get(child_id), event.returncode)
+                    unexpected = True
+        if unexpected:
+            restart_watchdog.on_exit(event.key, event.returncode)
+        _notify_state(self.kind, child_id, event.kind == "spawn", event.returncode)
+
+    def _forget(self, child_id: str) -> None:
+        """Drop what the subclass keeps about ``child_id`` once stopped on purpose."""
+
+    def _detach(self, child_id: str):
+        with self._lock:
+            proc = self.procs.pop(child_id, None)
+            if proc is not None and proc.poll() is None:
+                self._stopping.add(proc.pid)
+        return proc
+
+    def _stop_process(self, child_id: str) -> None:
+        _terminate_proc(self._detach(child_id))
+
+    def _stop(self, child_id: str) -> None:
+        if self.queued:
+            launch_scheduler.cancel(f"{self.kind}:{child_id}")
+        with self._key_locks(child_id):
+            restart_watchdog.disarm(f"{self.kind}:{child_id}")
+            self._forget(child_id)
+            self._stop_process(child_id)
+
+    def _begin_stop(self, stack: ExitStack, child_ids=None) -> list[tuple[str, object]]:
+        """Lock, disarm and detach children for a batch stop (all if ``child_ids`` is None)."""
+        prefix = f"{self.kind}:"
+        if child_ids is None:
+            if self.queued:
+                launch_scheduler.cancel_matching(lambda key: key.startswith(prefix))
+            with self._lock:
+                child_ids = set(self.procs.keys())
+            child_ids.update(key.partition(":")[2] for key in restart_watchdog.armed_keys(prefix))
+        detached = []
+        for child_id in sorted(set(child_ids)):
+            stack.enter_context(self._key_locks(child_id))
+            restart_watchdog.disarm(prefix + child_id)
+            self._forget(child_id)
+            detached.append((child_id, self._detach(child_id)))
+        return detached
+
+    def stop_many(self, child_ids) -> None:
+        with ExitStack() as stack:
+            detached = self._begin_stop(stack, child_ids)
+            terminate_processes([proc for _, proc in detached])
 
     def stop_all(self) -> None:
-        for route_id in list(self.procs.keys()):
-            self.stop_route(route_id)
+        self.stop_many(None)
+
+    def stop_all_async(self) -> Future:
+        return run_in_control(self.stop_all)
+
+    def debug_info(self, child_id: str) -> dict:
+        proc = self.procs.get(child_id)
+        info = {
+            "path": str(self.ffmpeg_path),
+            "running": bool(proc and proc.poll() is None),
+            "pid": proc.pid if proc is not None else None,
+            "last_error": self.last_error.get(child_id),
+            "stderr": list(self.logs.get(child_id) or []),
+            "progress": self.progress[child_id].snapshot() if child_id in self.progress else None,
+        }
+        info.update(restart_watchdog.info(f"{self.kind}:{child_id}"))
+        return info
+
+    def telemetry(self, child_id: str) -> dict:
+        """Last ``-progress`` sample of the running child (empty when stopped)."""
+        progress = self.progress.get(child_id)
+        proc = self.procs.get(child_id)
+        if progress is None or progress.last is None or proc is None or proc.poll() is not None:
+            return {}
+        return dict(progress.last)
 
     def status(self) -> dict[str, bool]:
         status: dict[str, bool] = {}
-        for route_id, proc in list(self.procs.items()):
-            alive = proc.poll() is None
-            status[route_id] = alive
-            if not alive:
-                self.procs.pop(route_id, None)
+        with self._lock:
+            for child_id, proc in list(self.procs.items()):
+                alive = proc.poll() is None
+                status[child_id] = alive
+                if not alive:
+                    self.procs.pop(child_id, None)
         return status
 
-    def start_route(self, route: dict) -> RouteLaunchResult:
+
+class RouteManager(_ChildManager):
+    kind = "route"
+
+    def __init__(self, ffmpeg_path: Path):
+        super().__init__(ffmpeg_path)
+        # Route dict each running route was started with.
+        self.launched: dict[str, dict] = {}
+        # Who reads each route (see acquire), and routes started by hand:
+        # only unpinned routes are stopped once idle.
+        self.consumers: dict[str, set[str]] = {}
+        self.pinned: set[str] = set()
+        self._idle_tokens: dict[str, object] = {}
+        subscribe_state_changes(self._on_state)
+
+    def _forget(self, route_id: str) -> None:
+        with self._lock:
+            self.launched.pop(route_id, None)
+            self.pinned.discard(route_id)
+            self._idle_tokens.pop(route_id, None)
+
+    def stop_route(self, route_id: str) -> None:
+        self._stop(route_id)
+
+    def stop_route_async(self, route_id: str) -> Future:
+        return run_in_control(self.stop_route, route_id)
+
+    def start_route(self, route: dict, *, pin: bool = True) -> RouteLaunchResult:
+        """Start ``route``; ``pin=False`` for a route started on demand for its readers.
+
+        A pinned route (started by hand, or feeding other machines) runs until
+        stopped. An unpinned one is stopped ``idleTimeout`` seconds after its
+        last consumer went away (see :meth:`acquire`).
+        """
+        route_id = str(route.get("id") or "")
+        key = f"route:{route_id}"
+        route = dict(route)
+        with self._key_locks(route_id):
+            restart_watchdog.disarm(key)
+            result = self._launch(route)
+            if result.ok:
+                restart_watchdog.arm(key, lambda: self._restart(route))
+                with self._lock:
+                    self.launched[route_id] = route
+                    if pin:
+                        self.pinned.add(route_id)
+        return result
+
+    def start_route_async(self, route: dict) -> Future:
+        return run_in_control(self.start_route, dict(route))
+
+    def _restart(self, route: dict) -> bool:
+        route_id = str(route.get("id") or "")
+        with self._key_locks(route_id):
+            if not restart_watchdog.is_armed(f"route:{route_id}"):
+                return True
+            return self._launch(route).ok
+
+    def acquire(self, route_id: str, consumer: str) -> None:
+        """Record ``consumer`` (``player:<id>``, ``mosaic:<id>``, ``feed:<id>``) as reading ``route_id``."""
+        with self._lock:
+            self.consumers.setdefault(route_id, set()).add(consumer)
+            self._idle_tokens.pop(route_id, None)
+
+    def _on_state(self, event: StateEvent) -> None:
+        if event.running or event.kind not in {"player", "mosaic", "feed"}:
+            return
+        consumer = f"{event.kind}:{event.child_id}"
+        with self._lock:
+            route_ids = [route_id for route_id, keys in self.consumers.items() if consumer in keys]
+        for route_id in route_ids:
+            self.schedule_idle_check(route_id)
+
+    def schedule_idle_check(self, route_id: str) -> None:
+        """Stop ``route_id`` after its ``idleTimeout`` if it still has no live consumer then."""
+        with self._lock:
+            route = self.launched.get(route_id)
+            if route is None or route_id in self.pinned:
+                return
+            grace = max(0, _as_int(route.get("idleTimeout", ROUTE_IDLE_TIMEOUT), 0))
+            if grace <= 0:
+                return
+            token = object()
+            self._idle_tokens[route_id] = token
+        supervisor.run_later(grace, lambda: self._stop_if_idle(route_id, token))
+
+    def _stop_if_idle(self, route_id: str, token: object) -> None:
+        with self._key_locks(route_id):
+            with self._lock:
+                if self._idle_tokens.get(route_id) is not token or route_id in self.pinned:
+                    return
+                consumers = set(self.consumers.get(route_id, ()))
+            alive = {consumer for consumer in consumers if _route_consumer_alive(consumer)}
+            with self._lock:
+                # acquire() in the meantime cancels the check.
+                if self._idle_tokens.get(route_id) is not token:
+                    return
+                self.consumers[route_id] = alive | (self.consumers.get(route_id, set()) - consumers)
+                if self.consumers[route_id]:
+                    self._idle_tokens.pop(route_id, None)
+                    return
+                del self.consumers[route_id]
+            restart_watchdog.disarm(f"route:{route_id}")
+            self._forget(route_id)
+            self._stop_process(route_id)
+
+    def _launch(self, route: dict) -> RouteLaunchResult:
         if not self.ffmpeg_path.exists():
             return RouteLaunchResult(ok=False, reason=f"ffmpeg introuvable: {self.ffmpeg_path}")
 
@@ -953,7 +3704,7 @@ class RouteManager:
         if not route_id:
             return RouteLaunchResult(ok=False, reason="Route invalide")
 
-        self.stop_route(route_id)
+        self._stop_process(route_id)
 
         in_port = int(route.get("inputPort") or 0)
         in_latency_ms = int(route.get("inputLatency") or 120)
@@ -973,6 +3724,11 @@ class RouteManager:
             "-hide_banner",
             "-loglevel",
             "warning",
+            "-nostats",
+            "-progress",
+            "pipe:1",
+            "-stats_period",
+            "1",
             "-fflags",
             "nobuffer",
             "-flags",
@@ -992,14 +3748,21 @@ class RouteManager:
 
         creationflags = _win_creationflags()
 
+        stderr_lines: deque = deque(maxlen=120)
+        self.logs[route_id] = stderr_lines
+        progress = ProgressTelemetry()
+        self.progress[route_id] = progress
+
         try:
-            proc = subprocess.Popen(
+            proc = supervisor.spawn(
+                f"route:{route_id}",
                 args,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+                on_line=stderr_lines.append,
+                on_stdout_line=progress.feed,
                 creationflags=creationflags,
             )
-            self.procs[route_id] = proc
+            with self._lock:
+                self.procs[route_id] = proc
             self.last_error.pop(route_id, None)
             return RouteLaunchResult(ok=True)
         except Exception as e:
@@ -1010,63 +3773,1087 @@ class RouteManager:
 route_manager = RouteManager(FFMPEG_PATH)
 
 
-def apply_mapping(config: dict) -> dict[str, PlayerLaunchResult]:
-    config = normalize_config(config)
+INGEST_PORT_OFFSET = 10000
+
+
+def ingest_route(stream: dict) -> dict:
+    """Route dict of the ingest keeper of an SRT ``stream``.
+
+    An ffmpeg owning the SRT listener relays the TS to a loopback port the
+    player reads, so player restarts never close the contribution link.
+    """
+    port = int(stream.get("port") or 0)
+    loopback = port + INGEST_PORT_OFFSET if port + INGEST_PORT_OFFSET < 65536 else port - INGEST_PORT_OFFSET
+    return {
+        "id": f"ingest:{stream.get('id')}",
+        "name": f"Ingest {stream.get('name') or stream.get('id')}",
+        "inputPort": port,
+        "inputLatency": int(stream.get("latency", 120)),
+        "multicastAddr": "127.0.0.1",
+        "multicastPort": loopback,
+    }
+
+
+def _keeps_ingest(stream: dict) -> bool:
+    return bool(stream.get("keepIngest")) and str(stream.get("source") or "srt").strip().lower() == "srt"
+
+
+def prune_ingests(config: dict) -> list[str]:
+    """Stop ingest keepers ``config`` no longer asks for; return their ids.
+
+    A keeper outlives its player on purpose (the encoder stays connected
+    across player restarts); it goes away with its stream, when the option
+    is turned off or the source changes, and on a global stop.
+    """
+    wanted = {f"ingest:{s.get('id')}" for s in config.get("streams", []) if _keeps_ingest(s)}
+    stale = [route_id for route_id in list(route_manager.launched) if route_id.startswith("ingest:") and route_id not in wanted]
+    if stale:
+        route_manager.stop_many(stale)
+    return stale
+
+
+def _receiver_hwaccel(config: dict) -> str:
+    hwaccel = str((config.get("receiver") or {}).get("decode") or "cpu").strip().lower()
+    if hwaccel == "gpu":
+        hwaccel = "auto"
+    if hwaccel not in VALID_RECEIVER_DECODES:
+        hwaccel = "cpu"
+    return hwaccel
+
+
+def _route_stream(stream: dict, route: dict) -> dict:
+    """Return a copy of ``stream`` reading the UDP multicast output of ``route``."""
+    stream_copy = dict(stream)
+    stream_copy["source"] = "udp"
+    stream_copy["udpAddr"] = str(route.get("multicastAddr") or "").strip()
+    stream_copy["udpPort"] = int(route.get("multicastPort") or 0)
+    return stream_copy
+
+
+def _filter_escape(value: str) -> str:
+    """Escape ``value`` for a filter option inside a filtergraph (two levels)."""
+    option = "".join("\\" + c if c in "\\':" else c for c in value)
+    return "".join("\\" + c if c in "\\'[],;" else c for c in option)
+
+
+def _drawtext_font() -> str:
+    """``drawtext`` font option: Windows builds have no fontconfig."""
+    return ":fontfile=" + _filter_escape("C:/Windows/Fonts/arial.ttf") if sys.platform == "win32" else ""
+
+
+def mosaic_filtergraph(mosaic: dict, streams: dict[str, dict], width: int, height: int) -> tuple[list[str], str]:
+    """Input args and ``-filter_complex`` graph compositing ``mosaic`` at ``width`` x ``height``.
+
+    ``streams`` are player-ready; each is opened once, even for several tiles.
+    """
+    columns = int(mosaic["columns"])
+    rows = int(mosaic["rows"])
+    fps = int(mosaic.get("fps") or 25)
+    tile_w = max(2, width // columns) & ~1
+    tile_h = max(2, height // rows) & ~1
+    font_size = max(14, tile_h // 16)
+    font = _drawtext_font()
+
+    tiles = [(str(tile.get("streamId") or ""), str(tile.get("label") or "")) for tile in mosaic["tiles"]]
+    used = [stream_id for stream_id, _ in tiles if stream_id in streams]
+    order = list(dict.fromkeys(used))
+
+    input_args: list[str] = []
+    chains: list[str] = []
+    sources: dict[str, list[str]] = {}
+    for index, stream_id in enumerate(order):
+        args, _err = _stream_input_args(streams[stream_id])
+        input_args += ["-fflags", "nobuffer", "-flags", "low_delay", "-probesize", "131072",
+                       "-analyzeduration", "250000", *args]
+        count = used.count(stream_id)
+        if count == 1:
+            sources[stream_id] = [f"{index}:v:0"]
+        else:
+            labels = [f"s{index}_{n}" for n in range(count)]
+            chains.append(f"[{index}:v:0]split={count}" + "".join(f"[{label}]" for label in labels))
+            sources[stream_id] = labels
+
+    for cell, (stream_id, label) in enumerate(tiles):
+        stream = streams.get(stream_id)
+        if stream is not None:
+            # Each tile starts at 0 and runs at the mosaic rate, whatever its source's
+            # start time and frame rate, so xstack never waits on a late input.
+            chain = (
+                f"[{sources[stream_id].pop(0)}]setpts=PTS-STARTPTS,{_fit_filter(stream, tile_w, tile_h)},"
+                f"fps={fps},setsar=1"
+            )
+            label = label or str(stream.get("name") or stream_id)
+        else:
+            chain = f"color=c=black:s={tile_w}x{tile_h}:r={fps}"
+        chain += ",format=yuv420p"
+        if label and mosaic.get("showLabels", True):
+            chain += (
+                f",drawtext=text={_filter_escape(label)}:expansion=none{font}:fontsize={font_size}"
+                ":fontcolor=white:box=1:boxcolor=black@0.6:boxborderw=6:x=12:y=h-th-12"
+            )
+        chains.append(f"{chain}[t{cell}]")
+
+    if len(tiles) == 1:
+        grid = "[t0]null"
+    else:
+        layout = "|".join(f"{(cell % columns) * tile_w}_{(cell // columns) * tile_h}" for cell in range(len(tiles)))
+        grid = "".join(f"[t{cell}]" for cell in range(len(tiles))) + f"xstack=inputs={len(tiles)}:layout={layout}:fill=black:shortest=0"
+    if (tile_w * columns, tile_h * rows) != (width, height):
+        grid += f",pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+    chains.append(f"{grid}[out]")
+    return input_args, ";".join(chains)
+
+
+class MosaicManager(_ChildManager):
+    """Multiviewer: a grid of streams on one display, rendered by one ffmpeg."""
+
+    kind = "mosaic"
+    queued = True
+
+    def stop_mosaic(self, mosaic_id: str) -> None:
+        self._stop(mosaic_id)
+
+    def stop_mosaic_async(self, mosaic_id: str) -> Future:
+        return run_in_control(self.stop_mosaic, mosaic_id)
+
+    def start_mosaic(
+        self,
+        mosaic: dict,
+        streams: dict[str, dict],
+        display: dict,
+        *,
+        hwaccel: str = "cpu",
+        cancel: threading.Event | None = None,
+    ) -> PlayerLaunchResult:
+        mosaic_id = str(mosaic.get("id") or "")
+        key = f"mosaic:{mosaic_id}"
+        mosaic, streams, display = dict(mosaic), dict(streams), dict(display)
+        with launch_scheduler.slot(key, 0, cancel) as granted:
+            if not granted:
+                return PlayerLaunchResult(ok=False, reason="CANCELLED")
+            with self._key_locks(mosaic_id):
+                restart_watchdog.disarm(key)
+                result = self._launch(mosaic, streams, display, hwaccel)
+                if result.ok:
+                    restart_watchdog.arm(key, lambda: self._restart(mosaic, streams, display, hwaccel))
+        return result
+
+    def _restart(self, mosaic: dict, streams: dict[str, dict], display: dict, hwaccel: str) -> bool:
+        mosaic_id = str(mosaic.get("id") or "")
+        key = f"mosaic:{mosaic_id}"
+        with launch_scheduler.slot(key, 0) as granted:
+            if not granted:
+                return True
+            with self._key_locks(mosaic_id):
+                if not restart_watchdog.is_armed(key):
+                    return True
+                return self._launch(mosaic, streams, display, hwaccel).ok
+
+    def _launch(self, mosaic: dict, streams: dict[str, dict], display: dict, hwaccel: str) -> PlayerLaunchResult:
+        if not self.ffmpeg_path.exists():
+            return PlayerLaunchResult(ok=False, reason=f"ffmpeg introuvable: {self.ffmpeg_path}")
+
+        mosaic_id = str(mosaic.get("id") or "")
+        self._stop_process(mosaic_id)
+
+        for stream in streams.values():
+            _args, err = _stream_input_args(stream)
+            if err:
+                return PlayerLaunchResult(ok=False, reason=f"{stream.get('name') or stream.get('id')}: {err}")
+        if not streams:
+            return PlayerLaunchResult(ok=False, reason="Mosaïque vide")
+
+        width, height = int(display["width"]), int(display["height"])
+        input_args, graph = mosaic_filtergraph(mosaic, streams, width, height)
+        if hwaccel in {"auto", "dxva2"}:
+            # Decoded frames are downloaded for the software filters.
+            input_args = [arg for chunk in _split_inputs(input_args) for arg in (["-hwaccel", hwaccel] + chunk)]
+
+        args = [
+            str(self.ffmpeg_path),
+            "-hide_banner",
+            "-loglevel",
+            "warning",
+            "-nostats",
+            "-progress",
+            "pipe:1",
+            "-stats_period",
+            "1",
+            *input_args,
+            "-filter_complex",
+            graph,
+            "-map",
+            "[out]",
+            "-an",
+            "-pix_fmt",
+            "yuv420p",
+            "-f",
+            "sdl",
+            "-window_x",
+            str(display["x"]),
+            "-window_y",
+            str(display["y"]),
+            "-window_size",
+            f"{width}x{height}",
+            "-window_borderless",
+            "1",
+            "-window_fullscreen",
+            "1",
+            f"SRT Multiview — {mosaic.get('name') or mosaic_id}",
+        ]
+
+        stderr_lines: deque = deque(maxlen=120)
+        self.logs[mosaic_id] = stderr_lines
+        progress = ProgressTelemetry()
+        self.progress[mosaic_id] = progress
+
+        try:
+            proc = supervisor.spawn(
+                f"mosaic:{mosaic_id}",
+                args,
+                on_line=stderr_lines.append,
+                on_stdout_line=progress.feed,
+                creationflags=_win_creationflags(),
+            )
+            with self._lock:
+                self.procs[mosaic_id] = proc
+            self.last_error.pop(mosaic_id, None)
+            return PlayerLaunchResult(ok=True)
+        except Exception as e:
+            self.last_error[mosaic_id] = str(e)
+            return PlayerLaunchResult(ok=False, reason=str(e))
+
+
+def _split_inputs(input_args: list[str]) -> list[list[str]]:
+    """Split a flat input arg list into one chunk per ``-i``."""
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    for i, arg in enumerate(input_args):
+        current.append(arg)
+        if i > 0 and input_args[i - 1] == "-i":
+            chunks.append(current)
+            current = []
+    return chunks
+
 
-    receiver_hwaccel = str((config.get("receiver") or {}).get("decode") or "cpu").strip().lower()
-    if receiver_hwaccel == "gpu":
-        receiver_hwaccel = "auto"
-    if receiver_hwaccel not in VALID_RECEIVER_DECODES:
-        receiver_hwaccel = "cpu"
+mosaic_manager = MosaicManager(FFMPEG_PATH)
+
+
+SWITCHER_PORT_BASE = 30000
+SWITCHER_FPS = 25
+
+
+def switcher_renderer(stream: dict) -> dict:
+    """Player-ready copy of a switcher ``stream``: its loopback, shown as is.
+
+    The feeder (:class:`FeederManager`) already scales and rotates for the
+    display, so the renderer only stretches (a no-op at the same size).
+    """
+    return dict(
+        stream,
+        source="udp",
+        udpAddr="127.0.0.1",
+        udpPort=int(stream.get("switcherPort") or 0),
+        displayMode="stretch",
+        rotate=0,
+        keepIngest=False,
+    )
+
+
+class FeederManager(_ChildManager):
+    """Feeders of switcher streams: one ffmpeg per stream, swapped on a switch.
+
+    The renderer (:func:`switcher_renderer`) keeps its window and last frame
+    while a feeder is replaced.
+    """
+
+    kind = "feed"
+
+    def __init__(self, ffmpeg_path: Path):
+        super().__init__(ffmpeg_path)
+        self.launched: dict[str, list[str]] = {}
+        subscribe_state_changes(self._on_state)
+
+    def _on_state(self, event: StateEvent) -> None:
+        # A renderer stopped on purpose (not awaiting a watchdog restart)
+        # takes its feeder with it.
+        if event.kind != "player" or event.running or event.child_id not in self.procs:
+            return
+        if restart_watchdog.is_armed(f"player:{event.child_id}"):
+            return
+        run_in_control(self._stop_orphan, event.child_id)
+
+    def _stop_orphan(self, stream_id: str) -> None:
+        if not player_manager.status().get(stream_id):
+            self.stop_feed(stream_id)
+
+    def _forget(self, stream_id: str) -> None:
+        with self._lock:
+            self.launched.pop(stream_id, None)
+
+    def stop_feed(self, stream_id: str) -> None:
+        self._stop(stream_id)
+
+    def debug_info(self, stream_id: str) -> dict:
+        info = super().debug_info(stream_id)
+        command = self.launched.get(stream_id)
+        info["command_text"] = subprocess.list2cmdline(command) if command else None
+        return info
+
+    def is_current(self, stream_id: str, args: list[str]) -> bool:
+        """Whether a live feeder of ``stream_id`` already runs ``args``."""
+        return bool(self.status().get(stream_id)) and self.launched.get(stream_id) == args
+
+    def command(self, feed: dict, display: dict, port: int, hwaccel: str = "cpu") -> tuple[list[str], str | None]:
+        """ffmpeg args feeding ``feed`` (player-ready source) to the loopback ``port``.
+
+        Every source comes out in one fixed format (display-sized MPEG-2 at
+        :data:`SWITCHER_FPS`, MP2, MPEG-TS): the renderer never re-probes.
+        """
+        input_args, err = _stream_input_args(feed)
+        if err:
+            return [], err
+        width, height = int(display["width"]), int(display["height"])
+        source = str(feed.get("source") or "srt").strip().lower()
+        args = [str(self.ffmpeg_path), "-hide_banner", "-loglevel", "warning", "-nostats",
+                "-progress", "pipe:1", "-stats_period", "1"]
+        if hwaccel in {"auto", "dxva2"} and source != "slate":
+            args += ["-hwaccel", hwaccel]
+        args += [
+            "-fflags", "nobuffer", "-flags", "low_delay", "-probesize", "131072", "-analyzeduration", "250000",
+            # Wall-clock timestamps kept as is: the renderer sees one
+            # continuous clock across switches.
+            "-use_wallclock_as_timestamps", "1", "-copyts",
+            *input_args,
+            "-vf", f"{_fit_filter(feed, width, height)},fps={SWITCHER_FPS},setsar=1,format=yuv420p",
+            "-map", "0:v:0",
+        ]
+        if bool(feed.get("muteAudio")) or source == "slate":
+            args.append("-an")
+        else:
+            args += ["-map", "0:a:0?", "-c:a", "mp2", "-b:a", "192k", "-ar", "48000", "-ac", "2"]
+        args += [
+            "-c:v", "mpeg2video", "-q:v", "4", "-g", str(SWITCHER_FPS), "-bf", "0",
+            "-f", "mpegts", "-flush_packets", "1",
+            f"udp://127.0.0.1:{int(port)}?pkt_size=1316",
+        ]
+        return args, None
+
+    def start_feed(self, stream_id: str, args: list[str]) -> PlayerLaunchResult:
+        """Replace the feeder of ``stream_id`` with one running ``args`` (see :meth:`command`)."""
+        key = f"feed:{stream_id}"
+        args = list(args)
+        with self._key_locks(stream_id):
+            restart_watchdog.disarm(key)
+            result = self._launch(stream_id, args)
+            if result.ok:
+                restart_watchdog.arm(key, lambda: self._restart(stream_id, args))
+        return result
+
+    def _restart(self, stream_id: str, args: list[str]) -> bool:
+        with self._key_locks(stream_id):
+            if not restart_watchdog.is_armed(f"feed:{stream_id}"):
+                return True
+            return self._launch(stream_id, args).ok
+
+    def _launch(self, stream_id: str, args: list[str]) -> PlayerLaunchResult:
+        if not self.ffmpeg_path.exists():
+            return PlayerLaunchResult(ok=False, reason=f"ffmpeg introuvable: {self.ffmpeg_path}")
+
+        self._stop_process(stream_id)
+
+        stderr_lines: deque = deque(maxlen=120)
+        self.logs[stream_id] = stderr_lines
+        progress = ProgressTelemetry()
+        self.progress[stream_id] = progress
+
+        try:
+            proc = supervisor.spawn(
+                f"feed:{stream_id}",
+                args,
+                on_line=stderr_lines.append,
+                on_stdout_line=progress.feed,
+                creationflags=_win_creationflags(),
+            )
+            with self._lock:
+                self.procs[stream_id] = proc
+                self.launched[stream_id] = args
+            self.last_error.pop(stream_id, None)
+            return PlayerLaunchResult(ok=True)
+        except Exception as e:
+            self.last_error[stream_id] = str(e)
+            return PlayerLaunchResult(ok=False, reason=str(e))
+
+
+feeder_manager = FeederManager(FFMPEG_PATH)
+
+
+def switch_sources(config: dict) -> dict[str, PlayerLaunchResult]:
+    """Apply edits of running switcher streams by swapping their feeders.
+
+    Streams whose switcher mode was just turned off are relaunched as plain
+    players.
+    """
+    running = player_manager.status()
+    stream_ids = {
+        str(s["id"])
+        for s in config.get("streams", [])
+        if running.get(str(s["id"])) and (s.get("switcher") or str(s["id"]) in feeder_manager.procs)
+    }
+    if not stream_ids:
+        return {}
+    return start_all(config, stream_ids=stream_ids)
+
+
+def _route_consumer_alive(consumer: str) -> bool:
+    """Whether a route consumer (see :meth:`RouteManager.acquire`) runs or is coming back."""
+    kind, _, child_id = consumer.partition(":")
+    if launch_scheduler.position(consumer) is not None or restart_watchdog.pending(consumer):
+        return True
+    if kind == "player":
+        return bool(player_manager.status().get(child_id)) or player_manager.restart_pending(child_id)
+    if kind == "mosaic":
+        return bool(mosaic_manager.status().get(child_id))
+    if kind == "feed":
+        return bool(feeder_manager.status().get(child_id))
+    return False
+
+
+def wait_for_udp_packets(
+    addr: str,
+    port: int,
+    timeout: float,
+    *,
+    alive: Callable[[], bool] | None = None,
+) -> bool:
+    """Block until a datagram is seen on ``addr:port`` (joining it if multicast).
+
+    Returns ``False`` on timeout, socket error, or as soon as ``alive()``
+    reports the emitting process gone. The socket is bound with
+    ``SO_REUSEADDR`` so it coexists with players already reading the group.
+    """
+    deadline = time.monotonic() + max(0.0, float(timeout))
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        sock.bind(("", int(port)))
+        if ipaddress.ip_address(addr).is_multicast:
+            mreq = struct.pack("4s4s", socket.inet_aton(addr), socket.inet_aton("0.0.0.0"))
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            sock.settimeout(min(0.25, remaining))
+            try:
+                sock.recv(2048)
+                return True
+            except socket.timeout:
+                if alive is not None and not alive():
+                    return False
+    except (OSError, ValueError):
+        return False
+    finally:
+        sock.close()
+
+
+@dataclass
+class _StartupNode:
+    key: str
+    action: Callable[[dict], object]
+    after: tuple[str, ...] = ()
+
+
+class StartupOrchestrator:
+    """Run a small dependency DAG of launches with bounded concurrency.
+
+    A node's ``action`` receives the results of the nodes listed in ``after``
+    and is submitted as soon as they have all completed, so independent nodes
+    start in parallel and consumers never start before their producer.
+    """
+
+    def __init__(self, *, max_workers: int = 8, cancel: threading.Event | None = None):
+        self.max_workers = max(1, int(max_workers))
+        self.cancel = cancel
+        self._nodes: dict[str, _StartupNode] = {}
+
+    def add(self, key: str, action: Callable[[dict], object], *, after: tuple[str, ...] = ()) -> None:
+        self._nodes[key] = _StartupNode(key=key, action=action, after=tuple(after))
+
+    def _check_graph(self) -> None:
+        for node in self._nodes.values():
+            for dep in node.after:
+                if dep not in self._nodes:
+                    raise ValueError(f"Dépendance inconnue: {node.key} -> {dep}")
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def _visit(key: str) -> None:
+            if key in visited:
+                return
+            if key in visiting:
+                raise ValueError(f"Cycle de dépendances: {key}")
+            visiting.add(key)
+            for dep in self._nodes[key].after:
+                _visit(dep)
+            visiting.discard(key)
+            visited.add(key)
+
+        for key in self._nodes:
+            _visit(key)
+
+    def run(self) -> dict[str, object]:
+        self._check_graph()
+        nodes = dict(self._nodes)
+        if not nodes:
+            return {}
+
+        waiting = {key: set(node.after) for key, node in nodes.items()}
+        dependents: dict[str, list[str]] = {key: [] for key in nodes}
+        for key, node in nodes.items():
+            for dep in node.after:
+                dependents[dep].append(key)
+
+        results: dict[str, object] = {}
+        lock = threading.Lock()
+        all_done = threading.Event()
+        remaining = [len(nodes)]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(nodes)),
+            thread_name_prefix="srt-multiview-start",
+        ) as pool:
+
+            def _execute(key: str) -> None:
+                node = nodes[key]
+                with lock:
+                    deps = {dep: results[dep] for dep in node.after}
+                if self.cancel is not None and self.cancel.is_set():
+                    result: object = PlayerLaunchResult(ok=False, reason="CANCELLED")
+                else:
+                    try:
+                        result = node.action(deps)
+                    except Exception as e:
+                        result = PlayerLaunchResult(ok=False, reason=str(e))
+                ready: list[str] = []
+                with lock:
+                    results[key] = result
+                    for child in dependents[key]:
+                        waiting[child].discard(key)
+                        if not waiting[child]:
+                            ready.append(child)
+                    remaining[0] -= 1
+                    if remaining[0] == 0:
+                        all_done.set()
+                for child in ready:
+                    pool.submit(_execute, child)
+
+            for key in [k for k, deps in waiting.items() if not deps]:
+                pool.submit(_execute, key)
+            all_done.wait()
+
+        return results
+
+
+def _start_route_and_wait(
+    route: dict,
+    timeout: float,
+    cancel: threading.Event | None = None,
+) -> RouteLaunchResult:
+    route_id = str(route.get("id") or "")
+    result = route_manager.start_route(route, pin=False)
+    if not result.ok:
+        return result
+    wait_for_udp_packets(
+        str(route.get("multicastAddr") or "").strip(),
+        int(route.get("multicastPort") or 0),
+        timeout,
+        alive=lambda: bool(route_manager.status().get(route_id, False)) and not (cancel and cancel.is_set()),
+    )
+    if not route_manager.status().get(route_id, False):
+        return RouteLaunchResult(ok=False, reason=route_manager.last_error.get(route_id) or "Route arrêtée")
+    return RouteLaunchResult(ok=True)
+
+
+def start_all(
+    config: dict,
+    *,
+    start_routes: bool = True,
+    route_ready_timeout: float = 10.0,
+    max_workers: int = 8,
+    cancel: threading.Event | None = None,
+    stream_ids: set[str] | None = None,
+    mosaic_ids: set[str] | None = None,
+    wall_ids: set[str] | None = None,
+    replace: bool = False,
+) -> dict[str, PlayerLaunchResult]:
+    """Start the mapped players, mosaics and walls, bringing up the routes they read first.
+
+    Returns each player's result by id. ``config`` is used as given: pass a
+    normalized snapshot no other thread edits (``config_store.snapshot()``).
+    """
+    receiver_hwaccel = _receiver_hwaccel(config)
+    configure_launch_scheduler(config)
 
     results: dict[str, PlayerLaunchResult] = {}
     displays = get_displays(exclude_primary=False, name_overrides=config.get("displayNames") or {})
-    display_map = {str(d["id"]): d for d in displays}
+    display_map = index_by_id(displays)
 
-    routes = {str(r.get("id")): r for r in (config.get("routes") or []) if isinstance(r, dict)}
+    routes = index_by_id(config["routes"])
     route_status = route_manager.status()
     running_players = player_manager.status()
 
-    for stream in config["streams"]:
+    orchestrator = StartupOrchestrator(max_workers=max_workers, cancel=cancel)
+    used_routes: set[str] = set()
+    share = bool(config["receiver"].get("sharedDecode"))
+    replace_timeout = float(config["receiver"].get("replaceTimeout") or 10.0)
+    # Consumers of one route / OMT source, grouped once all are known.
+    candidates: dict[tuple[str, str], list[tuple[dict, dict, tuple[str, ...]]]] = {}
+    shared_nodes: dict[str, tuple[str, ...]] = {}
+
+    def _start_player(stream: dict, display: dict, hwaccel: str = receiver_hwaccel) -> Callable[[dict], PlayerLaunchResult]:
+        replacing = replace and bool(running_players.get(str(stream.get("id"))))
+
+        def _action(deps: dict) -> PlayerLaunchResult:
+            for dep in deps.values():
+                if not getattr(dep, "ok", False):
+                    if not replacing:
+                        player_manager.stop_player(str(stream.get("id")))
+                    return PlayerLaunchResult(ok=False, reason=getattr(dep, "reason", None) or "Route arrêtée")
+            if replacing:
+                # Make-before-break with the current settings (receiver.replaceTimeout).
+                return player_manager.replace_player(
+                    stream, display, hwaccel=hwaccel, timeout=replace_timeout, cancel=cancel
+                )
+            return player_manager.start_player(stream, display, hwaccel=hwaccel, cancel=cancel)
+
+        return _action
+
+    def _start_feed(stream_id: str, args: list[str]) -> Callable[[dict], PlayerLaunchResult]:
+        def _action(deps: dict) -> PlayerLaunchResult:
+            for dep in deps.values():
+                if not getattr(dep, "ok", False):
+                    return PlayerLaunchResult(ok=False, reason=getattr(dep, "reason", None) or "Route arrêtée")
+            return feeder_manager.start_feed(stream_id, args)
+
+        return _action
+
+    def _start_shared(members: list[tuple[dict, dict]]) -> Callable[[dict], PlayerLaunchResult]:
+        def _action(deps: dict) -> PlayerLaunchResult:
+            for dep in deps.values():
+                if not getattr(dep, "ok", False):
+                    return PlayerLaunchResult(ok=False, reason=getattr(dep, "reason", None) or "Route arrêtée")
+            return player_manager.start_shared(members, hwaccel=receiver_hwaccel, cancel=cancel)
+
+        return _action
+
+    def _start_mosaic(mosaic: dict, streams: dict, display: dict) -> Callable[[dict], PlayerLaunchResult]:
+        def _action(deps: dict) -> PlayerLaunchResult:
+            for dep in deps.values():
+                if not getattr(dep, "ok", False):
+                    return PlayerLaunchResult(ok=False, reason=getattr(dep, "reason", None) or "Route arrêtée")
+            return mosaic_manager.start_mosaic(mosaic, streams, display, hwaccel=receiver_hwaccel, cancel=cancel)
+
+        return _action
+
+    def _start_wall(wall: dict, stream: dict, wall_displays: list[dict]) -> Callable[[dict], PlayerLaunchResult]:
+        def _action(deps: dict) -> PlayerLaunchResult:
+            for dep in deps.values():
+                if not getattr(dep, "ok", False):
+                    return PlayerLaunchResult(ok=False, reason=getattr(dep, "reason", None) or "Route arrêtée")
+            return player_manager.start_wall(wall, stream, wall_displays, hwaccel=receiver_hwaccel, cancel=cancel)
+
+        return _action
+
+    def _ingest_source(stream: dict) -> tuple[dict, tuple[str, ...]]:
+        """Point an SRT stream at its ingest keeper, (re)starting the keeper if needed."""
+        ingest = ingest_route(stream)
+        ingest_id = ingest["id"]
+        if route_status.get(ingest_id, False) and route_manager.launched.get(ingest_id) == ingest:
+            return _route_stream(stream, ingest), ()
+        # Not waiting for packets: the keeper only relays once the encoder connects.
+        orchestrator.add(f"route:{ingest_id}", lambda _deps, r=ingest: route_manager.start_route(r))
+        return _route_stream(stream, ingest), (f"route:{ingest_id}",)
+
+    def _use_route(route_id: str, consumer: str) -> None:
+        route_manager.acquire(route_id, consumer)
+        used_routes.add(route_id)
+
+    def _resolve_route(stream: dict, consumer: str) -> tuple[dict, tuple[str, ...], str | None]:
+        """Point a route consumer at the multicast output, queuing the route if stopped.
+
+        The consumer waits for the route's first packet (or ``route_ready_timeout``);
+        ``keepIngest`` SRT streams read their ingest keeper.
+        """
+        if _keeps_ingest(stream):
+            stream, after = _ingest_source(stream)
+            return stream, after, None
+        if str(stream.get("source") or "srt").strip().lower() != "route":
+            return stream, (), None
+        route_id = str(stream.get("sourceRouteId") or "")
+        route = routes.get(route_id)
+        if not route:
+            return stream, (), f"{stream.get('name')}: Route introuvable"
+        _use_route(route_id, consumer)
+        if route_status.get(route_id, False):
+            return _route_stream(stream, route), (), None
+        if not start_routes:
+            return stream, (), f"Route arrêtée: {route.get('name', route_id)}"
+        orchestrator.add(
+            f"route:{route_id}",
+            lambda _deps, r=route: _start_route_and_wait(r, route_ready_timeout, cancel),
+        )
+        return _route_stream(stream, route), (f"route:{route_id}",), None
+
+    # Ready nodes are submitted in insertion order: program monitors first.
+    for stream in sorted(config["streams"], key=lambda s: -int(s.get("priority") or 0)):
         stream_id = str(stream["id"])
+        if stream_ids is not None and stream_id not in stream_ids:
+            continue
         display_id = config.get("mapping", {}).get(stream_id)
 
         if not display_id or str(display_id) not in display_map:
             player_manager.stop_player(stream_id)
+            if display_id:
+                # Mapped to an unplugged display: start it when it comes back.
+                player_manager.park([stream_id])
             results[stream_id] = PlayerLaunchResult(ok=False, reason="NO_DISPLAY")
             continue
 
         display = display_map[str(display_id)]
 
+        if stream.get("switcher"):
+            feed, after, error = _resolve_route(stream, f"feed:{stream_id}")
+            feed_args: list[str] = []
+            if not error:
+                feed_args, error = feeder_manager.command(
+                    feed, display, int(stream.get("switcherPort") or 0), receiver_hwaccel
+                )
+            if error:
+                results[stream_id] = PlayerLaunchResult(ok=False, reason=error)
+                continue
+            renderer = switcher_renderer(stream)
+            if running_players.get(stream_id) and player_manager.reads(stream_id, renderer):
+                # Renderer up: a source change only swaps the feeder.
+                results[stream_id] = PlayerLaunchResult(ok=True)
+                if not feeder_manager.is_current(stream_id, feed_args):
+                    orchestrator.add(f"feed:{stream_id}", _start_feed(stream_id, feed_args), after=after)
+                continue
+            # The renderer decodes the feeder's MPEG-2 itself, whatever the
+            # receiver decode mode; its feeder starts once it listens.
+            orchestrator.add(f"player:{stream_id}", _start_player(renderer, display, "cpu"))
+            orchestrator.add(
+                f"feed:{stream_id}", _start_feed(stream_id, feed_args), after=(f"player:{stream_id}", *after)
+            )
+            continue
+
+        if stream_id in feeder_manager.procs:
+            # Switcher mode turned off: a plain player replaces the renderer.
+            feeder_manager.stop_feed(stream_id)
+            player_manager.stop_player(stream_id)
+            running_players.pop(stream_id, None)
+
         # Skip restart if the player is already healthy.
-        if running_players.get(stream_id):
+        if running_players.get(stream_id) and not replace:
             results[stream_id] = PlayerLaunchResult(ok=True)
             continue
+        if running_players.get(stream_id) and player_manager.group_members(stream_id):
+            # One decoder serves the whole group: it cannot be swapped for one member.
+            results[stream_id] = PlayerLaunchResult(ok=False, reason="Décodage partagé : relancer le groupe")
+            continue
 
         source = str(stream.get("source") or "srt").strip().lower()
-        if source == "route":
-            route_id = str(stream.get("sourceRouteId") or "")
-            route = routes.get(route_id)
-            if not route_id or not route:
-                player_manager.stop_player(stream_id)
-                results[stream_id] = PlayerLaunchResult(ok=False, reason="Route introuvable")
-                continue
-            if not route_status.get(route_id, False):
+        after: tuple[str, ...] = ()
+        if _keeps_ingest(stream):
+            stream, after = _ingest_source(stream)
+            source = "udp"
+        # A replacement keeps the player as it is laid out (alone).
+        share_it = share and not running_players.get(stream_id)
+        if source == "omt" and share_it:
+            candidates.setdefault(("omt", str(stream.get("omtSource") or "")), []).append((stream, display, ()))
+            continue
+        if source != "route":
+            orchestrator.add(f"player:{stream_id}", _start_player(stream, display), after=after)
+            continue
+
+        route_id = str(stream.get("sourceRouteId") or "")
+        route = routes.get(route_id)
+        if not route_id or not route:
+            player_manager.stop_player(stream_id)
+            results[stream_id] = PlayerLaunchResult(ok=False, reason="Route introuvable")
+            continue
+
+        _use_route(route_id, f"player:{stream_id}")
+        if not route_status.get(route_id, False):
+            if not start_routes:
                 player_manager.stop_player(stream_id)
                 results[stream_id] = PlayerLaunchResult(ok=False, reason=f"Route arrêtée: {route.get('name', route_id)}")
                 continue
+            route_key = f"route:{route_id}"
+            orchestrator.add(
+                route_key,
+                lambda _deps, r=route: _start_route_and_wait(r, route_ready_timeout, cancel),
+            )
+            after = (route_key,)
 
-            stream_copy = dict(stream)
-            stream_copy["source"] = "udp"
-            stream_copy["udpAddr"] = str(route.get("multicastAddr") or "").strip()
-            stream_copy["udpPort"] = int(route.get("multicastPort") or 0)
-            results[stream_id] = player_manager.start_player(stream_copy, display, hwaccel=receiver_hwaccel)
-        else:
-            results[stream_id] = player_manager.start_player(stream, display, hwaccel=receiver_hwaccel)
+        if share_it:
+            candidates.setdefault(("route", route_id), []).append((_route_stream(stream, route), display, after))
+            continue
+        orchestrator.add(f"player:{stream_id}", _start_player(_route_stream(stream, route), display), after=after)
+
+    for group in candidates.values():
+        group_displays = [display for _, display, _ in group]
+        if len(group) > 1 and span_rect(group_displays, displays):
+            member_ids = tuple(str(stream["id"]) for stream, _, _ in group)
+            key = "player:shared:" + "+".join(sorted(member_ids))
+            after = tuple(dict.fromkeys(dep for _, _, deps in group for dep in deps))
+            orchestrator.add(key, _start_shared([(stream, display) for stream, display, _ in group]), after=after)
+            shared_nodes[key] = member_ids
+            continue
+        for stream, display, after in group:
+            orchestrator.add(f"player:{stream['id']}", _start_player(stream, display), after=after)
+
+    # A run restricted to streams starts no mosaic or wall. Mosaic failures
+    # land in mosaic_manager.last_error, walls under their wall_player_id.
+    if mosaic_ids is None and stream_ids is not None:
+        mosaic_ids = set()
+    streams_by_id = index_by_id(config["streams"])
+    running_mosaics = mosaic_manager.status()
+    for mosaic in config["mosaics"]:
+        mosaic_id = str(mosaic["id"])
+        if (mosaic_ids is not None and mosaic_id not in mosaic_ids) or running_mosaics.get(mosaic_id):
+            continue
+        display = display_map.get(str(mosaic.get("displayId") or ""))
+        if display is None:
+            mosaic_manager.last_error[mosaic_id] = "Écran absent"
+            continue
+        tile_streams: dict[str, dict] = {}
+        deps: list[str] = []
+        error = None
+        for tile in mosaic["tiles"]:
+            stream = streams_by_id.get(str(tile.get("streamId") or ""))
+            if stream is None:
+                continue
+            stream, after, error = _resolve_route(stream, f"mosaic:{mosaic_id}")
+            if not error and str(stream.get("source") or "srt").strip().lower() == "srt":
+                # ffmpeg would block on the listener and take the player's port:
+                # the tile must read the stream's ingest relay.
+                error = f"{stream.get('name')}: SRT en écoute, activer le relais"
+            if error:
+                break
+            deps.extend(after)
+            tile_streams[str(stream["id"])] = stream
+        if error:
+            mosaic_manager.last_error[mosaic_id] = error
+            continue
+        orchestrator.add(
+            f"mosaic:{mosaic_id}", _start_mosaic(mosaic, tile_streams, display), after=tuple(dict.fromkeys(deps))
+        )
+
+    if wall_ids is None and stream_ids is not None:
+        wall_ids = set()
+    for wall in config["walls"]:
+        wall_id = str(wall["id"])
+        player_id = wall_player_id(wall_id)
+        if (wall_ids is not None and wall_id not in wall_ids) or running_players.get(player_id):
+            continue
+        wall_displays = [display_map.get(display_id) for display_id in wall["displayIds"]]
+        if not wall_displays or None in wall_displays:
+            player_manager.stop_player(player_id)
+            if wall_displays:
+                # A display of the wall is unplugged: start it when it comes back.
+                player_manager.park([player_id])
+            results[player_id] = PlayerLaunchResult(ok=False, reason="NO_DISPLAY")
+            continue
+        if span_rect(wall_displays, displays) is None:
+            results[player_id] = PlayerLaunchResult(ok=False, reason="Écrans non contigus")
+            continue
+        stream = streams_by_id.get(str(wall.get("streamId") or ""))
+        if stream is None:
+            results[player_id] = PlayerLaunchResult(ok=False, reason="Flux introuvable")
+            continue
+        stream, after, error = _resolve_route(stream, f"player:{player_id}")
+        if error:
+            results[player_id] = PlayerLaunchResult(ok=False, reason=error)
+            continue
+        orchestrator.add(f"player:{player_id}", _start_wall(wall, stream, wall_displays), after=after)
+
+    feed_failures: dict[str, PlayerLaunchResult] = {}
+    for key, result in orchestrator.run().items():
+        kind, _, child_id = key.partition(":")
+        if key in shared_nodes:
+            results.update(dict.fromkeys(shared_nodes[key], result))
+        elif kind == "player":
+            results[child_id] = result
+        elif kind == "feed" and not getattr(result, "ok", False):
+            feed_failures[child_id] = result
+        elif kind == "mosaic" and not getattr(result, "ok", False):
+            mosaic_manager.last_error[child_id] = getattr(result, "reason", None) or "Erreur inconnue"
+    # A renderer without its feeder shows nothing: report the feeder's error.
+    for stream_id, result in feed_failures.items():
+        if getattr(results.get(stream_id), "ok", False):
+            results[stream_id] = result
+    # Routes started for consumers that then failed must not run forever.
+    for route_id in used_routes:
+        route_manager.schedule_idle_check(route_id)
 
     return results
 
 
+def stop_all_children(timeout: float = STOP_TIMEOUT) -> None:
+    """Stop every player, route and the sender as one batch (see :func:`terminate_processes`)."""
+    with ExitStack() as stack:
+        players = player_manager._begin_stop(stack)
+        # Disarmed players cannot be restarted when their route goes away, so
+        # routes no longer need to outlive them.
+        others = (
+            mosaic_manager._begin_stop(stack)
+            + feeder_manager._begin_stop(stack)
+            + sender_manager._begin_stop(stack)
+            + route_manager._begin_stop(stack)
+        )
+        terminate_processes([proc for _, proc in players + others], timeout)
+        player_manager._end_stop(players)
+
+
+def stop_all_children_async(after: Future | None = None) -> Future:
+    """:func:`stop_all_children` off the caller's thread, once ``after`` (e.g. a start) is done."""
+
+    def run() -> None:
+        if after is not None:
+            try:
+                after.result()
+            except Exception:
+                pass
+        stop_all_children()
+
+    return run_in_control(run)
+
+
+def apply_mapping(config: dict) -> dict[str, PlayerLaunchResult]:
+    """Start mapped players whose inputs are available, without starting routes."""
+    return start_all(config, start_routes=False)
+
+
+class DisplayReconciler:
+    """Follow display hotplug for the mapped players and video walls.
+
+    Bursts of ``"displays"`` events collapse into one :meth:`reconcile` pass
+    on the control executor.
+    """
+
+    def __init__(self):
+        self._config_getter: Callable[[], dict] | None = None
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._running = False
+        self.last_actions: dict[str, list[str]] = {}
+
+    def attach(self, config_getter: Callable[[], dict]) -> None:
+        self._config_getter = config_getter
+        subscribe_state_changes(self._on_state)
+
+    def detach(self) -> None:
+        unsubscribe_state_changes(self._on_state)
+        self._config_getter = None
+
+    def _on_state(self, event: StateEvent) -> None:
+        if event.kind != "displays" or self._config_getter is None:
+            return
+        with self._lock:
+            self._dirty = True
+            if self._running:
+                return
+            self._running = True
+        run_in_control(self._drain)
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if not self._dirty or self._config_getter is None:
+                    self._running = False
+                    return
+                self._dirty = False
+                config_getter = self._config_getter
+            try:
+                self.reconcile(config_getter())
+            except Exception:
+                pass
+
+    def reconcile(self, config: dict) -> dict[str, list[str]]:
+        """Park players whose display vanished, restart parked ones, relaunch moved ones.
+
+        Streams the operator stopped are left alone.
+        """
+        displays = index_by_id(get_displays(exclude_primary=False, name_overrides=config.get("displayNames") or {}))
+        mapping = config.get("mapping") or {}
+        running = player_manager.status()
+        gone: list[str] = []
+        back: list[str] = []
+        moved: list[str] = []
+        for stream in config["streams"]:
+            stream_id = str(stream["id"])
+            display_id = str(mapping.get(stream_id) or "")
+            if not display_id:
+                continue
+            display = displays.get(display_id)
+            active = running.get(stream_id) or restart_watchdog.is_armed(f"player:{player_manager.owner(stream_id)}")
+            if display is None:
+                if active:
+                    gone.append(stream_id)
+            elif stream_id in player_manager.parked:
+                back.append(stream_id)
+            elif active and player_manager.layout_changed(stream_id, display):
+                moved.append(stream_id)
+        # A shared decoder spans all its members' displays: stop_many stops the
+        # whole group, so relaunch the peers too.
+        for stream_id in gone + moved:
+            for peer in player_manager.group_members(stream_id):
+                if peer not in gone and peer not in moved:
+                    moved.append(peer)
+
+        walls: dict[str, str] = {}
+        for wall in config["walls"]:
+            player_id = wall_player_id(str(wall["id"]))
+            wall_displays = [displays.get(display_id) for display_id in wall["displayIds"]]
+            if not wall_displays:
+                continue
+            walls[player_id] = str(wall["id"])
+            active = running.get(player_id) or restart_watchdog.is_armed(f"player:{player_id}")
+            if None in wall_displays:
+                if active:
+                    gone.append(player_id)
+            elif player_id in player_manager.parked:
+                back.append(player_id)
+            elif active:
+                rect = span_rect(wall_displays)
+                if rect is None or player_manager.layout_changed(
+                    player_id, {"x": rect[0], "y": rect[1], "width": rect[2], "height": rect[3]}
+                ):
+                    moved.append(player_id)
+
+        if gone or moved:
+            player_manager.stop_many(gone + moved)
+            player_manager.park(gone)
+        if back or moved:
+            restart = set(back) | set(moved)
+            start_all(
+                config,
+                stream_ids=restart - walls.keys(),
+                wall_ids={walls[player_id] for player_id in restart & walls.keys()},
+            )
+        self.last_actions = {"stopped": gone, "started": back, "relaunched": moved}
+        return self.last_actions
+
+
+display_reconciler = DisplayReconciler()
+
+
 _OMT_LINE_RE = re.compile(r"^\[libomt[^\]]*\]\s+(.*)$")
 
 
@@ -0,0 +1,385 @@
+"""OMT source directory: a small mDNS / DNS-SD browser (RFC 6762 / 6763).
+
+OMT senders advertise ``_omt._tcp.local.``; the instance name is the source
+string ffplay expects (``HOST (Source Name)``). The directory runs one
+background thread that keeps querying with backoff, caches the answers for
+their TTL and tells subscribers about additions and removals, so a picker
+can show the current list instantly. ``core.list_omt_sources`` (ffmpeg
+``-find_sources``) remains the fallback when multicast is unavailable.
+"""
+
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+OMT_SERVICE = "_omt._tcp.local."
+MDNS_GROUP = "224.0.0.251"
+MDNS_PORT = 5353
+
+TYPE_A = 1
+TYPE_PTR = 12
+TYPE_TXT = 16
+TYPE_AAAA = 28
+TYPE_SRV = 33
+CLASS_IN = 1
+CLASS_UNICAST_RESPONSE = 0x8000
+CLASS_CACHE_FLUSH = 0x8000
+
+QUERY_INTERVAL_MAX = 60.0
+# Re-query once a cached answer has lived 80% of its TTL, then every 5%
+# until it is renewed or expires (RFC 6762 §5.2).
+REFRESH_AT = 0.8
+REFRESH_STEP = 0.05
+
+
+@dataclass
+class DnsRecord:
+    name: str
+    rtype: int
+    ttl: int
+    data: object
+
+
+@dataclass
+class OmtSource:
+    name: str
+    instance: str
+    expires_at: float
+    ttl: int = 0
+    refresh_at: float = 0.0
+    host: str = ""
+    port: int = 0
+    addresses: list[str] = field(default_factory=list)
+    properties: dict[str, str] = field(default_factory=dict)
+
+
+def _encode_name(name: str) -> bytes:
+    out = bytearray()
+    for label in name.rstrip(".").split("."):
+        raw = label.encode("utf-8")
+        out.append(len(raw))
+        out += raw
+    out.append(0)
+    return bytes(out)
+
+
+def build_query(name: str, rtype: int = TYPE_PTR, *, unicast_response: bool = False) -> bytes:
+    qclass = CLASS_IN | (CLASS_UNICAST_RESPONSE if unicast_response else 0)
+    return struct.pack("!6H", 0, 0, 1, 0, 0, 0) + _encode_name(name) + struct.pack("!2H", rtype, qclass)
+
+
+def _read_name(data: bytes, offset: int) -> tuple[str, int]:
+    labels: list[str] = []
+    end = None
+    jumps = 0
+    while True:
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            jumps += 1
+            if jumps > 32:
+                raise ValueError("compression loop")
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(data[offset:offset + length].decode("utf-8", errors="replace"))
+        offset += length
+    return ".".join(labels) + ".", end if end is not None else offset
+
+
+def _read_txt(raw: bytes) -> dict[str, str]:
+    props: dict[str, str] = {}
+    i = 0
+    while i < len(raw):
+        length = raw[i]
+        entry = raw[i + 1:i + 1 + length].decode("utf-8", errors="replace")
+        i += 1 + length
+        if entry:
+            key, _, value = entry.partition("=")
+            props[key] = value
+    return props
+
+
+def parse_message(data: bytes) -> list[DnsRecord]:
+    """Answer, authority and additional records of a DNS response."""
+    if len(data) < 12:
+        raise ValueError("short packet")
+    _ident, flags, qdcount, ancount, nscount, arcount = struct.unpack_from("!6H", data)
+    if not flags & 0x8000:
+        return []
+    offset = 12
+    for _ in range(qdcount):
+        _name, offset = _read_name(data, offset)
+        offset += 4
+    records: list[DnsRecord] = []
+    for _ in range(ancount + nscount + arcount):
+        name, offset = _read_name(data, offset)
+        rtype, rclass, ttl, rdlength = struct.unpack_from("!2HIH", data, offset)
+        offset += 10
+        rdata = data[offset:offset + rdlength]
+        if rclass & ~CLASS_CACHE_FLUSH != CLASS_IN:
+            offset += rdlength
+            continue
+        if rtype == TYPE_PTR:
+            value: object = _read_name(data, offset)[0]
+        elif rtype == TYPE_SRV:
+            _priority, _weight, port = struct.unpack_from("!3H", data, offset)
+            value = (_read_name(data, offset + 6)[0], port)
+        elif rtype == TYPE_TXT:
+            value = _read_txt(rdata)
+        elif rtype == TYPE_A and rdlength == 4:
+            value = socket.inet_ntop(socket.AF_INET, rdata)
+        elif rtype == TYPE_AAAA and rdlength == 16:
+            value = socket.inet_ntop(socket.AF_INET6, rdata)
+        else:
+            value = rdata
+        records.append(DnsRecord(name=name.lower(), rtype=rtype, ttl=ttl, data=value))
+        offset += rdlength
+    return records
+
+
+def _instance_label(instance: str, service: str) -> str:
+    suffix = "." + service
+    label = instance[: -len(suffix)] if instance.lower().endswith(suffix.lower()) else instance
+    return label.replace("\\.", ".").replace("\\\\", "\\")
+
+
+class SourceDirectory:
+    """Live, TTL-evicted table of the sources advertising ``service``.
+
+    ``start`` is idempotent. Subscribers get ``(kind, source)`` with ``kind``
+    ``"add"`` or ``"remove"`` on the browser thread. ``group``, ``port`` and
+    ``interface`` exist so tests can run against a responder on loopback.
+    """
+
+    def __init__(
+        self,
+        service: str = OMT_SERVICE,
+        *,
+        group: str = MDNS_GROUP,
+        port: int = MDNS_PORT,
+        interface: str = "0.0.0.0",
+    ):
+        self.service = service if service.endswith(".") else service + "."
+        self.group = group
+        self.port = port
+        self.interface = interface
+        self.last_error: str | None = None
+        self.queries = 0
+        self._sources: dict[str, OmtSource] = {}
+        self._hosts: dict[str, tuple[list[str], float]] = {}
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[str, OmtSource], None]] = []
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = threading.Event()
+
+    # Public API
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._started.clear()
+            self._thread = threading.Thread(target=self._run, name="srt-multiview-omt-mdns", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=2.0)
+        with self._lock:
+            self._thread = None
+            self._sources.clear()
+
+    def wait_started(self, timeout: float = 1.0) -> bool:
+        return self._started.wait(timeout)
+
+    @property
+    def running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def rescan(self) -> None:
+        """Query again now and restart the backoff."""
+        self._wake.set()
+
+    def sources(self) -> list[str]:
+        with self._lock:
+            return sorted(self._sources, key=str.casefold)
+
+    def entries(self) -> list[OmtSource]:
+        with self._lock:
+            return [self._sources[name] for name in sorted(self._sources, key=str.casefold)]
+
+    def subscribe(self, callback: Callable[[str, OmtSource], None]) -> None:
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, OmtSource], None]) -> None:
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    # Browser thread
+
+    def _open_socket(self) -> tuple[socket.socket, bool]:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        # Another responder may own the port exclusively: fall back to an
+        # ephemeral port, responders then answer us directly (unicast).
+        shared = True
+        try:
+            sock.bind(("", self.port))
+        except OSError:
+            sock.bind(("", 0))
+            shared = False
+        interface = socket.inet_aton(self.interface)
+        if shared:
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, socket.inet_aton(self.group) + interface)
+        if self.interface != "0.0.0.0":
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, interface)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 255)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+        return sock, shared
+
+    def _run(self) -> None:
+        try:
+            sock, shared = self._open_socket()
+        except OSError as e:
+            self.last_error = f"mDNS indisponible: {e}"
+            self._started.set()
+            return
+        self.last_error = None
+        self._started.set()
+        query = build_query(self.service, unicast_response=not shared)
+        # Browse queries back off on their own schedule; TTL refreshes only
+        # ride on it when both fall due together.
+        interval = 1.0
+        next_browse = 0.0
+        try:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                if self._wake.is_set():
+                    self._wake.clear()
+                    interval, next_browse = 1.0, now
+                browse = now >= next_browse
+                if browse or now >= self._refresh_due(next_browse):
+                    try:
+                        sock.sendto(query, (self.group, self.port))
+                        self.queries += 1
+                    except OSError as e:
+                        self.last_error = f"mDNS: {e}"
+                    self._schedule_refresh(now)
+                if browse:
+                    next_browse = now + interval
+                    interval = min(interval * 2, QUERY_INTERVAL_MAX)
+                self._expire(now)
+                next_query = self._refresh_due(next_browse)
+                sock.settimeout(max(0.05, min(0.5, next_query - time.monotonic())))
+                try:
+                    data, _addr = sock.recvfrom(9000)
+                except socket.timeout:
+                    continue
+                except OSError:
+                    if self._stop.is_set():
+                        break
+                    continue
+                try:
+                    records = parse_message(data)
+                except (ValueError, IndexError, struct.error):
+                    continue
+                self._ingest(records, time.monotonic())
+        finally:
+            sock.close()
+
+    def _refresh_due(self, default: float) -> float:
+        with self._lock:
+            return min((source.refresh_at for source in self._sources.values()), default=default)
+
+    def _schedule_refresh(self, now: float) -> None:
+        with self._lock:
+            for source in self._sources.values():
+                if source.refresh_at <= now:
+                    source.refresh_at = now + max(1.0, REFRESH_STEP * source.ttl)
+
+    def _ingest(self, records: list[DnsRecord], now: float) -> None:
+        service = self.service.lower()
+        events: list[tuple[str, OmtSource]] = []
+        with self._lock:
+            for record in records:
+                if record.rtype in {TYPE_A, TYPE_AAAA}:
+                    addresses = self._hosts.get(record.name, ([], 0.0))[0]
+                    if record.data not in addresses:
+                        addresses = addresses + [str(record.data)]
+                    self._hosts[record.name] = (addresses, now + record.ttl)
+            for record in records:
+                if record.rtype != TYPE_PTR or record.name != service:
+                    continue
+                instance = str(record.data)
+                name = _instance_label(instance, self.service)
+                if record.ttl == 0:
+                    # Goodbye packet (RFC 6762 §10.1).
+                    source = self._sources.pop(name, None)
+                    if source is not None:
+                        events.append(("remove", source))
+                    continue
+                source = self._sources.get(name)
+                if source is None:
+                    source = self._sources[name] = OmtSource(name=name, instance=instance, expires_at=0.0)
+                    events.append(("add", source))
+                source.expires_at = now + record.ttl
+                source.refresh_at = now + REFRESH_AT * record.ttl
+                source.ttl = record.ttl
+            for record in records:
+                if record.rtype not in {TYPE_SRV, TYPE_TXT}:
+                    continue
+                source = next((s for s in self._sources.values() if s.instance.lower() == record.name), None)
+                if source is None:
+                    continue
+                if record.rtype == TYPE_SRV:
+                    source.host, source.port = record.data  # type: ignore[misc]
+                else:
+                    source.properties = dict(record.data)  # type: ignore[arg-type]
+            for source in self._sources.values():
+                if source.host:
+                    source.addresses = list(self._hosts.get(source.host.lower(), ([], 0.0))[0])
+            listeners = list(self._listeners) if events else []
+        self._emit(listeners, events)
+
+    def _expire(self, now: float) -> None:
+        with self._lock:
+            expired = [name for name, source in self._sources.items() if source.expires_at <= now]
+            events = [("remove", self._sources.pop(name)) for name in expired]
+            for host in [host for host, (_a, expires) in self._hosts.items() if expires <= now]:
+                del self._hosts[host]
+            listeners = list(self._listeners) if events else []
+        self._emit(listeners, events)
+
+    @staticmethod
+    def _emit(listeners, events) -> None:
+        for kind, source in events:
+            for callback in listeners:
+                try:
+                    callback(kind, source)
+                except Exception:
+                    pass
+
+
+omt_directory = SourceDirectory()
@@ -0,0 +1,339 @@
+"""Headless engine: run the players, routes and sender without Qt.
+
+The engine exposes a small JSON control API on the loopback interface so the
+``srt-multiview start/stop/status`` commands can drive a running ``run``.
+"""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote
+from urllib.request import Request, urlopen
+
+from . import core
+from .metrics import MetricsServer
+
+
+class EngineNotRunning(RuntimeError):
+    pass
+
+
+def _find_stream_id(model: core.ConfigModel | None, ref: str) -> str | None:
+    if model is None:
+        return None
+    ref = str(ref or "").strip()
+    if ref in model.streams_by_id:
+        return ref
+    folded = ref.casefold()
+    return next((stream.id for stream in model.streams if stream.name.casefold() == folded), None)
+
+
+def _result_dict(result) -> dict:
+    return {"ok": bool(getattr(result, "ok", False)), "reason": getattr(result, "reason", None)}
+
+
+class HeadlessEngine:
+    def __init__(self, config: dict | None = None, *, start_sender: bool = True):
+        self.config = core.load_config() if config is None else core.config_store.commit(config)
+        self.start_sender = start_sender
+        self.started_at: float | None = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._server_thread: threading.Thread | None = None
+        self.metrics_server = MetricsServer(lambda: self.config)
+
+    # Children
+
+    def _displays(self, *, exclude_primary: bool) -> list[dict]:
+        return core.get_displays(
+            exclude_primary=exclude_primary,
+            name_overrides=self.config.get("displayNames", {}),
+        )
+
+    def reload_config(self) -> dict:
+        self.config = core.load_config()
+        core.configure_supervisor(self.config)
+        core.configure_watchdog(self.config)
+        core.configure_player_stats(self.config)
+        self.metrics_server.apply(self.config)
+        core.prune_ingests(self.config)
+        return self.config
+
+    def start(self) -> dict:
+        """Start every configured route, every mapped player, the mosaics, the walls and the sender."""
+        with self._lock:
+            self.started_at = time.time()
+            core.display_topology.watch()
+            core.display_reconciler.attach(lambda: self.config)
+            core.configure_supervisor(self.config)
+            core.configure_watchdog(self.config)
+            core.configure_player_stats(self.config)
+            results: dict = {"routes": {}, "streams": {}, "sender": None}
+
+            # Routes nobody reads locally may still feed other machines: start
+            # them up-front, start_all() brings up (and waits on) the others.
+            used = {
+                str(s.get("sourceRouteId") or "")
+                for s in self.config["streams"]
+                if str(s.get("source") or "").lower() == "route"
+            }
+            for route in self.config["routes"]:
+                route_id = str(route["id"])
+                if route_id in used or core.route_manager.status().get(route_id):
+                    continue
+                results["routes"][route_id] = _result_dict(core.route_manager.start_route(route))
+
+            for stream_id, result in core.start_all(self.config, cancel=self._stop_event).items():
+                results["streams"][stream_id] = _result_dict(result)
+
+            if self.start_sender:
+                results["sender"] = self._start_sender()
+            return results
+
+    def _start_sender(self) -> dict | None:
+        sender = self.config.get("sender", {})
+        display_id = str(sender.get("displayId") or "")
+        if not display_id or core.sender_manager.status():
+            return None
+        display = next((d for d in self._displays(exclude_primary=False) if str(d.get("id")) == display_id), None)
+        if display is None:
+            return {"ok": False, "reason": "NO_DISPLAY"}
+        result = core.sender_manager.start(
+            display,
+            name=str(sender.get("name") or "SRT Multiview"),
+            fps=int(sender.get("fps") or 30),
+            pixel_format=str(sender.get("pixelFormat") or "uyvy422"),
+            clock_output=bool(sender.get("clockOutput", False)),
+            reference_level=float(sender.get("referenceLevel", 1.0)),
+        )
+        return _result_dict(result)
+
+    def start_stream(self, ref: str) -> dict:
+        with self._lock:
+            config = self.reload_config()
+            stream_id = _find_stream_id(core.config_store.model, ref)
+            if stream_id is None:
+                raise KeyError(ref)
+            results = core.start_all(config, cancel=self._stop_event, stream_ids={stream_id})
+            return {"id": stream_id, **_result_dict(results.get(stream_id))}
+
+    def replace_stream(self, ref: str) -> dict:
+        """Apply the stream's current settings make-before-break (see ``PlayerManager.replace_player``)."""
+        with self._lock:
+            config = self.reload_config()
+            stream_id = _find_stream_id(core.config_store.model, ref)
+            if stream_id is None:
+                raise KeyError(ref)
+            results = core.start_all(config, cancel=self._stop_event, stream_ids={stream_id}, replace=True)
+            return {"id": stream_id, **_result_dict(results.get(stream_id))}
+
+    def stop_stream(self, ref: str) -> dict:
+        with self._lock:
+            stream_id = _find_stream_id(core.config_store.model, ref)
+            if stream_id is None:
+                self.reload_config()
+                stream_id = _find_stream_id(core.config_store.model, ref)
+            if stream_id is None:
+                raise KeyError(ref)
+            core.player_manager.stop_player(stream_id)
+            return {"id": stream_id, "ok": True, "reason": None}
+
+    def stop_all(self) -> None:
+        core.stop_all_children()
+
+    def status(self) -> dict:
+        players = core.player_manager.status()
+        routes = core.route_manager.status()
+        feeds = core.feeder_manager.status()
+        mapping = self.config.get("mapping", {})
+        streams = []
+        for stream in self.config["streams"]:
+            stream_id = str(stream["id"])
+            info = core.player_manager.debug_info(stream_id)
+            streams.append(
+                {
+                    "id": stream_id,
+                    "name": stream.get("name"),
+                    "source": str(stream.get("source") or "srt").lower(),
+                    "displayId": mapping.get(stream_id),
+                    "running": bool(players.get(stream_id)),
+                    "ready": bool(info.get("ready")),
+                    "stalled": bool(info.get("stalled")),
+                    "pid": info.get("pid") if players.get(stream_id) else None,
+                    "restarts": info.get("restarts", 0),
+                    "restartPending": bool(info.get("restart_pending")),
+                    "waitingDisplay": stream_id in core.player_manager.parked,
+                    "sharedWith": info.get("shared_with") or None,
+                    "ingest": bool(routes.get(f"ingest:{stream_id}")),
+                    "switcher": bool(stream.get("switcher")),
+                    "feeding": bool(feeds.get(stream_id)),
+                    "lastExitCode": info.get("last_exit_code"),
+                    "queuePosition": core.launch_scheduler.position(f"player:{stream_id}"),
+                }
+            )
+        route_list = []
+        for route in self.config["routes"]:
+            route_id = str(route["id"])
+            info = core.route_manager.debug_info(route_id)
+            route_list.append(
+                {
+                    "id": route_id,
+                    "name": route.get("name"),
+                    "running": bool(routes.get(route_id)),
+                    "pinned": route_id in core.route_manager.pinned,
+                    "consumers": sorted(core.route_manager.consumers.get(route_id) or ()),
+                    "pid": info.get("pid"),
+                    "restarts": info.get("restarts", 0),
+                    "lastError": info.get("last_error"),
+                    "progress": core.route_manager.telemetry(route_id) or None,
+                }
+            )
+        mosaics = core.mosaic_manager.status()
+        mosaic_list = []
+        for mosaic in self.config.get("mosaics", []):
+            mosaic_id = str(mosaic["id"])
+            info = core.mosaic_manager.debug_info(mosaic_id)
+            mosaic_list.append(
+                {
+                    "id": mosaic_id,
+                    "name": mosaic.get("name"),
+                    "displayId": mosaic.get("displayId") or None,
+                    "running": bool(mosaics.get(mosaic_id)),
+                    "pid": info.get("pid") if mosaics.get(mosaic_id) else None,
+                    "restarts": info.get("restarts", 0),
+                    "lastError": info.get("last_error"),
+                    "progress": core.mosaic_manager.telemetry(mosaic_id) or None,
+                }
+            )
+        wall_list = []
+        for wall in self.config.get("walls", []):
+            player_id = core.wall_player_id(str(wall["id"]))
+            info = core.player_manager.debug_info(player_id)
+            wall_list.append(
+                {
+                    "id": str(wall["id"]),
+                    "name": wall.get("name"),
+                    "streamId": wall.get("streamId") or None,
+                    "displayIds": list(wall.get("displayIds") or []),
+                    "running": bool(players.get(player_id)),
+                    "ready": bool(info.get("ready")),
+                    "pid": info.get("pid") if players.get(player_id) else None,
+                    "restarts": info.get("restarts", 0),
+                    "waitingDisplay": player_id in core.player_manager.parked,
+                }
+            )
+        sender = core.sender_manager.debug_info()
+        return {
+            "engine": {
+                "pid": os.getpid(),
+                "uptime": time.time() - self.started_at if self.started_at else None,
+            },
+            "streams": streams,
+            "routes": route_list,
+            "mosaics": mosaic_list,
+            "walls": wall_list,
+            "sender": {
+                "displayId": self.config.get("sender", {}).get("displayId") or None,
+                "running": bool(sender.get("running")),
+                "pid": sender.get("pid"),
+                "restarts": sender.get("restarts", 0),
+                "lastError": sender.get("last_error"),
+                "progress": core.sender_manager.telemetry() or None,
+            },
+        }
+
+    # Control API
+
+    def serve(self, host: str | None = None, port: int | None = None) -> None:
+        headless = self.config.get("headless", {})
+        host = host or headless.get("controlHost") or "127.0.0.1"
+        port = int(port or headless.get("controlPort") or 8765)
+        self._server = ThreadingHTTPServer((host, port), _ControlHandler)
+        self._server.daemon_threads = True
+        self._server.engine = self  # type: ignore[attr-defined]
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, name="srt-multiview-control", daemon=True
+        )
+        self._server_thread.start()
+        self.metrics_server.apply(self.config)
+
+    def request_stop(self) -> None:
+        self._stop_event.set()
+
+    def wait(self) -> None:
+        # Short slices keep signal handlers responsive on Windows.
+        while not self._stop_event.wait(0.5):
+            pass
+
+    def shutdown(self) -> None:
+        self._stop_event.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.metrics_server.stop()
+        core.display_reconciler.detach()
+        with self._lock:
+            self.stop_all()
+
+
+class _ControlHandler(BaseHTTPRequestHandler):
+    server_version = "srt-multiview"
+
+    def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+        pass
+
+    def _send_json(self, status: int, payload) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        engine: HeadlessEngine = self.server.engine  # type: ignore[attr-defined]
+        if self.path.rstrip("/") == "/status":
+            self._send_json(200, engine.status())
+            return
+        self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        engine: HeadlessEngine = self.server.engine  # type: ignore[attr-defined]
+        parts = [unquote(p) for p in self.path.strip("/").split("/")]
+        if len(parts) == 3 and parts[0] == "streams" and parts[2] in {"start", "stop", "replace"}:
+            action = {
+                "start": engine.start_stream,
+                "stop": engine.stop_stream,
+                "replace": engine.replace_stream,
+            }[parts[2]]
+            try:
+                self._send_json(200, action(parts[1]))
+            except KeyError:
+                self._send_json(404, {"error": f"Flux inconnu: {parts[1]}"})
+            return
+        self._send_json(404, {"error": "not found"})
+
+
+def control_request(config: dict, method: str, path: str, *, timeout: float = 60.0):
+    headless = config.get("headless") or {}
+    host = headless.get("controlHost") or "127.0.0.1"
+    if host in {"0.0.0.0", "::"}:
+        host = "127.0.0.1"
+    url = f"http://{host}:{int(headless.get('controlPort') or 8765)}{path}"
+    request = Request(url, method=method, data=b"" if method == "POST" else None)
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+    except HTTPError as e:
+        try:
+            payload = json.loads(e.read().decode("utf-8"))
+        except (ValueError, OSError):
+            payload = {}
+        raise RuntimeError(payload.get("error") or str(e)) from None
+    except (URLError, ConnectionError, TimeoutError) as e:
+        raise EngineNotRunning(str(e)) from None
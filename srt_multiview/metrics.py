@@ -0,0 +1,221 @@
+"""Optional OpenMetrics / Prometheus endpoint (``GET /metrics``).
+
+Enabled with the ``metrics`` config section. Every scrape reads the managers
+directly, nothing is sampled in the background.
+"""
+
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import core
+
+PREFIX = "srt_multiview"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# name, type, help
+FAMILIES = (
+    ("up", "gauge", "1 when the process is running."),
+    ("ready", "gauge", "1 once the player has presented its first frame."),
+    ("stalled", "gauge", "1 while a running player shows no playback progress."),
+    ("stalls", "counter", "Freezes detected on the player."),
+    ("restarts", "counter", "Automatic restarts done by the watchdog."),
+    ("uptime_seconds", "gauge", "Seconds since the process was (re)started."),
+    ("cpu_seconds", "counter", "User + system CPU time of the process."),
+    ("resident_memory_bytes", "gauge", "Resident memory of the process."),
+    ("bitrate_bits_per_second", "gauge", "Current output bitrate."),
+    ("frames", "counter", "Frames processed."),
+    ("frames_dropped", "counter", "Frames dropped."),
+    ("frames_duplicated", "counter", "Frames duplicated."),
+    ("av_drift_seconds", "gauge", "Player master clock drift (A-V / M-V / M-A)."),
+    ("video_queue_bytes", "gauge", "Player video packet queue size."),
+    ("audio_queue_bytes", "gauge", "Player audio packet queue size."),
+)
+
+
+def _escape(value) -> str:
+    return str(value if value is not None else "").replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Samples:
+    def __init__(self):
+        self.by_family: dict[str, list[tuple[dict, float]]] = {name: [] for name, _, _ in FAMILIES}
+
+    def add(self, family: str, labels: dict, value) -> None:
+        if value is None:
+            return
+        self.by_family[family].append((labels, value))
+
+
+def _add_process(samples: _Samples, labels: dict, proc, info: dict, telemetry: dict, now: float) -> None:
+    running = bool(proc is not None and proc.poll() is None)
+    samples.add("up", labels, running)
+    samples.add("restarts", labels, int(info.get("restarts") or 0))
+    if not running:
+        return
+    samples.add("uptime_seconds", labels, max(0.0, now - proc.started_at))
+    usage = core.process_usage(proc.pid) or {}
+    samples.add("cpu_seconds", labels, usage.get("cpu_seconds"))
+    samples.add("resident_memory_bytes", labels, usage.get("rss_bytes"))
+    samples.add("bitrate_bits_per_second", labels, telemetry.get("bitrate"))
+    samples.add("frames", labels, telemetry.get("frames"))
+    samples.add("frames_dropped", labels, telemetry.get("frames_dropped"))
+    samples.add("frames_duplicated", labels, telemetry.get("frames_duplicated"))
+    samples.add("av_drift_seconds", labels, telemetry.get("drift"))
+    for key, family in (("video_queue_kb", "video_queue_bytes"), ("audio_queue_kb", "audio_queue_bytes")):
+        if telemetry.get(key) is not None:
+            samples.add(family, labels, int(telemetry[key]) * 1024)
+
+
+def collect(config: dict, player_snapshot: dict | None = None) -> _Samples:
+    samples = _Samples()
+    now = time.monotonic()
+    mapping = config.get("mapping", {})
+
+    players = core.player_manager
+    if player_snapshot is None:
+        player_snapshot = players.metrics_snapshot()
+    procs = player_snapshot["players"]
+    for stream in config.get("streams", []):
+        stream_id = str(stream.get("id"))
+        labels = {
+            "kind": "player",
+            "id": stream_id,
+            "name": stream.get("name") or stream_id,
+            "source": str(stream.get("source") or "srt").lower(),
+            "display": mapping.get(stream_id) or "",
+        }
+        # Streams sharing a decoder report its process.
+        owner = player_snapshot["shared_of"].get(stream_id, stream_id)
+        info = core.restart_watchdog.info(f"player:{owner}")
+        _add_process(samples, labels, procs.get(owner), info, players.telemetry(stream_id), now)
+        samples.add("ready", labels, players.is_ready(stream_id))
+        samples.add("stalled", labels, players.is_stalled(stream_id))
+        samples.add("stalls", labels, player_snapshot["stall_count"].get(stream_id, 0))
+
+    routes = core.route_manager
+    for route in config.get("routes", []):
+        route_id = str(route.get("id"))
+        labels = {"kind": "route", "id": route_id, "name": route.get("name") or route_id, "source": "srt", "display": ""}
+        info = core.restart_watchdog.info(f"route:{route_id}")
+        _add_process(samples, labels, routes.procs.get(route_id), info, routes.telemetry(route_id), now)
+
+    sender = config.get("sender", {})
+    if sender.get("displayId") or core.sender_manager.status():
+        labels = {
+            "kind": "sender",
+            "id": "sender",
+            "name": sender.get("name") or "",
+            "source": "omt",
+            "display": sender.get("displayId") or "",
+        }
+        info = core.restart_watchdog.info("sender")
+        _add_process(samples, labels, core.sender_manager.proc, info, core.sender_manager.telemetry(), now)
+    return samples
+
+
+def _render_histogram(lines: list[str], name: str, phase: str, snapshot: dict) -> None:
+    for bound, count in snapshot["buckets"]:
+        le = "+Inf" if math.isinf(bound) else repr(float(bound))
+        lines.append(f'{name}_bucket{{phase="{phase}",le="{le}"}} {count}')
+    lines.append(f'{name}_count{{phase="{phase}"}} {snapshot["count"]}')
+    lines.append(f'{name}_sum{{phase="{phase}"}} {_format_value(float(snapshot["sum"]))}')
+
+
+def render(config: dict, *, openmetrics: bool = True) -> str:
+    # One snapshot per scrape: the supervisor loop keeps changing the manager.
+    player_snapshot = core.player_manager.metrics_snapshot()
+    samples = collect(config, player_snapshot)
+    lines: list[str] = []
+    for family, kind, help_text in FAMILIES:
+        rows = samples.by_family[family]
+        if not rows:
+            continue
+        name = f"{PREFIX}_{family}"
+        sample_name = f"{name}_total" if kind == "counter" else name
+        type_name = name if openmetrics else sample_name
+        lines.append(f"# TYPE {type_name} {kind}")
+        lines.append(f"# HELP {type_name} {help_text}")
+        for labels, value in rows:
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f"{sample_name}{{{label_text}}} {_format_value(value)}")
+
+    name = f"{PREFIX}_player_startup_seconds"
+    lines.append(f"# TYPE {name} histogram")
+    lines.append(f"# HELP {name} Player launch to connection / first frame.")
+    for phase, snapshot in player_snapshot["startup_latency"].items():
+        _render_histogram(lines, name, phase, snapshot)
+
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server_version = "srt-multiview"
+
+    def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0].rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in (self.headers.get("Accept") or "")
+        body = render(self.server.config_getter(), openmetrics=openmetrics).encode("utf-8")  # type: ignore[attr-defined]
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MetricsServer:
+    """``/metrics`` HTTP server, (re)configured from the ``metrics`` config section."""
+
+    def __init__(self, config_getter):
+        self.config_getter = config_getter
+        self.address: tuple[str, int] | None = None
+        self.last_error: str | None = None
+        self._server: ThreadingHTTPServer | None = None
+
+    def apply(self, config: dict) -> None:
+        section = config.get("metrics") or {}
+        wanted = (section["host"], section["port"]) if section.get("enabled") else None
+        if wanted == self.address and (wanted is None or self._server is not None):
+            return
+        self.stop()
+        if wanted is None:
+            return
+        try:
+            server = ThreadingHTTPServer(wanted, _MetricsHandler)
+        except OSError as e:
+            self.last_error = str(e)
+            return
+        server.daemon_threads = True
+        server.config_getter = self.config_getter  # type: ignore[attr-defined]
+        threading.Thread(target=server.serve_forever, name="srt-multiview-metrics", daemon=True).start()
+        self._server = server
+        self.address = wanted
+        self.last_error = None
+
+    def stop(self) -> None:
+        server, self._server = self._server, None
+        self.address = None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
@@ -1,6 +1,8 @@
 import sys
+import threading
 import time
 import uuid
+from concurrent.futures import Future
 
 from PySide6.QtCore import QObject, Qt, QThread, QTimer, QUrl, Signal
 from PySide6.QtGui import QColor, QDesktopServices, QFont, QIcon
@@ -33,6 +35,8 @@ from PySide6.QtWidgets import (
 )
 
 from . import core
+from .discovery import omt_directory
+from .metrics import MetricsServer
 from .paths import APP_ICON_ICO_PATH, APP_ICON_PNG_PATH, CONFIG_PATH
 from .styles import apply_theme, enable_hi_dpi
 
@@ -110,6 +114,16 @@ class RoutingDialog(QDialog):
         self.pkt_spin.setRange(188, 9000)
         self.pkt_spin.setButtonSymbols(QSpinBox.NoButtons)
         self.pkt_spin.setFixedHeight(28)
+        self.idle_spin = QSpinBox()
+        self.idle_spin.setRange(0, 86400)
+        self.idle_spin.setSuffix(" s")
+        self.idle_spin.setSpecialValueText("jamais")
+        self.idle_spin.setToolTip(
+            "Une route démarrée pour des flux s'arrête après ce délai\n"
+            "quand plus aucun lecteur ne la lit (démarrage manuel : jamais)."
+        )
+        self.idle_spin.setButtonSymbols(QSpinBox.NoButtons)
+        self.idle_spin.setFixedHeight(28)
 
         def _row_widget(label: str, widget: QWidget) -> QWidget:
             row_w = QWidget()
@@ -136,16 +150,19 @@ class RoutingDialog(QDialog):
         self._adv_row_mport = _row_widget("Multicast port", self.mport_spin)
         self._adv_row_ttl = _row_widget("TTL", self.ttl_spin)
         self._adv_row_pkt = _row_widget("pkt_size", self.pkt_spin)
+        self._adv_row_idle = _row_widget("Arrêt si inutilisée", self.idle_spin)
         right.addWidget(self._adv_row_maddr)
         right.addWidget(self._adv_row_mport)
         right.addWidget(self._adv_row_ttl)
         right.addWidget(self._adv_row_pkt)
+        right.addWidget(self._adv_row_idle)
 
         def _set_advanced_visible(visible: bool):
             self._adv_row_maddr.setVisible(visible)
             self._adv_row_mport.setVisible(visible)
             self._adv_row_ttl.setVisible(visible)
             self._adv_row_pkt.setVisible(visible)
+            self._adv_row_idle.setVisible(visible)
 
         self.advanced_chk.toggled.connect(_set_advanced_visible)
         self.advanced_chk.setChecked(False)
@@ -225,6 +242,7 @@ class RoutingDialog(QDialog):
                 self.ttl_spin.setValue(1)
             if int(self.pkt_spin.value() or 0) <= 0:
                 self.pkt_spin.setValue(1316)
+            self.idle_spin.setValue(core.ROUTE_IDLE_TIMEOUT)
 
             self.status_label.setText("Aucune route enregistrée. Renseigne les champs puis clique « Enregistrer ».")
             self.btn_toggle.setEnabled(True)
@@ -243,14 +261,20 @@ class RoutingDialog(QDialog):
         self.mport_spin.setValue(int(route.get("multicastPort") or 1234))
         self.ttl_spin.setValue(int(route.get("ttl") or 1))
         self.pkt_spin.setValue(int(route.get("pktSize") or 1316))
+        self.idle_spin.setValue(int(route.get("idleTimeout", core.ROUTE_IDLE_TIMEOUT)))
 
         running = bool(core.route_manager.status().get(rid, False))
         if running:
             self.btn_toggle.setText("⏹ Arrêter")
             self.btn_toggle.setObjectName("DangerButton")
-            self.status_label.setText(
-                f"En cours. Sortie : udp://@{self.maddr_edit.text().strip()}:{self.mport_spin.value()}"
-            )
+            text = f"En cours. Sortie : udp://@{self.maddr_edit.text().strip()}:{self.mport_spin.value()}"
+            progress = _format_progress(core.route_manager.telemetry(rid))
+            if progress:
+                text += f" — {progress}"
+            if rid not in core.route_manager.pinned:
+                readers = len(core.route_manager.consumers.get(rid) or ())
+                text += f" — à la demande ({readers} lecteur{'s' if readers > 1 else ''})"
+            self.status_label.setText(text)
         else:
             self.btn_toggle.setText("▶ Démarrer")
             self.btn_toggle.setObjectName("SuccessButton")
@@ -314,8 +338,7 @@ class RoutingDialog(QDialog):
                 "ttl": 1,
             }
         )
-        self.main.config = core.normalize_config(self.main.config)
-        core.save_config(self.main.config)
+        self.main.config = core.config_store.submit(self.main.config)
         self.refresh_routes()
         for i in range(self.routes_list.count()):
             if str(self.routes_list.item(i).data(Qt.UserRole)) == rid:
@@ -336,14 +359,13 @@ class RoutingDialog(QDialog):
         )
         if reply != QMessageBox.Yes:
             return
-        core.route_manager.stop_route(rid)
+        core.route_manager.stop_route_async(rid)
         self.main.config["routes"] = [r for r in self._routes() if str(r.get("id")) != rid]
         for s in self.main.config.get("streams", []) or []:
             if str(s.get("source")) == "route" and str(s.get("sourceRouteId")) == rid:
                 s["sourceRouteId"] = ""
                 s["source"] = "srt"
-        self.main.config = core.normalize_config(self.main.config)
-        core.save_config(self.main.config)
+        self.main.config = core.config_store.submit(self.main.config)
         self.refresh_routes()
 
     def save_route(self):
@@ -363,9 +385,9 @@ class RoutingDialog(QDialog):
         route["multicastPort"] = int(self.mport_spin.value())
         route["ttl"] = int(self.ttl_spin.value())
         route["pktSize"] = int(self.pkt_spin.value())
+        route["idleTimeout"] = int(self.idle_spin.value())
         self.main.config["routes"] = routes
-        self.main.config = core.normalize_config(self.main.config)
-        core.save_config(self.main.config)
+        self.main.config = core.config_store.submit(self.main.config)
         self.refresh_routes()
 
         for i in range(self.routes_list.count()):
@@ -385,17 +407,621 @@ class RoutingDialog(QDialog):
             return
         running = bool(core.route_manager.status().get(rid, False))
         if running:
-            core.route_manager.stop_route(rid)
-            self.refresh_routes()
+            future = core.route_manager.stop_route_async(rid)
+        else:
+            self.save_route()
+            route = next((r for r in self._routes() if str(r.get("id")) == rid), None)
+            if not route:
+                return
+            future = core.route_manager.start_route_async(route)
+        self.btn_toggle.setEnabled(False)
+        self.btn_toggle.setText("⏳ En cours…")
+        self.main.futures.watch(future, self._on_route_toggled)
+
+    def _on_route_toggled(self, future: Future):
+        error = _future_error(future)
+        result = None if error else future.result()
+        if error or (result is not None and not result.ok):
+            reason = error or result.reason or "Erreur inconnue."
+            QMessageBox.warning(self, "Routage", "Impossible de démarrer la route.\n\n" + reason)
+        self.refresh_routes()
+
+
+class MosaicDialog(QDialog):
+    """Edit multiviewer mosaics: a grid of streams on one display, one ffmpeg."""
+
+    def __init__(self, parent: "MainWindow"):
+        super().__init__(parent)
+        self.main = parent
+        self.setWindowTitle("Mosaïques multiview")
+        self.setMinimumSize(820, 500)
+        self._tile_widgets: list[tuple[QComboBox, QLineEdit]] = []
+
+        root = QFrame()
+        root.setObjectName("Card")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(10)
+        layout.addWidget(root)
+
+        outer = QHBoxLayout(root)
+        outer.setContentsMargins(14, 14, 14, 14)
+        outer.setSpacing(10)
+
+        left = QVBoxLayout()
+        left.setSpacing(8)
+        self.mosaics_list = QListWidget()
+        self.mosaics_list.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.mosaics_list.currentRowChanged.connect(self.on_select_mosaic)
+        self.mosaics_list.setMinimumWidth(220)
+        left.addWidget(self.mosaics_list, stretch=1)
+
+        left_btns = QHBoxLayout()
+        left_btns.setSpacing(8)
+        self.btn_add = QPushButton("+ Ajouter")
+        self.btn_add.setObjectName("PrimaryButton")
+        self.btn_add.setMinimumHeight(34)
+        self.btn_add.clicked.connect(self.add_mosaic)
+        left_btns.addWidget(self.btn_add)
+        self.btn_delete = QPushButton("Supprimer")
+        self.btn_delete.setObjectName("DangerButton")
+        self.btn_delete.setMinimumHeight(34)
+        self.btn_delete.clicked.connect(self.delete_mosaic)
+        left_btns.addWidget(self.btn_delete)
+        left.addLayout(left_btns)
+
+        right = QVBoxLayout()
+        right.setSpacing(8)
+
+        self.name_edit = QLineEdit()
+        self.name_edit.setFixedHeight(28)
+        self.display_combo = QComboBox()
+        self.display_combo.setFixedHeight(28)
+        self.columns_spin = QSpinBox()
+        self.columns_spin.setRange(1, core.MOSAIC_MAX_GRID)
+        self.columns_spin.setFixedHeight(28)
+        self.rows_spin = QSpinBox()
+        self.rows_spin.setRange(1, core.MOSAIC_MAX_GRID)
+        self.rows_spin.setFixedHeight(28)
+        self.fps_spin = QSpinBox()
+        self.fps_spin.setRange(1, 60)
+        self.fps_spin.setSuffix(" fps")
+        self.fps_spin.setFixedHeight(28)
+        self.labels_chk = QCheckBox("Afficher les étiquettes")
+
+        def _row_widget(label: str, widget: QWidget) -> QWidget:
+            row_w = QWidget()
+            row = QHBoxLayout(row_w)
+            row.setContentsMargins(0, 0, 0, 0)
+            row.setSpacing(8)
+            lbl = QLabel(label)
+            lbl.setObjectName("FormLabel")
+            lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            lbl.setFixedWidth(90)
+            row.addWidget(lbl)
+            row.addWidget(widget, stretch=1)
+            return row_w
+
+        grid_w = QWidget()
+        grid_row = QHBoxLayout(grid_w)
+        grid_row.setContentsMargins(0, 0, 0, 0)
+        grid_row.setSpacing(8)
+        grid_row.addWidget(self.columns_spin)
+        grid_row.addWidget(QLabel("×"))
+        grid_row.addWidget(self.rows_spin)
+        grid_row.addWidget(self.fps_spin)
+        grid_row.addWidget(self.labels_chk)
+
+        right.addWidget(_row_widget("Nom", self.name_edit))
+        right.addWidget(_row_widget("Écran", self.display_combo))
+        right.addWidget(_row_widget("Grille", grid_w))
+
+        self.tiles_grid = QGridLayout()
+        self.tiles_grid.setSpacing(6)
+        right.addLayout(self.tiles_grid)
+        right.addStretch(1)
+        self.columns_spin.valueChanged.connect(lambda _v: self._rebuild_tiles(self._current_tiles()))
+        self.rows_spin.valueChanged.connect(lambda _v: self._rebuild_tiles(self._current_tiles()))
+
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("Subtitle")
+        self.status_label.setWordWrap(True)
+        self.status_label.setMinimumHeight(34)
+        right.addWidget(self.status_label)
+
+        actions = QHBoxLayout()
+        actions.setSpacing(8)
+        self.btn_toggle = QPushButton("▶ Démarrer")
+        self.btn_toggle.setObjectName("SuccessButton")
+        self.btn_toggle.setMinimumHeight(36)
+        self.btn_toggle.clicked.connect(self.toggle_mosaic)
+        actions.addWidget(self.btn_toggle)
+        self.btn_save = QPushButton("Enregistrer")
+        self.btn_save.setMinimumHeight(36)
+        self.btn_save.clicked.connect(self.save_mosaic)
+        actions.addWidget(self.btn_save)
+        self.btn_close = QPushButton("Fermer")
+        self.btn_close.setMinimumHeight(36)
+        self.btn_close.clicked.connect(self.accept)
+        actions.addWidget(self.btn_close)
+        actions.addStretch(1)
+        right.addLayout(actions)
+
+        outer.addLayout(left, stretch=0)
+        outer.addLayout(right, stretch=1)
+
+        self.refresh_mosaics()
+
+    def _mosaics(self) -> list[dict]:
+        return list(self.main.config.get("mosaics", []) or [])
+
+    def _selected_mosaic_id(self) -> str:
+        item = self.mosaics_list.currentItem()
+        return str(item.data(Qt.UserRole) or "") if item else ""
+
+    def _current_tiles(self) -> list[dict]:
+        return [
+            {"streamId": str(combo.currentData() or ""), "label": edit.text().strip()}
+            for combo, edit in self._tile_widgets
+        ]
+
+    def _rebuild_tiles(self, tiles: list[dict]) -> None:
+        while self.tiles_grid.count():
+            widget = self.tiles_grid.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        self._tile_widgets = []
+        columns, rows = self.columns_spin.value(), self.rows_spin.value()
+        streams = self.main.config.get("streams", [])
+        for cell in range(columns * rows):
+            tile = tiles[cell] if cell < len(tiles) else {}
+            cell_w = QFrame()
+            cell_w.setObjectName("Card")
+            cell_layout = QVBoxLayout(cell_w)
+            cell_layout.setContentsMargins(6, 6, 6, 6)
+            cell_layout.setSpacing(4)
+            combo = QComboBox()
+            combo.addItem("— vide —", "")
+            for stream in streams:
+                combo.addItem(str(stream.get("name") or stream.get("id")), str(stream.get("id")))
+            index = combo.findData(str(tile.get("streamId") or ""))
+            combo.setCurrentIndex(max(0, index))
+            edit = QLineEdit(str(tile.get("label") or ""))
+            edit.setPlaceholderText("Étiquette (nom du flux)")
+            cell_layout.addWidget(combo)
+            cell_layout.addWidget(edit)
+            self.tiles_grid.addWidget(cell_w, cell // columns, cell % columns)
+            self._tile_widgets.append((combo, edit))
+
+    def refresh_mosaics(self):
+        selected = self._selected_mosaic_id()
+        self.mosaics_list.blockSignals(True)
+        try:
+            self.mosaics_list.clear()
+            status = core.mosaic_manager.status()
+            for mosaic in self._mosaics():
+                mid = str(mosaic.get("id") or "")
+                name = str(mosaic.get("name") or mid)
+                item = QListWidgetItem(f"▶ {name}" if status.get(mid) else f"⏹ {name}")
+                item.setData(Qt.UserRole, mid)
+                self.mosaics_list.addItem(item)
+                if mid == selected:
+                    self.mosaics_list.setCurrentItem(item)
+        finally:
+            self.mosaics_list.blockSignals(False)
+        if self.mosaics_list.count() > 0 and self.mosaics_list.currentRow() < 0:
+            self.mosaics_list.setCurrentRow(0)
+        self.on_select_mosaic(self.mosaics_list.currentRow())
+
+    def on_select_mosaic(self, _row: int):
+        mid = self._selected_mosaic_id()
+        mosaic = next((m for m in self._mosaics() if str(m.get("id")) == mid), None)
+        self.display_combo.clear()
+        for display in self.main.sender_displays:
+            self.display_combo.addItem(f"{display['name']} — {display['width']}x{display['height']}", str(display["id"]))
+
+        enabled = mosaic is not None
+        for widget in (self.btn_toggle, self.btn_delete, self.btn_save, self.name_edit, self.display_combo):
+            widget.setEnabled(enabled)
+        if not mosaic:
+            self._rebuild_tiles([])
+            self.status_label.setText("Aucune mosaïque. Clique « + Ajouter » pour en créer une.")
             return
-        self.save_route()
-        route = next((r for r in self._routes() if str(r.get("id")) == rid), None)
-        if not route:
+
+        self.name_edit.setText(str(mosaic.get("name") or ""))
+        display_id = str(mosaic.get("displayId") or "")
+        index = self.display_combo.findData(display_id)
+        if index < 0 and display_id:
+            self.display_combo.addItem(f"⚠ Écran absent ({display_id})", display_id)
+            index = self.display_combo.count() - 1
+        self.display_combo.setCurrentIndex(max(0, index))
+        for spin, value in ((self.columns_spin, mosaic.get("columns")), (self.rows_spin, mosaic.get("rows"))):
+            spin.blockSignals(True)
+            spin.setValue(int(value or 2))
+            spin.blockSignals(False)
+        self.fps_spin.setValue(int(mosaic.get("fps") or 25))
+        self.labels_chk.setChecked(bool(mosaic.get("showLabels", True)))
+        self._rebuild_tiles(list(mosaic.get("tiles") or []))
+
+        running = bool(core.mosaic_manager.status().get(mid, False))
+        if running:
+            self.btn_toggle.setText("⏹ Arrêter")
+            self.btn_toggle.setObjectName("DangerButton")
+            text = "En cours."
+            progress = _format_progress(core.mosaic_manager.telemetry(mid))
+            if progress:
+                text += f" — {progress}"
+            self.status_label.setText(text)
+        else:
+            self.btn_toggle.setText("▶ Démarrer")
+            self.btn_toggle.setObjectName("SuccessButton")
+            last = core.mosaic_manager.last_error.get(mid)
+            self.status_label.setText("Arrêtée. Dernière erreur : " + str(last) if last else "Arrêtée.")
+        self.btn_toggle.style().unpolish(self.btn_toggle)
+        self.btn_toggle.style().polish(self.btn_toggle)
+
+    def add_mosaic(self):
+        name, ok = QInputDialog.getText(
+            self, "Nouvelle mosaïque", "Nom de la mosaïque :", text=f"Mosaïque {self.mosaics_list.count() + 1}"
+        )
+        if not ok:
             return
-        result = core.route_manager.start_route(route)
-        if not result.ok:
-            QMessageBox.warning(self, "Routage", "Impossible de démarrer la route.\n\n" + (result.reason or "Erreur inconnue."))
-        self.refresh_routes()
+        mid = f"mosaic-{uuid.uuid4().hex[:12]}"
+        streams = self.main.config.get("streams", [])
+        mosaic = {
+            "id": mid,
+            "name": (name or "").strip() or mid,
+            "displayId": str(self.main.sender_displays[0]["id"]) if self.main.sender_displays else "",
+            "tiles": [{"streamId": str(s.get("id"))} for s in streams[:4]],
+        }
+        self.main.config.setdefault("mosaics", []).append(core.MosaicConfig.from_dict(mosaic).to_dict())
+        self.main.config = core.config_store.submit(self.main.config)
+        self.refresh_mosaics()
+        for i in range(self.mosaics_list.count()):
+            if str(self.mosaics_list.item(i).data(Qt.UserRole)) == mid:
+                self.mosaics_list.setCurrentRow(i)
+                break
+
+    def delete_mosaic(self):
+        mid = self._selected_mosaic_id()
+        if not mid:
+            return
+        self.main.futures.watch(core.mosaic_manager.stop_mosaic_async(mid), lambda _f: self.refresh_mosaics())
+        self.main.config["mosaics"] = [m for m in self._mosaics() if str(m.get("id")) != mid]
+        self.main.config = core.config_store.submit(self.main.config)
+        self.refresh_mosaics()
+
+    def save_mosaic(self):
+        mid = self._selected_mosaic_id()
+        mosaics = self._mosaics()
+        index = next((i for i, m in enumerate(mosaics) if str(m.get("id")) == mid), None)
+        if index is None:
+            return
+        mosaic = dict(mosaics[index])
+        mosaic.update(
+            name=self.name_edit.text().strip() or mid,
+            displayId=str(self.display_combo.currentData() or ""),
+            columns=self.columns_spin.value(),
+            rows=self.rows_spin.value(),
+            fps=self.fps_spin.value(),
+            showLabels=self.labels_chk.isChecked(),
+            tiles=self._current_tiles(),
+        )
+        mosaics[index] = core.MosaicConfig.from_dict(mosaic, index).to_dict()
+        self.main.config["mosaics"] = mosaics
+        self.main.config = core.config_store.submit(self.main.config)
+        self.refresh_mosaics()
+
+    def toggle_mosaic(self):
+        mid = self._selected_mosaic_id()
+        if not mid:
+            return
+        if core.mosaic_manager.status().get(mid, False):
+            future = core.mosaic_manager.stop_mosaic_async(mid)
+        else:
+            self.save_mosaic()
+            future = core.run_in_control(
+                core.start_all, core.config_store.snapshot(), stream_ids=set(), mosaic_ids={mid}
+            )
+        self.btn_toggle.setEnabled(False)
+        self.btn_toggle.setText("⏳ En cours…")
+        self.main.futures.watch(future, self._on_mosaic_toggled)
+
+    def _on_mosaic_toggled(self, future: Future):
+        error = _future_error(future) or core.mosaic_manager.last_error.get(self._selected_mosaic_id())
+        if error and not core.mosaic_manager.status().get(self._selected_mosaic_id(), False):
+            QMessageBox.warning(self, "Mosaïque", "Impossible de démarrer la mosaïque.\n\n" + error)
+        self.refresh_mosaics()
+
+
+class WallDialog(QDialog):
+    """Edit video walls: one stream cropped across a rectangle of displays."""
+
+    def __init__(self, parent: "MainWindow"):
+        super().__init__(parent)
+        self.main = parent
+        self.setWindowTitle("Murs d'images")
+        self.setMinimumSize(760, 460)
+
+        root = QFrame()
+        root.setObjectName("Card")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(10)
+        layout.addWidget(root)
+
+        outer = QHBoxLayout(root)
+        outer.setContentsMargins(14, 14, 14, 14)
+        outer.setSpacing(10)
+
+        left = QVBoxLayout()
+        left.setSpacing(8)
+        self.walls_list = QListWidget()
+        self.walls_list.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.walls_list.currentRowChanged.connect(self.on_select_wall)
+        self.walls_list.setMinimumWidth(220)
+        left.addWidget(self.walls_list, stretch=1)
+
+        left_btns = QHBoxLayout()
+        left_btns.setSpacing(8)
+        self.btn_add = QPushButton("+ Ajouter")
+        self.btn_add.setObjectName("PrimaryButton")
+        self.btn_add.setMinimumHeight(34)
+        self.btn_add.clicked.connect(self.add_wall)
+        left_btns.addWidget(self.btn_add)
+        self.btn_delete = QPushButton("Supprimer")
+        self.btn_delete.setObjectName("DangerButton")
+        self.btn_delete.setMinimumHeight(34)
+        self.btn_delete.clicked.connect(self.delete_wall)
+        left_btns.addWidget(self.btn_delete)
+        left.addLayout(left_btns)
+
+        right = QVBoxLayout()
+        right.setSpacing(8)
+
+        self.name_edit = QLineEdit()
+        self.name_edit.setFixedHeight(28)
+        self.stream_combo = QComboBox()
+        self.stream_combo.setFixedHeight(28)
+        self.bezel_x_spin = QSpinBox()
+        self.bezel_x_spin.setRange(0, 1000)
+        self.bezel_x_spin.setSuffix(" px")
+        self.bezel_x_spin.setFixedHeight(28)
+        self.bezel_y_spin = QSpinBox()
+        self.bezel_y_spin.setRange(0, 1000)
+        self.bezel_y_spin.setSuffix(" px")
+        self.bezel_y_spin.setFixedHeight(28)
+        self.bezel_x_spin.setToolTip("Largeur cachée par les bords entre deux écrans côte à côte.")
+        self.bezel_y_spin.setToolTip("Hauteur cachée par les bords entre deux écrans l'un au-dessus de l'autre.")
+        self.displays_list = QListWidget()
+        self.displays_list.setMinimumHeight(140)
+
+        def _row_widget(label: str, widget: QWidget) -> QWidget:
+            row_w = QWidget()
+            row = QHBoxLayout(row_w)
+            row.setContentsMargins(0, 0, 0, 0)
+            row.setSpacing(8)
+            lbl = QLabel(label)
+            lbl.setObjectName("FormLabel")
+            lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            lbl.setFixedWidth(90)
+            row.addWidget(lbl)
+            row.addWidget(widget, stretch=1)
+            return row_w
+
+        bezel_w = QWidget()
+        bezel_row = QHBoxLayout(bezel_w)
+        bezel_row.setContentsMargins(0, 0, 0, 0)
+        bezel_row.setSpacing(8)
+        bezel_row.addWidget(QLabel("H"))
+        bezel_row.addWidget(self.bezel_x_spin)
+        bezel_row.addWidget(QLabel("V"))
+        bezel_row.addWidget(self.bezel_y_spin)
+
+        right.addWidget(_row_widget("Nom", self.name_edit))
+        right.addWidget(_row_widget("Flux", self.stream_combo))
+        right.addWidget(_row_widget("Bords", bezel_w))
+        right.addWidget(_row_widget("Écrans", self.displays_list))
+
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("Subtitle")
+        self.status_label.setWordWrap(True)
+        self.status_label.setMinimumHeight(34)
+        right.addWidget(self.status_label)
+        right.addStretch(1)
+
+        actions = QHBoxLayout()
+        actions.setSpacing(8)
+        self.btn_toggle = QPushButton("▶ Démarrer")
+        self.btn_toggle.setObjectName("SuccessButton")
+        self.btn_toggle.setMinimumHeight(36)
+        self.btn_toggle.clicked.connect(self.toggle_wall)
+        actions.addWidget(self.btn_toggle)
+        self.btn_save = QPushButton("Enregistrer")
+        self.btn_save.setMinimumHeight(36)
+        self.btn_save.clicked.connect(self.save_wall)
+        actions.addWidget(self.btn_save)
+        self.btn_close = QPushButton("Fermer")
+        self.btn_close.setMinimumHeight(36)
+        self.btn_close.clicked.connect(self.accept)
+        actions.addWidget(self.btn_close)
+        actions.addStretch(1)
+        right.addLayout(actions)
+
+        outer.addLayout(left, stretch=0)
+        outer.addLayout(right, stretch=1)
+
+        self._last_error: dict[str, str] = {}
+        self.refresh_walls()
+
+    def _walls(self) -> list[dict]:
+        return list(self.main.config.get("walls", []) or [])
+
+    def _selected_wall_id(self) -> str:
+        item = self.walls_list.currentItem()
+        return str(item.data(Qt.UserRole) or "") if item else ""
+
+    def refresh_walls(self):
+        selected = self._selected_wall_id()
+        self.walls_list.blockSignals(True)
+        try:
+            self.walls_list.clear()
+            status = core.player_manager.status()
+            for wall in self._walls():
+                wid = str(wall.get("id") or "")
+                name = str(wall.get("name") or wid)
+                running = status.get(core.wall_player_id(wid))
+                item = QListWidgetItem(f"▶ {name}" if running else f"⏹ {name}")
+                item.setData(Qt.UserRole, wid)
+                self.walls_list.addItem(item)
+                if wid == selected:
+                    self.walls_list.setCurrentItem(item)
+        finally:
+            self.walls_list.blockSignals(False)
+        if self.walls_list.count() > 0 and self.walls_list.currentRow() < 0:
+            self.walls_list.setCurrentRow(0)
+        self.on_select_wall(self.walls_list.currentRow())
+
+    def on_select_wall(self, _row: int):
+        wid = self._selected_wall_id()
+        wall = next((w for w in self._walls() if str(w.get("id")) == wid), None)
+
+        enabled = wall is not None
+        for widget in (self.btn_toggle, self.btn_delete, self.btn_save, self.name_edit, self.stream_combo):
+            widget.setEnabled(enabled)
+        self.stream_combo.clear()
+        self.displays_list.clear()
+        if not wall:
+            self.status_label.setText("Aucun mur. Clique « + Ajouter » pour en créer un.")
+            return
+
+        self.name_edit.setText(str(wall.get("name") or ""))
+        for stream in self.main.config.get("streams", []):
+            self.stream_combo.addItem(str(stream.get("name") or stream.get("id")), str(stream.get("id")))
+        self.stream_combo.setCurrentIndex(max(0, self.stream_combo.findData(str(wall.get("streamId") or ""))))
+        self.bezel_x_spin.setValue(int(wall.get("bezelX") or 0))
+        self.bezel_y_spin.setValue(int(wall.get("bezelY") or 0))
+
+        selected = set(wall.get("displayIds") or [])
+        known = set()
+        for display in self.main.sender_displays:
+            display_id = str(display["id"])
+            known.add(display_id)
+            item = QListWidgetItem(
+                f"{display['name']} — {display['width']}x{display['height']} @ {display['x']},{display['y']}"
+            )
+            item.setData(Qt.UserRole, display_id)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if display_id in selected else Qt.Unchecked)
+            self.displays_list.addItem(item)
+        for display_id in sorted(selected - known):
+            item = QListWidgetItem(f"⚠ Écran absent ({display_id})")
+            item.setData(Qt.UserRole, display_id)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            self.displays_list.addItem(item)
+
+        player_id = core.wall_player_id(wid)
+        if core.player_manager.status().get(player_id, False):
+            self.btn_toggle.setText("⏹ Arrêter")
+            self.btn_toggle.setObjectName("DangerButton")
+            self.status_label.setText("En cours." if core.player_manager.is_ready(player_id) else "Démarrage…")
+        else:
+            self.btn_toggle.setText("▶ Démarrer")
+            self.btn_toggle.setObjectName("SuccessButton")
+            if player_id in core.player_manager.parked:
+                self.status_label.setText("En attente d'un écran du mur.")
+            elif self._last_error.get(wid):
+                self.status_label.setText("Arrêté. Dernière erreur : " + self._last_error[wid])
+            else:
+                self.status_label.setText("Arrêté.")
+        self.btn_toggle.style().unpolish(self.btn_toggle)
+        self.btn_toggle.style().polish(self.btn_toggle)
+
+    def add_wall(self):
+        name, ok = QInputDialog.getText(
+            self, "Nouveau mur", "Nom du mur d'images :", text=f"Mur {self.walls_list.count() + 1}"
+        )
+        if not ok:
+            return
+        wid = f"wall-{uuid.uuid4().hex[:12]}"
+        streams = self.main.config.get("streams", [])
+        wall = {
+            "id": wid,
+            "name": (name or "").strip() or wid,
+            "streamId": str(streams[0].get("id")) if streams else "",
+            "displayIds": [str(d["id"]) for d in self.main.displays],
+        }
+        self.main.config.setdefault("walls", []).append(core.WallConfig.from_dict(wall).to_dict())
+        self.main.config = core.config_store.submit(self.main.config)
+        self.refresh_walls()
+        for i in range(self.walls_list.count()):
+            if str(self.walls_list.item(i).data(Qt.UserRole)) == wid:
+                self.walls_list.setCurrentRow(i)
+                break
+
+    def delete_wall(self):
+        wid = self._selected_wall_id()
+        if not wid:
+            return
+        self.main.futures.watch(
+            core.player_manager.stop_player_async(core.wall_player_id(wid)), lambda _f: self.refresh_walls()
+        )
+        self.main.config["walls"] = [w for w in self._walls() if str(w.get("id")) != wid]
+        self.main.config = core.config_store.submit(self.main.config)
+        self.refresh_walls()
+
+    def save_wall(self):
+        wid = self._selected_wall_id()
+        walls = self._walls()
+        index = next((i for i, w in enumerate(walls) if str(w.get("id")) == wid), None)
+        if index is None:
+            return
+        wall = dict(walls[index])
+        wall.update(
+            name=self.name_edit.text().strip() or wid,
+            streamId=str(self.stream_combo.currentData() or ""),
+            bezelX=self.bezel_x_spin.value(),
+            bezelY=self.bezel_y_spin.value(),
+            displayIds=[
+                str(self.displays_list.item(i).data(Qt.UserRole))
+                for i in range(self.displays_list.count())
+                if self.displays_list.item(i).checkState() == Qt.Checked
+            ],
+        )
+        walls[index] = core.WallConfig.from_dict(wall, index).to_dict()
+        self.main.config["walls"] = walls
+        self.main.config = core.config_store.submit(self.main.config)
+        self.refresh_walls()
+
+    def toggle_wall(self):
+        wid = self._selected_wall_id()
+        if not wid:
+            return
+        player_id = core.wall_player_id(wid)
+        if core.player_manager.status().get(player_id, False) or player_id in core.player_manager.parked:
+            future = core.player_manager.stop_player_async(player_id)
+        else:
+            self.save_wall()
+            future = core.run_in_control(
+                core.start_all, core.config_store.snapshot(), stream_ids=set(), wall_ids={wid}
+            )
+        self.btn_toggle.setEnabled(False)
+        self.btn_toggle.setText("⏳ En cours…")
+        self.main.futures.watch(future, lambda f, wid=wid: self._on_wall_toggled(wid, f))
+
+    def _on_wall_toggled(self, wid: str, future: Future):
+        error = _future_error(future)
+        if not error and isinstance(future.result(), dict):
+            result = future.result().get(core.wall_player_id(wid))
+            if result is not None and not result.ok and result.reason != "CANCELLED":
+                error = "Écran absent" if result.reason == "NO_DISPLAY" else str(result.reason)
+        if error:
+            self._last_error[wid] = error
+            QMessageBox.warning(self, "Mur d'images", "Impossible de démarrer le mur.\n\n" + error)
+        else:
+            self._last_error.pop(wid, None)
+        self.refresh_walls()
 
 
 class _OMTDiscoveryWorker(QObject):
@@ -410,8 +1036,50 @@ class _OMTDiscoveryWorker(QObject):
         self.finished.emit(list(sources), error or "")
 
 
+class _FutureBridge(QObject):
+    """Call ``callback(future)`` on the GUI thread once a core future is done."""
+
+    resolved = Signal(object, object)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self.resolved.connect(self._call)
+
+    def watch(self, future: Future, callback) -> None:
+        future.add_done_callback(lambda f: self.resolved.emit(callback, f))
+
+    @staticmethod
+    def _call(callback, future: Future) -> None:
+        callback(future)
+
+
+def _future_error(future: Future) -> str | None:
+    error = future.exception()
+    return None if error is None else (str(error) or type(error).__name__)
+
+
+class _DirectoryBridge(QObject):
+    """Forward OMT directory add/remove events to the GUI thread."""
+
+    changed = Signal()
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        omt_directory.subscribe(self._forward)
+
+    def _forward(self, _kind: str, _source) -> None:
+        self.changed.emit()
+
+    def close(self) -> None:
+        omt_directory.unsubscribe(self._forward)
+
+
 class OMTDiscoveryDialog(QDialog):
-    """Modal source picker that runs ``ffmpeg -find_sources`` off the UI thread."""
+    """Modal source picker fed by the live mDNS directory.
+
+    ``ffmpeg -find_sources`` runs off the UI thread only as a fallback, when
+    multicast is unavailable or the directory has nothing after a short wait.
+    """
 
     def __init__(self, parent: QWidget, current: str = ""):
         super().__init__(parent)
@@ -462,15 +1130,29 @@ class OMTDiscoveryDialog(QDialog):
 
         self._thread: QThread | None = None
         self._worker: _OMTDiscoveryWorker | None = None
+        self._fallback_sources: list[str] | None = None
+        self._fallback_error = ""
 
-        QTimer.singleShot(0, self._start_discovery)
+        omt_directory.start()
+        self._directory = _DirectoryBridge(self)
+        self._directory.changed.connect(self._populate)
+        self.finished.connect(lambda _result: self._directory.close())
+        self._populate()
+        QTimer.singleShot(2000, self._maybe_fallback)
+
+    def _maybe_fallback(self) -> None:
+        if omt_directory.last_error or not omt_directory.sources():
+            self._start_fallback()
 
     def _start_discovery(self) -> None:
+        omt_directory.rescan()
+        QTimer.singleShot(2000, self._maybe_fallback)
+
+    def _start_fallback(self) -> None:
         if self._thread is not None and self._thread.isRunning():
             return
         self.refresh_btn.setEnabled(False)
-        self.status_label.setText("Recherche en cours…")
-        self.list_widget.clear()
+        self.status_label.setText("Recherche en cours (ffmpeg)…")
 
         self._thread = QThread(self)
         self._worker = _OMTDiscoveryWorker(timeout=8.0)
@@ -486,17 +1168,30 @@ class OMTDiscoveryDialog(QDialog):
         self.refresh_btn.setEnabled(True)
         self._thread = None
         self._worker = None
+        self._fallback_sources = [str(src) for src in sources]
+        self._fallback_error = error
+        self._populate()
+
+    def _populate(self) -> None:
+        current = self.list_widget.currentItem()
+        selected = current.text() if current else ""
+        sources = omt_directory.sources()
+        sources += [src for src in self._fallback_sources or [] if src not in sources]
         self.list_widget.clear()
-        if error:
-            self.status_label.setText(f"⚠ {error}")
-            return
         if not sources:
-            self.status_label.setText("Aucune source OMT détectée sur le réseau.")
+            error = self._fallback_error or omt_directory.last_error
+            if error:
+                self.status_label.setText(f"⚠ {error}")
+            elif self._fallback_sources is not None:
+                self.status_label.setText("Aucune source OMT détectée sur le réseau.")
             return
         self.status_label.setText(f"{len(sources)} source(s) détectée(s).")
         for src in sources:
-            QListWidgetItem(str(src), self.list_widget)
-        self.list_widget.setCurrentRow(0)
+            item = QListWidgetItem(src, self.list_widget)
+            if src == selected:
+                self.list_widget.setCurrentItem(item)
+        if self.list_widget.currentItem() is None:
+            self.list_widget.setCurrentRow(0)
 
     def _accept_selection(self) -> None:
         item = self.list_widget.currentItem()
@@ -509,6 +1204,87 @@ class OMTDiscoveryDialog(QDialog):
         self.accept()
 
 
+def _format_startup(info: dict) -> str:
+    startup = info.get("startup") or {}
+    histograms = info.get("startup_latency") or {}
+    parts = []
+    for phase, label in (("connect", "connexion"), ("first_frame", "1ère image")):
+        value = startup.get(phase)
+        text = f"{label} {float(value):.2f}s" if value is not None else f"{label} —"
+        hist = histograms.get(phase) or {}
+        count = int(hist.get("count") or 0)
+        if count:
+            text += f" (moy. {float(hist.get('sum') or 0.0) / count:.2f}s sur {count})"
+        parts.append(text)
+    return ", ".join(parts)
+
+
+STATS_DROPS_WARN_PER_MIN = 5.0
+STATS_DRIFT_WARN_SECONDS = 0.1
+
+
+def _format_stats(summary: dict | None, stats: dict | None = None) -> str:
+    if summary is None:
+        if stats is not None and not stats.get("enabled"):
+            return "désactivées (Préférences → Stats lecteurs)"
+        return "—"
+    drift = summary.get("drift")
+    max_drift = summary.get("max_drift")
+    text = (
+        f"{int(summary.get('frames_dropped') or 0)} images perdues "
+        f"({float(summary.get('drops_per_min') or 0.0):.1f}/min sur {float(summary.get('window') or 0.0):.0f}s), "
+        f"dérive {f'{drift:+.3f}s' if drift is not None else '—'}"
+        f" (max {f'{max_drift:.3f}s' if max_drift is not None else '—'}), "
+        f"files vidéo {int(summary.get('video_queue_kb') or 0)} Ko / audio {int(summary.get('audio_queue_kb') or 0)} Ko"
+    )
+    history = (stats or {}).get("history") or []
+    if history:
+        rows = [
+            f"  {time.strftime('%H:%M:%S', time.localtime(x['t']))}  fd={x['frames_dropped']:<6} "
+            f"dérive={x['drift'] if x.get('drift') is not None else '—'}  vq={x['video_queue_kb']}Ko aq={x['audio_queue_kb']}Ko"
+            for x in history[-20:]
+        ]
+        text += "\n" + "\n".join(rows)
+    return text
+
+
+def _format_progress(sample: dict | None) -> str:
+    """One-line summary of an ffmpeg ``-progress`` sample (empty if none yet)."""
+    if not sample:
+        return ""
+    parts = []
+    bitrate = sample.get("bitrate")
+    if bitrate is not None:
+        parts.append(f"{float(bitrate) / 1e6:.2f} Mb/s")
+    fps = sample.get("fps")
+    if fps is not None:
+        parts.append(f"{float(fps):.1f} fps")
+    speed = sample.get("speed")
+    if speed is not None:
+        parts.append(f"x{float(speed):.2f}")
+    dropped = sample.get("frames_dropped")
+    duplicated = sample.get("frames_duplicated")
+    if dropped or duplicated:
+        parts.append(f"drop {int(dropped or 0)} / dup {int(duplicated or 0)}")
+    return ", ".join(parts)
+
+
+class _CoreEventBridge(QObject):
+    """Re-emit core state changes as a Qt signal delivered on the GUI thread."""
+
+    state_changed = Signal(str, str, bool)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        core.subscribe_state_changes(self._forward)
+
+    def _forward(self, event: core.StateEvent) -> None:
+        self.state_changed.emit(str(event.kind), str(event.child_id), bool(event.running))
+
+    def close(self) -> None:
+        core.unsubscribe_state_changes(self._forward)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -530,20 +1306,56 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1100, min(820, target_h))
 
         self.config = core.load_config()
+        core.configure_supervisor(self.config)
+        core.configure_watchdog(self.config)
+        core.configure_player_stats(self.config)
+        self.metrics_server = MetricsServer(core.config_store.snapshot)
+        self.metrics_server.apply(self.config)
         self.displays = []
         self.sender_displays = []
+        self.displays_by_id: dict[str, dict] = {}
+        self.sender_displays_by_id: dict[str, dict] = {}
         self.is_running = False
         self.sender_is_running = False
-        self.pending_stream_starts: dict[str, float] = {}
         self.global_start_until: float | None = None
-
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.refresh_status)
+        # Start/stop run on core.control_executor; the GUI thread only keeps
+        # the futures and reacts when they resolve.
+        self.futures = _FutureBridge(self)
+        self._start_future: Future | None = None
+        self._stop_future: Future | None = None
+        self._start_cancel = threading.Event()
+        self._pending_streams: dict[str, str] = {}
+        self._sender_busy = False
+
+        self.core_events = _CoreEventBridge(self)
+        self.core_events.state_changed.connect(self.on_child_state_changed)
+
+        # Qt sees hotplug and geometry changes first; the core poll covers
+        # the rest. Bursts (one signal per screen) collapse into one probe.
+        self.screens_timer = QTimer(self)
+        self.screens_timer.setSingleShot(True)
+        self.screens_timer.setInterval(300)
+        self.screens_timer.timeout.connect(core.display_topology.refresh)
+        app = QApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(lambda _screen: self.screens_timer.start())
+        app.primaryScreenChanged.connect(lambda _screen: self.screens_timer.start())
+        for screen in app.screens():
+            screen.geometryChanged.connect(lambda _rect: self.screens_timer.start())
+        core.display_topology.watch()
+        core.display_reconciler.attach(core.config_store.snapshot)
+        # Warm the OMT directory so the picker opens with a current list.
+        omt_directory.start()
 
         self.autosave_timer = QTimer(self)
         self.autosave_timer.setSingleShot(True)
         self.autosave_timer.timeout.connect(self.save)
 
+        # Stats mode only: ffplay counters change without any process event.
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(1000)
+        self.stats_timer.timeout.connect(self.refresh_stats_badges)
+
         root = QWidget()
         self.setCentralWidget(root)
         layout = QVBoxLayout(root)
@@ -650,6 +1462,16 @@ class MainWindow(QMainWindow):
         self.btn_routing.clicked.connect(self.open_routing_dialog)
         displays_actions.addWidget(self.btn_routing)
 
+        self.btn_mosaics = QPushButton("🧩  Mosaïques")
+        self.btn_mosaics.setMinimumHeight(34)
+        self.btn_mosaics.clicked.connect(self.open_mosaic_dialog)
+        displays_actions.addWidget(self.btn_mosaics)
+
+        self.btn_walls = QPushButton("🧱  Murs d'images")
+        self.btn_walls.setMinimumHeight(34)
+        self.btn_walls.clicked.connect(self.open_wall_dialog)
+        displays_actions.addWidget(self.btn_walls)
+
         displays_layout.addLayout(displays_actions)
 
         # ── Routing status group ──
@@ -693,6 +1515,21 @@ class MainWindow(QMainWindow):
         rx_row.addWidget(self.receiver_decode_combo, stretch=1)
         prefs_layout.addLayout(rx_row)
 
+        self.receiver_stats_chk = QCheckBox("Stats lecteurs (pertes, dérive, files)")
+        self.receiver_stats_chk.setToolTip("Historique par flux des images perdues, de la dérive A-V et des files ffplay.")
+        self.receiver_stats_chk.setChecked(bool((self.config.get("receiver") or {}).get("stats", False)))
+        self.receiver_stats_chk.stateChanged.connect(self.on_receiver_changed)
+        prefs_layout.addWidget(self.receiver_stats_chk)
+
+        self.receiver_shared_chk = QCheckBox("Décodage partagé (même source sur plusieurs écrans)")
+        self.receiver_shared_chk.setToolTip(
+            "Les flux d'une même route ou source OMT sur des écrans contigus sont décodés une seule fois.\n"
+            "Pris en compte au prochain démarrage."
+        )
+        self.receiver_shared_chk.setChecked(bool((self.config.get("receiver") or {}).get("sharedDecode", False)))
+        self.receiver_shared_chk.stateChanged.connect(self.on_receiver_changed)
+        prefs_layout.addWidget(self.receiver_shared_chk)
+
         self.auto_start_receiver_chk = QCheckBox("Auto-start réception")
         self.auto_start_receiver_chk.setChecked(bool(self.config.get("autoStartReceiver", False)))
         self.auto_start_receiver_chk.stateChanged.connect(self.on_auto_start_changed)
@@ -872,8 +1709,7 @@ class MainWindow(QMainWindow):
         self.refresh_displays()
         self.reload_table()
         self.reload_sender_section()
-
-        self.timer.start(1000)
+        self._update_stats_timer()
 
         QTimer.singleShot(250, self.maybe_autostart)
 
@@ -889,13 +1725,20 @@ class MainWindow(QMainWindow):
         self.schedule_save()
 
     def open_routing_dialog(self):
+        # The dialog edits self.config in place; the file is written in the
+        # background, so it must not be re-read here.
         dlg = RoutingDialog(self)
         dlg.exec()
-        self.config = core.load_config()
         self.refresh_displays()
         self.reload_table()
         self.reload_sender_section()
 
+    def open_mosaic_dialog(self):
+        MosaicDialog(self).exec()
+
+    def open_wall_dialog(self):
+        WallDialog(self).exec()
+
     def open_config_directory(self):
         config_dir = CONFIG_PATH.parent
         try:
@@ -947,19 +1790,7 @@ class MainWindow(QMainWindow):
         rid = str(route_id or "").strip()
         if not rid:
             return None
-        for r in (self.config.get("routes") or []):
-            if isinstance(r, dict) and str(r.get("id") or "") == rid:
-                return r
-        return None
-
-    def _ensure_route_running(self, route_id: str) -> core.RouteLaunchResult:
-        rid = str(route_id or "").strip()
-        route = self._route_by_id(rid)
-        if not route:
-            return core.RouteLaunchResult(ok=False, reason="Route introuvable")
-        if core.route_manager.status().get(rid, False):
-            return core.RouteLaunchResult(ok=True)
-        return core.route_manager.start_route(route)
+        return next((r for r in self.config.get("routes") or [] if str(r.get("id")) == rid), None)
 
     def _stream_for_player(self, stream: dict) -> tuple[dict, str | None]:
         source = str(stream.get("source") or "srt").strip().lower()
@@ -979,22 +1810,7 @@ class MainWindow(QMainWindow):
         stream_for_player["udpPort"] = int(route.get("multicastPort") or 0)
         return (stream_for_player, None)
 
-    def _set_card_starting(self, row: int):
-        if row < 0 or row >= len(self.stream_cards):
-            return
-        card_info = self.stream_cards[row]
-        card_info["status_dot"].setObjectName("StatusDotStarting")
-        card_info["status_label"].setText("démarrage")
-        card_info["status_label"].setStyleSheet("color: #f59e0b; font-weight: 600;")
-        card_info["start_btn"].setEnabled(False)
-        card_info["status_dot"].style().unpolish(card_info["status_dot"])
-        card_info["status_dot"].style().polish(card_info["status_dot"])
-        card_info["card"].style().unpolish(card_info["card"])
-        card_info["card"].style().polish(card_info["card"])
-
     def maybe_autostart(self):
-        self.config = core.normalize_config(self.config)
-
         auto_rx = bool(self.config.get("autoStartReceiver"))
         auto_tx = bool(self.config.get("autoStartSender"))
         if not (auto_rx or auto_tx):
@@ -1073,6 +1889,7 @@ class MainWindow(QMainWindow):
             "- le mapping flux → écrans\n"
             "- les noms d'écrans personnalisés\n"
             "- les routes de routage\n"
+            "- les mosaïques et murs d'images\n"
             "- les paramètres d'émission\n\n"
             "Les lectures/émissions en cours seront arrêtées.",
             QMessageBox.Yes | QMessageBox.No,
@@ -1082,9 +1899,14 @@ class MainWindow(QMainWindow):
 
         self.stop_all()
 
-        for sid in list(core.player_manager.player_logs.keys()):
-            core.player_manager.clear_logs(sid)
-        self.pending_stream_starts.clear()
+        def _clear_logs(_future=None):
+            for sid in list(core.player_manager.player_logs.keys()):
+                core.player_manager.clear_logs(sid)
+
+        if self._stop_future is not None:
+            self.futures.watch(self._stop_future, _clear_logs)
+        else:
+            _clear_logs()
 
         self.config = {
             "streams": [],
@@ -1103,18 +1925,27 @@ class MainWindow(QMainWindow):
                 "referenceLevel": 1.0,
             },
         }
-        self.config = core.normalize_config(self.config)
+        self.config = core.config_store.commit(self.config)
 
         core.sender_manager.last_error = None
+        core.mosaic_manager.last_error.clear()
 
         self.exclude_primary.blockSignals(True)
         self.receiver_decode_combo.blockSignals(True)
+        self.receiver_stats_chk.blockSignals(True)
+        self.receiver_shared_chk.blockSignals(True)
         try:
             self.exclude_primary.setChecked(True)
             self.receiver_decode_combo.setCurrentIndex(self.receiver_decode_combo.findData("cpu"))
+            self.receiver_stats_chk.setChecked(False)
+            self.receiver_shared_chk.setChecked(False)
         finally:
             self.exclude_primary.blockSignals(False)
             self.receiver_decode_combo.blockSignals(False)
+            self.receiver_stats_chk.blockSignals(False)
+            self.receiver_shared_chk.blockSignals(False)
+        core.configure_player_stats(self.config)
+        self._update_stats_timer()
 
         self.auto_start_receiver_chk.blockSignals(True)
         self.auto_start_sender_chk.blockSignals(True)
@@ -1125,7 +1956,7 @@ class MainWindow(QMainWindow):
             self.auto_start_receiver_chk.blockSignals(False)
             self.auto_start_sender_chk.blockSignals(False)
 
-        core.save_config(self.config)
+        self.config = core.config_store.submit(self.config, delay=0)
 
         self.refresh_displays()
         self.reload_table()
@@ -1137,6 +1968,8 @@ class MainWindow(QMainWindow):
         overrides = self.config.get("displayNames", {})
         self.displays = core.get_displays(exclude_primary=exclude, name_overrides=overrides)
         self.sender_displays = core.get_displays(exclude_primary=False, name_overrides=overrides)
+        self.displays_by_id = core.index_by_id(self.displays)
+        self.sender_displays_by_id = core.index_by_id(self.sender_displays)
         self.render_displays()
         self.refresh_routes_status()
         self.reload_sender_section()
@@ -1201,10 +2034,23 @@ class MainWindow(QMainWindow):
     def on_receiver_changed(self, *_args):
         receiver = self.config.setdefault("receiver", {})
         receiver["decode"] = str(self.receiver_decode_combo.currentData() or "cpu")
+        receiver["stats"] = bool(self.receiver_stats_chk.isChecked())
+        receiver["sharedDecode"] = bool(self.receiver_shared_chk.isChecked())
+        core.configure_player_stats(self.config)
+        self._update_stats_timer()
         self.schedule_save()
 
+    def _update_stats_timer(self) -> None:
+        if core.player_manager.stats_enabled:
+            self.stats_timer.start()
+        else:
+            self.stats_timer.stop()
+        self.refresh_stats_badges()
+
     def update_sender_toggle_button(self, is_running: bool):
         self.sender_is_running = bool(is_running)
+        if self._sender_busy:
+            return
         if is_running:
             self.btn_sender_toggle.setText("⏹  Arrêter")
             self.btn_sender_toggle.setObjectName("DangerButton")
@@ -1219,7 +2065,7 @@ class MainWindow(QMainWindow):
         if running:
             self.sender_status_label.setText("▶ en cours")
             self.sender_status_label.setStyleSheet("color: #50fa7b;")
-            self.sender_status_label.setToolTip("")
+            self.sender_status_label.setToolTip(_format_progress(core.sender_manager.telemetry()))
             self.sender_chip.setText("📡 Émission: ▶")
             self.sender_chip.setObjectName("SenderChipRunning")
         else:
@@ -1237,9 +2083,10 @@ class MainWindow(QMainWindow):
         self.update_sender_toggle_button(running)
 
     def toggle_sender(self):
+        if self._sender_busy:
+            return
         if core.sender_manager.status():
-            core.sender_manager.stop()
-            self.refresh_sender_status()
+            self._track_sender(core.sender_manager.stop_async())
             return
 
         self.on_sender_changed()
@@ -1249,12 +2096,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Émission OMT", "Sélectionne un écran à émettre.")
             return
 
-        display = next((d for d in self.sender_displays if str(d.get("id")) == display_id), None)
+        display = self.sender_displays_by_id.get(display_id)
         if not display:
             QMessageBox.warning(self, "Émission OMT", "L'écran sélectionné n'est plus disponible.")
             return
 
-        result = core.sender_manager.start(
+        future = core.sender_manager.start_async(
             display,
             name=str(sender.get("name") or "SRT Multiview"),
             fps=int(sender.get("fps") or 30),
@@ -1262,11 +2109,24 @@ class MainWindow(QMainWindow):
             clock_output=bool(sender.get("clockOutput", False)),
             reference_level=float(sender.get("referenceLevel", 1.0)),
         )
-        if not result.ok:
+        self._track_sender(future)
+
+    def _track_sender(self, future: Future) -> None:
+        self._sender_busy = True
+        self.btn_sender_toggle.setText("⏳  En cours…")
+        self.btn_sender_toggle.setEnabled(False)
+        self.futures.watch(future, self._on_sender_toggled)
+
+    def _on_sender_toggled(self, future: Future) -> None:
+        self._sender_busy = False
+        self.btn_sender_toggle.setEnabled(True)
+        error = _future_error(future)
+        result = None if error else future.result()
+        if error or (result is not None and not result.ok):
             QMessageBox.warning(
                 self,
                 "Émission OMT",
-                "Impossible de démarrer l'émission.\n\n" + (result.reason or "Erreur inconnue."),
+                "Impossible de démarrer l'émission.\n\n" + (error or result.reason or "Erreur inconnue."),
             )
         self.refresh_sender_status()
 
@@ -1302,12 +2162,26 @@ class MainWindow(QMainWindow):
         status_label.setAlignment(Qt.AlignCenter)
         top_row.addWidget(status_label)
 
+        stats_badge = QLabel("")
+        stats_badge.setObjectName("Subtitle")
+        stats_badge.setVisible(False)
+        top_row.addWidget(stats_badge)
+
         start_btn = QPushButton("▶")
         start_btn.setFixedSize(30, 24)
         start_btn.setToolTip("Démarrer/arrêter ce flux")
         start_btn.clicked.connect(lambda checked=False, r=row: self.toggle_stream(r))
         top_row.addWidget(start_btn)
 
+        replace_btn = QPushButton("⟳")
+        replace_btn.setFixedSize(30, 24)
+        replace_btn.setToolTip(
+            "Appliquer les réglages sans coupure : le nouveau lecteur\n"
+            "remplace l'ancien dès sa première image."
+        )
+        replace_btn.clicked.connect(lambda checked=False, r=row: self.replace_stream(r))
+        top_row.addWidget(replace_btn)
+
         log_btn = QPushButton("📋")
         log_btn.setFixedSize(30, 24)
         log_btn.setToolTip("Voir la commande et les logs ffplay")
@@ -1336,6 +2210,7 @@ class MainWindow(QMainWindow):
         source_combo.addItem("SRT", "srt")
         source_combo.addItem("Route", "route")
         source_combo.addItem("OMT", "omt")
+        source_combo.addItem("Mire", "slate")
         source_combo.setFixedHeight(28)
         current_source = str(stream.get("source") or "srt").strip().lower()
         is_route_source = current_source == "route"
@@ -1424,11 +2299,30 @@ class MainWindow(QMainWindow):
         mute_chk.setToolTip("Couper l'audio de ce flux")
         mute_chk.stateChanged.connect(lambda _v, r=row: self._on_card_changed(r))
 
+        ingest_chk = QCheckBox("Relais")
+        ingest_chk.setChecked(bool(stream.get("keepIngest")))
+        ingest_chk.setToolTip(
+            "Garder la connexion SRT dans un processus séparé :\n"
+            "relancer le lecteur ne coupe plus l'encodeur."
+        )
+        ingest_chk.setEnabled(current_source == "srt")
+        ingest_chk.stateChanged.connect(lambda _v, r=row: self._on_card_changed(r))
+
         fields.addWidget(port_lbl, 1, 0)
         fields.addWidget(port_spin, 1, 1)
         fields.addWidget(lat_lbl, 1, 2)
         fields.addWidget(latency_spin, 1, 3)
-        fields.addWidget(mute_chk, 1, 4, 1, 2)
+        fields.addWidget(mute_chk, 1, 4)
+        fields.addWidget(ingest_chk, 1, 5)
+
+        switch_chk = QCheckBox("Commutation")
+        switch_chk.setChecked(bool(stream.get("switcher")))
+        switch_chk.setToolTip(
+            "Garder la fenêtre plein écran ouverte : changer de source\n"
+            "(SRT, OMT, route, mire) remplace seulement l'alimentation, sans flash."
+        )
+        switch_chk.stateChanged.connect(lambda _v, r=row: self._on_card_changed(r))
+        fields.addWidget(switch_chk, 1, 6)
 
         # ── Row 3: mode + rotation + screen ──
 
@@ -1509,6 +2403,8 @@ class MainWindow(QMainWindow):
             "port_spin": port_spin,
             "latency_spin": latency_spin,
             "mute_chk": mute_chk,
+            "ingest_chk": ingest_chk,
+            "switch_chk": switch_chk,
             "mode_combo": mode_combo,
             "rot_combo": rot_combo,
             "source_combo": source_combo,
@@ -1518,13 +2414,14 @@ class MainWindow(QMainWindow):
             "display_combo": display_combo,
             "status_dot": status_dot,
             "status_label": status_label,
+            "stats_badge": stats_badge,
             "start_btn": start_btn,
+            "replace_btn": replace_btn,
             "log_btn": log_btn,
             "stream_id": stream_id,
         }
 
     def toggle_stream(self, row: int):
-        self.config = core.normalize_config(self.config)
         streams = self.config.get("streams", [])
         if row < 0 or row >= len(streams):
             return
@@ -1532,17 +2429,19 @@ class MainWindow(QMainWindow):
             return
 
         self._update_config_from_card(row)
-        self.config = core.normalize_config(self.config)
-        core.save_config(self.config)
+        self.config = core.config_store.submit(self.config)
 
         stream = self.config.get("streams", [])[row]
         stream_id = str(stream.get("id"))
+        queued = core.launch_scheduler.position(f"player:{stream_id}") is not None
+        if stream_id in self._pending_streams and not queued:
+            return
         running = bool(core.player_manager.status().get(stream_id, False))
+        running = running or queued or core.player_manager.restart_pending(stream_id)
+        running = running or stream_id in core.player_manager.parked
 
         if running:
-            self.pending_stream_starts.pop(stream_id, None)
-            core.player_manager.stop_player(stream_id)
-            self.refresh_status()
+            self._track_stream(stream_id, "stop", core.player_manager.stop_player_async(stream_id))
             return
 
         display_id = str((self.config.get("mapping", {}) or {}).get(stream_id) or "")
@@ -1550,43 +2449,60 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Démarrage flux", "Assigne un écran à ce flux avant de le démarrer.")
             return
 
-        display = next((d for d in self.displays if str(d.get("id")) == display_id), None)
+        display = self.displays_by_id.get(display_id)
         if not display:
             QMessageBox.warning(self, "Démarrage flux", "L'écran assigné n'est plus disponible.")
             return
 
-        source = str(stream.get("source") or "srt").strip().lower()
-        startup_seconds = 0.8
-        if source == "route":
-            startup_seconds = 3.5
-            rid = str(stream.get("sourceRouteId") or "").strip()
-            result = self._ensure_route_running(rid)
-            if not result.ok:
-                QMessageBox.warning(self, "Démarrage flux", "Impossible de démarrer la route.\n\n" + (result.reason or "Erreur inconnue."))
-                return
-
-        stream_for_player, err = self._stream_for_player(stream)
+        _stream_for_player, err = self._stream_for_player(stream)
         if err:
             QMessageBox.warning(self, "Démarrage flux", err)
             return
 
-        if str(stream_for_player.get("source") or "").strip().lower() == "udp":
-            startup_seconds = max(startup_seconds, 3.5)
+        # start_all() brings the route up (and waits for its packets) first.
+        future = core.run_in_control(core.start_all, core.config_store.snapshot(), stream_ids={stream_id})
+        self._track_stream(stream_id, "start", future)
 
-        self.pending_stream_starts[stream_id] = time.monotonic() + float(startup_seconds)
-        self._set_card_starting(row)
-
-        hwaccel = str((self.config.get("receiver") or {}).get("decode") or "cpu").strip().lower()
-        if hwaccel == "gpu":
-            hwaccel = "auto"
-        if hwaccel not in {"cpu", "auto", "dxva2", "h264_amf", "h264_cuvid", "h264_qsv"}:
-            hwaccel = "cpu"
-
-        result = core.player_manager.start_player(stream_for_player, display, hwaccel=hwaccel)
-        if not result.ok:
-            self.pending_stream_starts.pop(stream_id, None)
-            QMessageBox.warning(self, "Démarrage flux", "Impossible de démarrer le flux.\n\n" + (result.reason or "Erreur inconnue."))
-        self.refresh_status()
+    def replace_stream(self, row: int):
+        """Relaunch a running stream with its current card settings, make-before-break."""
+        if row < 0 or row >= len(self.stream_cards) or row >= len(self.config.get("streams", [])):
+            return
+        self._update_config_from_card(row)
+        self.config = core.config_store.submit(self.config)
+        stream_id = str(self.config["streams"][row].get("id"))
+        if stream_id in self._pending_streams:
+            return
+        if not core.player_manager.status().get(stream_id):
+            self.toggle_stream(row)
+            return
+        future = core.run_in_control(
+            core.start_all, core.config_store.snapshot(), stream_ids={stream_id}, replace=True
+        )
+        self._track_stream(stream_id, "replace", future)
+
+    def _track_stream(self, stream_id: str, action: str, future: Future) -> None:
+        self._pending_streams[stream_id] = action
+        self.refresh_stream_card(stream_id)
+        self.futures.watch(future, lambda f: self._on_stream_toggled(stream_id, action, f))
+
+    def _on_stream_toggled(self, stream_id: str, action: str, future: Future) -> None:
+        if self._pending_streams.get(stream_id) == action:
+            self._pending_streams.pop(stream_id, None)
+        self.refresh_stream_card(stream_id)
+        error = _future_error(future)
+        if action == "stop":
+            if error:
+                QMessageBox.warning(self, "Arrêt flux", "Impossible d'arrêter le flux.\n\n" + error)
+            return
+        result = None if error else future.result().get(stream_id)
+        if error or (result is not None and not result.ok and result.reason != "CANCELLED"):
+            reason = error or result.reason or "Erreur inconnue."
+            if reason == "NO_DISPLAY":
+                reason = "L'écran assigné n'est plus disponible."
+            if action == "replace":
+                QMessageBox.warning(self, "Remplacement flux", "Impossible d'appliquer les réglages.\n\n" + reason)
+                return
+            QMessageBox.warning(self, "Démarrage flux", "Impossible de démarrer le flux.\n\n" + reason)
 
     def show_stream_log(self, row: int):
         streams = self.config.get("streams", [])
@@ -1602,14 +2518,38 @@ class MainWindow(QMainWindow):
         stderr_lines = info.get("stderr") or []
         launch_error = str(info.get("launch_error") or "").strip()
         command_text = str(info.get("command_text") or "").strip()
+        feed = core.feeder_manager.debug_info(stream_id)
+        feed_text = ""
+        if feed.get("command_text") or feed.get("last_error"):
+            feed_text = "\n".join(
+                [
+                    f"Alimentation (commutation): PID {feed.get('pid') or '—'}"
+                    + (f" — {feed['last_error']}" if feed.get("last_error") else ""),
+                    str(feed.get("command_text") or "—"),
+                    *(str(line) for line in feed.get("stderr") or []),
+                ]
+            )
         debug_text = "\n\n".join(
             [
                 f"Binaire: {info.get('path') or ''}",
                 f"PID: {info.get('pid') or '—'}",
                 f"En cours: {'oui' if info.get('running') else 'non'}",
                 f"Code retour: {info.get('returncode') if info.get('returncode') is not None else '—'}",
+                f"Redémarrages auto: {info.get('restarts') or 0}"
+                + (" (disjoncteur ouvert)" if info.get("circuit_open") else "")
+                + (
+                    f" — prochaine tentative dans {float(info['next_restart_in']):.1f}s"
+                    if info.get("next_restart_in") is not None
+                    else ""
+                ),
+                f"Dernier code de sortie: {info.get('last_exit_code') if info.get('last_exit_code') is not None else '—'}",
+                f"Image figée: {'oui, depuis ' + format(float(info['stalled_for']), '.0f') + 's' if info.get('stalled') else 'non'}"
+                + f" ({int(info.get('stalls') or 0)} détection(s))",
+                "Démarrage: " + _format_startup(info),
+                "Stats: " + _format_stats((info.get("stats") or {}).get("summary"), info.get("stats")),
                 "Commande:",
                 command_text or "—",
+                feed_text,
                 "Erreur de lancement:" if launch_error else "",
                 launch_error,
                 "stderr:",
@@ -1646,7 +2586,6 @@ class MainWindow(QMainWindow):
         dlg.exec()
 
     def reload_table(self):
-        self.config = core.normalize_config(self.config)
         streams = self.config.get("streams", [])
 
         # Clear existing cards
@@ -1712,6 +2651,7 @@ class MainWindow(QMainWindow):
         card["omt_btn"].setEnabled(source == "omt")
         card["port_spin"].setEnabled(source == "srt")
         card["latency_spin"].setEnabled(source == "srt")
+        card["ingest_chk"].setEnabled(source == "srt")
         if source != "route":
             card["route_combo"].setCurrentIndex(0)
         if source != "omt":
@@ -1743,9 +2683,10 @@ class MainWindow(QMainWindow):
         )
         if reply != QMessageBox.Yes:
             return
-        core.player_manager.stop_player(stream_id)
-        core.player_manager.clear_logs(stream_id)
-        self.pending_stream_starts.pop(stream_id, None)
+        self.futures.watch(
+            core.player_manager.stop_player_async(stream_id),
+            lambda _f: core.player_manager.clear_logs(stream_id),
+        )
         streams.pop(row)
         self.config.get("mapping", {}).pop(stream_id, None)
         self.reload_table()
@@ -1767,6 +2708,8 @@ class MainWindow(QMainWindow):
         stream["port"] = int(card["port_spin"].value())
         stream["latency"] = int(card["latency_spin"].value())
         stream["muteAudio"] = bool(card["mute_chk"].isChecked())
+        stream["keepIngest"] = bool(card["ingest_chk"].isChecked())
+        stream["switcher"] = bool(card["switch_chk"].isChecked())
         stream["displayMode"] = str(card["mode_combo"].currentData() or "fit")
         stream["rotate"] = int(card["rot_combo"].currentData() or 0)
 
@@ -1787,11 +2730,18 @@ class MainWindow(QMainWindow):
             mapping.pop(stream_id, None)
 
     def save(self):
-        for row in range(len(self.stream_cards)):
-            self._update_config_from_card(row)
-
-        self.config = core.normalize_config(self.config)
-        core.save_config(self.config)
+        # Cards push their own edits (_on_card_changed); the store skips the
+        # write when nothing changed and coalesces bursts off the GUI thread.
+        self.config = core.config_store.submit(self.config)
+        core.configure_supervisor(self.config)
+        core.configure_watchdog(self.config)
+        core.configure_player_stats(self.config)
+        self.metrics_server.apply(self.config)
+        if any(route_id.startswith("ingest:") for route_id in core.route_manager.launched):
+            core.run_in_control(core.prune_ingests, core.config_store.snapshot())
+        # Running switcher streams pick up source edits right away.
+        if core.feeder_manager.procs or any(s.get("switcher") for s in self.config["streams"]):
+            core.run_in_control(core.switch_sources, core.config_store.snapshot())
 
     def check_duplicate_ports(self) -> list[int]:
         streams = self.config.get("streams", [])
@@ -1805,14 +2755,13 @@ class MainWindow(QMainWindow):
         return list(duplicates)
 
     def start_all(self):
+        if self._start_future is not None or self._stop_future is not None:
+            return
         self.save()
 
-        streams = self.config.get("streams", [])
-        needs_udp_startup = any(
-            isinstance(s, dict) and str(s.get("source") or "srt").strip().lower() == "route" for s in (streams or [])
-        )
-        startup_seconds = 3.5 if needs_udp_startup else 1.0
-        self.global_start_until = time.monotonic() + float(startup_seconds)
+        # Routes and players are brought up in the background; the header
+        # stays in "Annuler" mode until the orchestrator reports back.
+        self.global_start_until = float("inf")
         self.btn_toggle.setText("⏹  Annuler")
         self.btn_toggle.setObjectName("DangerButton")
         self.btn_toggle.setEnabled(True)
@@ -1829,33 +2778,31 @@ class MainWindow(QMainWindow):
                 + "\n\nCela peut causer des conflits.",
             )
 
-        routes_needed: set[str] = set()
-        for s in (self.config.get("streams") or []):
-            if not isinstance(s, dict):
-                continue
-            if str(s.get("source") or "srt").strip().lower() != "route":
-                continue
-            rid = str(s.get("sourceRouteId") or "").strip()
-            if rid:
-                routes_needed.add(rid)
-
-        if routes_needed:
-            routes_by_id = {str(r.get("id")): r for r in (self.config.get("routes") or []) if isinstance(r, dict)}
-            running_routes = core.route_manager.status()
-            for rid in sorted(routes_needed):
-                if running_routes.get(rid, False):
-                    continue
-                route = routes_by_id.get(rid)
-                if not route:
-                    continue
-                self._ensure_route_running(rid)
-
-        results = core.apply_mapping(self.config)
+        self._start_cancel = threading.Event()
+        self._start_future = core.run_in_control(
+            core.start_all, core.config_store.snapshot(), cancel=self._start_cancel
+        )
+        self.futures.watch(self._start_future, self._on_start_all_finished)
+
+    def _on_start_all_finished(self, future: Future):
+        self._start_future = None
+        error = _future_error(future)
+        results = {"": core.PlayerLaunchResult(ok=False, reason=error)} if error else future.result()
+        if self._start_cancel.is_set():
+            self.global_start_until = None
+            self.refresh_status()
+            return
+
+        self.global_start_until = time.monotonic() + 1.0
+        QTimer.singleShot(1050, self.refresh_status)
+
         stream_name_by_id = {str(s.get("id")): str(s.get("name") or s.get("id")) for s in self.config.get("streams", [])}
+        for wall in self.config.get("walls", []):
+            stream_name_by_id[core.wall_player_id(str(wall.get("id")))] = f"Mur {wall.get('name') or wall.get('id')}"
         failures = [
             f"{stream_name_by_id.get(str(sid), str(sid))} — {(res.reason or 'Erreur inconnue.') }"
             for sid, res in results.items()
-            if not res.ok and res.reason != "NO_DISPLAY"
+            if not res.ok and res.reason not in {"NO_DISPLAY", "CANCELLED"}
         ]
         self.refresh_status()
 
@@ -1866,19 +2813,29 @@ class MainWindow(QMainWindow):
                 "Certains flux n'ont pas démarré (pas d'écran assigné, ou ffplay manquant).\n\n"
                 + "\n".join(failures),
             )
-        status = core.player_manager.status()
-        self.update_toggle_button(any(status.values()))
 
     def stop_all(self):
+        if self._stop_future is not None:
+            return
+        # Non-blocking: the stop waits (off-thread) for a cancelled start to
+        # unwind, then stops every child; cards update as each one exits.
+        self._start_cancel.set()
         self.global_start_until = None
-        core.player_manager.stop_all()
-        core.sender_manager.stop()
-        core.route_manager.stop_all()
+        self._stop_future = core.stop_all_children_async(after=self._start_future)
+        self.btn_toggle.setText("⏳  Arrêt…")
+        self.btn_toggle.setEnabled(False)
+        self.futures.watch(self._stop_future, self._on_stop_all_finished)
+
+    def _on_stop_all_finished(self, future: Future):
+        self._stop_future = None
+        error = _future_error(future)
         self.refresh_status()
-        self.refresh_sender_status()
-        self.update_toggle_button(False)
+        if error:
+            QMessageBox.warning(self, "Arrêt", "Arrêt incomplet.\n\n" + error)
 
     def toggle_start_stop(self):
+        if self._stop_future is not None:
+            return
         if self.global_start_until is not None:
             self.stop_all()
             return
@@ -1899,58 +2856,113 @@ class MainWindow(QMainWindow):
         self.btn_toggle.style().unpolish(self.btn_toggle)
         self.btn_toggle.style().polish(self.btn_toggle)
 
-    def refresh_status(self):
-        status = core.player_manager.status()
-        streams = self.config.get("streams", [])
-
-        now = time.monotonic()
+    def _apply_card_state(self, card_info: dict, stream_id: str, running: bool, now: float) -> None:
+        pending = self._pending_streams.get(stream_id)
+        position = None if running else core.launch_scheduler.position(f"player:{stream_id}")
+        if position is not None and pending != "stop":
+            card_info["status_dot"].setObjectName("StatusDotStarting")
+            card_info["status_label"].setText(f"en file ({position})")
+            card_info["status_label"].setStyleSheet("color: #f59e0b; font-weight: 600;")
+            card_info["card"].setObjectName("StreamCard")
+            card_info["start_btn"].setText("⏹")
+            card_info["start_btn"].setObjectName("DangerButton")
+            card_info["start_btn"].setEnabled(True)
+        elif pending is not None:
+            card_info["status_dot"].setObjectName("StatusDotStarting")
+            card_info["status_label"].setText({"stop": "arrêt…", "replace": "bascule…"}.get(pending, "démarrage"))
+            card_info["status_label"].setStyleSheet("color: #f59e0b; font-weight: 600;")
+            card_info["card"].setObjectName("StreamCard")
+            card_info["start_btn"].setText("⏳")
+            card_info["start_btn"].setObjectName("DangerButton" if pending == "stop" else "SuccessButton")
+            card_info["start_btn"].setEnabled(False)
+        # "démarrage" lasts until ffplay reports its first presented frame.
+        elif running and not core.player_manager.is_ready(stream_id):
+            card_info["status_dot"].setObjectName("StatusDotStarting")
+            card_info["status_label"].setText("démarrage")
+            card_info["status_label"].setStyleSheet("color: #f59e0b; font-weight: 600;")
+            card_info["card"].setObjectName("StreamCard")
+            card_info["start_btn"].setText("⏹")
+            card_info["start_btn"].setObjectName("DangerButton")
+            card_info["start_btn"].setEnabled(True)
+        elif running and core.player_manager.is_stalled(stream_id):
+            card_info["status_dot"].setObjectName("StatusDotStopped")
+            card_info["status_label"].setText("figé")
+            card_info["status_label"].setStyleSheet("color: #ff5555; font-weight: 600;")
+            card_info["card"].setObjectName("StreamCard")
+            card_info["start_btn"].setText("⏹")
+            card_info["start_btn"].setObjectName("DangerButton")
+            card_info["start_btn"].setEnabled(True)
+        elif not running and core.player_manager.restart_pending(stream_id):
+            card_info["status_dot"].setObjectName("StatusDotStarting")
+            card_info["status_label"].setText("relance")
+            card_info["status_label"].setStyleSheet("color: #f59e0b; font-weight: 600;")
+            card_info["card"].setObjectName("StreamCard")
+            card_info["start_btn"].setText("⏹")
+            card_info["start_btn"].setObjectName("DangerButton")
+            card_info["start_btn"].setEnabled(True)
+        # Display unplugged: restarts by itself when it comes back.
+        elif not running and stream_id in core.player_manager.parked:
+            card_info["status_dot"].setObjectName("StatusDotStarting")
+            card_info["status_label"].setText("attente écran")
+            card_info["status_label"].setStyleSheet("color: #f59e0b; font-weight: 600;")
+            card_info["card"].setObjectName("StreamCard")
+            card_info["start_btn"].setText("⏹")
+            card_info["start_btn"].setObjectName("DangerButton")
+            card_info["start_btn"].setEnabled(True)
+        elif running:
+            card_info["status_dot"].setObjectName("StatusDotRunning")
+            card_info["status_label"].setText("en cours")
+            card_info["status_label"].setStyleSheet("color: #50fa7b; font-weight: 600;")
+            card_info["card"].setObjectName("StreamCardRunning")
+            card_info["start_btn"].setText("⏹")
+            card_info["start_btn"].setObjectName("DangerButton")
+            card_info["start_btn"].setEnabled(True)
+        else:
+            card_info["status_dot"].setObjectName("StatusDotStopped")
+            # The ingest keeper may still hold the SRT link with the encoder.
+            relayed = core.route_manager.status().get(f"ingest:{stream_id}")
+            card_info["status_label"].setText("arrêté (relais actif)" if relayed else "arrêté")
+            card_info["status_label"].setStyleSheet("color: #64748b;")
+            card_info["card"].setObjectName("StreamCard")
+            card_info["start_btn"].setText("▶")
+            card_info["start_btn"].setObjectName("SuccessButton")
+            card_info["start_btn"].setEnabled(True)
+
+        self._apply_stats_badge(card_info, stream_id)
 
-        for row, stream in enumerate(streams):
-            if row >= len(self.stream_cards):
-                break
-            stream_id = str(stream.get("id"))
-            running = status.get(stream_id, False)
-            card_info = self.stream_cards[row]
-
-            pending_until = self.pending_stream_starts.get(stream_id)
-            is_starting = bool(pending_until and now < float(pending_until))
-            if pending_until and not is_starting:
-                self.pending_stream_starts.pop(stream_id, None)
-
-            if is_starting:
-                card_info["status_dot"].setObjectName("StatusDotStarting")
-                card_info["status_label"].setText("démarrage")
-                card_info["status_label"].setStyleSheet("color: #f59e0b; font-weight: 600;")
-                card_info["card"].setObjectName("StreamCard")
-                card_info["start_btn"].setText("…")
-                card_info["start_btn"].setObjectName("PrimaryButton")
-                card_info["start_btn"].setEnabled(False)
-            elif running:
-                card_info["status_dot"].setObjectName("StatusDotRunning")
-                card_info["status_label"].setText("en cours")
-                card_info["status_label"].setStyleSheet("color: #50fa7b; font-weight: 600;")
-                card_info["card"].setObjectName("StreamCardRunning")
-                card_info["start_btn"].setText("⏹")
-                card_info["start_btn"].setObjectName("DangerButton")
-                card_info["start_btn"].setEnabled(True)
-            else:
-                card_info["status_dot"].setObjectName("StatusDotStopped")
-                card_info["status_label"].setText("arrêté")
-                card_info["status_label"].setStyleSheet("color: #64748b;")
-                card_info["card"].setObjectName("StreamCard")
-                card_info["start_btn"].setText("▶")
-                card_info["start_btn"].setObjectName("SuccessButton")
-                card_info["start_btn"].setEnabled(True)
-
-            card_info["status_dot"].style().unpolish(card_info["status_dot"])
-            card_info["status_dot"].style().polish(card_info["status_dot"])
-            card_info["card"].style().unpolish(card_info["card"])
-            card_info["card"].style().polish(card_info["card"])
-            card_info["start_btn"].style().unpolish(card_info["start_btn"])
-            card_info["start_btn"].style().polish(card_info["start_btn"])
+        card_info["status_dot"].style().unpolish(card_info["status_dot"])
+        card_info["status_dot"].style().polish(card_info["status_dot"])
+        card_info["card"].style().unpolish(card_info["card"])
+        card_info["card"].style().polish(card_info["card"])
+        card_info["start_btn"].style().unpolish(card_info["start_btn"])
+        card_info["start_btn"].style().polish(card_info["start_btn"])
+
+    def _apply_stats_badge(self, card_info: dict, stream_id: str) -> None:
+        badge = card_info["stats_badge"]
+        summary = core.player_manager.stats_summary(stream_id)
+        if summary is None:
+            badge.setVisible(False)
+            return
+        drift = summary.get("drift")
+        drops_per_min = float(summary.get("drops_per_min") or 0.0)
+        text = f"⬇ {drops_per_min:.0f}/min"
+        if drift is not None:
+            text += f" · Δ {drift:+.2f}s"
+        lagging = drops_per_min >= STATS_DROPS_WARN_PER_MIN or abs(drift or 0.0) >= STATS_DRIFT_WARN_SECONDS
+        badge.setText(("⚠ " if lagging else "") + text)
+        badge.setStyleSheet("color: #f59e0b; font-weight: 600;" if lagging else "color: #64748b;")
+        badge.setToolTip(_format_stats(summary))
+        badge.setVisible(True)
+
+    def refresh_stats_badges(self) -> None:
+        for card_info in self.stream_cards:
+            self._apply_stats_badge(card_info, card_info["stream_id"])
 
+    def _update_global_state(self, status: dict[str, bool], now: float) -> None:
         self.update_header_chips(status)
-        any_running = any(status.values())
+        if self._stop_future is not None:
+            return
+        any_running = any(status.values()) or any(core.mosaic_manager.status().values())
         if any_running:
             self.global_start_until = None
         if self.global_start_until is not None and not any_running and now < float(self.global_start_until):
@@ -1963,6 +2975,49 @@ class MainWindow(QMainWindow):
             if self.global_start_until is not None and not any_running:
                 self.global_start_until = None
             self.update_toggle_button(any_running)
+
+    def refresh_stream_card(self, stream_id: str):
+        """Restyle only the card of ``stream_id`` and the global header state."""
+        status = core.player_manager.status()
+        now = time.monotonic()
+        for card_info in self.stream_cards:
+            if card_info.get("stream_id") == stream_id:
+                self._apply_card_state(card_info, stream_id, bool(status.get(stream_id, False)), now)
+                break
+        self._update_global_state(status, now)
+
+    def _on_screen_added(self, screen):
+        screen.geometryChanged.connect(lambda _rect: self.screens_timer.start())
+        self.screens_timer.start()
+
+    def on_child_state_changed(self, kind: str, child_id: str, _running: bool):
+        if kind == "displays":
+            self.refresh_displays()
+            self.reload_table()
+        elif kind in {"player", "queue"}:
+            self.refresh_stream_card(child_id)
+        elif kind == "sender":
+            self.refresh_sender_status()
+        elif kind == "route":
+            self.refresh_routes_status()
+            if child_id.startswith("ingest:"):
+                self.refresh_stream_card(child_id.partition(":")[2])
+        elif kind == "mosaic":
+            self._update_global_state(core.player_manager.status(), time.monotonic())
+
+    def refresh_status(self):
+        status = core.player_manager.status()
+        streams = self.config.get("streams", [])
+
+        now = time.monotonic()
+
+        for row, stream in enumerate(streams):
+            if row >= len(self.stream_cards):
+                break
+            stream_id = str(stream.get("id"))
+            self._apply_card_state(self.stream_cards[row], stream_id, bool(status.get(stream_id, False)), now)
+
+        self._update_global_state(status, now)
         self.refresh_sender_status()
         self.refresh_routes_status()
 
@@ -1982,7 +3037,7 @@ class MainWindow(QMainWindow):
         stream_id = f"stream-{uuid.uuid4().hex[:12]}"
         port = self._next_free_srt_port(9000 + next_index)
         self.config.setdefault("streams", []).append(
-            {"id": stream_id, "name": f"Flux {next_index}", "port": port, "latency": 120}
+            core.StreamConfig.from_dict({"id": stream_id, "name": f"Flux {next_index}", "port": port}).to_dict()
         )
         self.reload_table()
         self.schedule_save()
@@ -2007,7 +3062,6 @@ class MainWindow(QMainWindow):
             self.displays_list.addItem(item)
 
     def auto_map_streams(self):
-        self.config = core.normalize_config(self.config)
         streams = self.config.get("streams", [])
 
         displays = list(self.displays)
@@ -2030,10 +3084,10 @@ class MainWindow(QMainWindow):
             for i in range(start_index, target_count):
                 stream_id = f"stream-{uuid.uuid4().hex[:12]}"
                 port = _next_free_port(9000 + i + 1)
-                streams.append({"id": stream_id, "name": f"Flux {i + 1}", "port": port, "latency": 120})
+                stream = core.StreamConfig.from_dict({"id": stream_id, "name": f"Flux {i + 1}", "port": port})
+                streams.append(stream.to_dict())
 
             self.config["streams"] = streams
-            self.config = core.normalize_config(self.config)
 
         display_ids = [str(d.get("id")) for d in displays]
         mapping = self.config.setdefault("mapping", {})
@@ -2123,12 +3177,25 @@ class MainWindow(QMainWindow):
         if self.autosave_timer.isActive():
             self.autosave_timer.stop()
         try:
+            # Text typed without leaving the field never fired editingFinished.
+            for row in range(len(self.stream_cards)):
+                self._update_config_from_card(row)
             self.save()
+            core.config_store.flush()
+        except Exception:
+            pass
+        core.display_reconciler.detach()
+        omt_directory.stop()
+        self.core_events.close()
+        self.metrics_server.stop()
+        self._start_cancel.set()
+        # Children must be gone before the app exits; the window is closing anyway.
+        self.hide()
+        stop = self._stop_future or core.stop_all_children_async(after=self._start_future)
+        try:
+            stop.result()
         except Exception:
             pass
-        core.player_manager.stop_all()
-        core.sender_manager.stop()
-        core.route_manager.stop_all()
         event.accept()
 
 
@@ -0,0 +1,8 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Keep the tests away from the user's real config.json: paths.py reads this at import.
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="srt-multiview-tests-")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,92 @@
+import json
+
+from srt_multiview import core
+
+
+def test_from_dict_validates_fields():
+    model = core.ConfigModel.from_dict(
+        {
+            "displayIdSchemaVersion": core.DISPLAY_ID_SCHEMA_VERSION,
+            "streams": [
+                {"id": "a", "port": "x", "rotate": 45, "source": "ROUTE", "displayMode": "FILL"},
+                "junk",
+                {"name": ""},
+            ],
+            "routes": [{"id": "", "multicastAddr": "  ", "ttl": "2"}],
+            "sender": {"fps": 500, "pixelFormat": "BGRA", "host": "legacy"},
+            "receiver": {"decode": "gpu", "maxConcurrentStarts": "1000", "launchSettle": -2},
+        }
+    )
+    first, second = model.streams
+    assert (first.port, first.rotate, first.source, first.display_mode) == (9001, 0, "route", "fill")
+    assert second.id == "stream-3" and second.name == "stream-3"
+    route = model.routes[0]
+    assert (route.id, route.multicast_addr, route.ttl) == ("route-1", "239.10.10.10", 2)
+    assert (model.sender.fps, model.sender.pixel_format, model.sender.extra) == (60, "bgra", {})
+    assert model.receiver.decode == "auto"
+    assert model.receiver.max_concurrent_starts == 64
+    assert model.receiver.launch_settle == 0.0
+
+
+def test_indexes_by_id():
+    model = core.ConfigModel.from_dict(
+        {"streams": [{"id": "a"}, {"id": "b"}], "routes": [{"id": "r1"}], "walls": [{"id": "w1"}]}
+    )
+    assert model.streams_by_id["b"] is model.streams[1]
+    assert model.routes_by_id["r1"].id == "r1"
+    assert set(model.walls_by_id) == {"w1"}
+
+
+def test_round_trip_keeps_unknown_keys_and_is_idempotent():
+    config = {
+        "displayIdSchemaVersion": core.DISPLAY_ID_SCHEMA_VERSION,
+        "streams": [{"id": "a", "port": 9001, "future": {"k": 1}}],
+        "mapping": {"a": "d1", "b": None},
+        "custom": [1, 2],
+    }
+    normalized = core.normalize_config(config)
+    assert normalized["streams"][0]["future"] == {"k": 1}
+    assert normalized["custom"] == [1, 2]
+    assert normalized["mapping"] == {"a": "d1"}
+    again = core.normalize_config(json.loads(json.dumps(normalized)))
+    assert json.dumps(again, sort_keys=True) == json.dumps(normalized, sort_keys=True)
+
+
+def test_old_display_schema_resets_bindings():
+    normalized = core.normalize_config(
+        {"displayIdSchemaVersion": 1, "mapping": {"a": "b"}, "displayNames": {"x": "y"}, "sender": {"displayId": "q"}}
+    )
+    assert normalized["mapping"] == {}
+    assert normalized["displayNames"] == {}
+    assert normalized["sender"]["displayId"] == ""
+
+
+def test_route_idle_timeout_zero_means_never():
+    assert core.RouteConfig.from_dict({"id": "r"}).idle_timeout == core.ROUTE_IDLE_TIMEOUT
+    assert core.RouteConfig.from_dict({"id": "r", "idleTimeout": 0}).idle_timeout == 0
+    assert core.RouteConfig.from_dict({"id": "r", "idleTimeout": -5}).idle_timeout == 0
+
+
+def test_as_int():
+    assert core._as_int("12", 3) == 12
+    assert core._as_int(None, 3) == 3
+    assert core._as_int("x", 3) == 3
+    assert core._as_int(0, 3) == 3
+
+
+def test_store_commit_keeps_model_apart_from_caller_dicts(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "CONFIG_PATH", tmp_path / "config.json")
+    store = core.ConfigStore(delay=0)
+    config = store.submit({"streams": [{"id": "a", "name": "A"}], "watchdog": {"enabled": False}})
+    assert store.model.streams_by_id["a"].name == "A"
+
+    config["streams"][0]["name"] = "edited"
+    config["watchdog"]["enabled"] = True
+    snapshot = store.snapshot()
+    assert snapshot["streams"][0]["name"] == "A"
+    assert snapshot["watchdog"]["enabled"] is False
+
+    assert store.flush(timeout=5)
+    on_disk = json.loads((tmp_path / "config.json").read_text(encoding="utf-8"))
+    assert on_disk["streams"][0]["name"] == "A"
+    assert store.dirty_sections() == []
@@ -0,0 +1,160 @@
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from srt_multiview import discovery
+from srt_multiview.discovery import TYPE_A, TYPE_PTR, TYPE_SRV, TYPE_TXT, SourceDirectory, build_query, parse_message
+
+SERVICE = "_omt._tcp.local."
+INSTANCE = "STUDIO (Cam 1)._omt._tcp.local."
+HOST = "studio.local."
+
+
+def _record(name: str, rtype: int, ttl: int, rdata: bytes, *, cache_flush: bool = False) -> bytes:
+    rclass = discovery.CLASS_IN | (discovery.CLASS_CACHE_FLUSH if cache_flush else 0)
+    return discovery._encode_name(name) + struct.pack("!2HIH", rtype, rclass, ttl, len(rdata)) + rdata
+
+
+def _response(ttl: int = 120, *, port: int = 6400) -> bytes:
+    answers = [
+        _record(SERVICE, TYPE_PTR, ttl, discovery._encode_name(INSTANCE)),
+        _record(INSTANCE, TYPE_SRV, ttl, struct.pack("!3H", 0, 0, port) + discovery._encode_name(HOST), cache_flush=True),
+        _record(INSTANCE, TYPE_TXT, ttl, b"\x09codec=vmx"),
+        _record(HOST, TYPE_A, ttl, socket.inet_aton("10.0.0.7"), cache_flush=True),
+    ]
+    return struct.pack("!6H", 0, 0x8400, 0, len(answers), 0, 0) + b"".join(answers)
+
+
+def test_parse_message_reads_ptr_srv_txt_and_a():
+    records = {record.rtype: record for record in parse_message(_response(ttl=90))}
+    assert records[TYPE_PTR].name == SERVICE.lower()
+    assert records[TYPE_PTR].data == INSTANCE
+    assert records[TYPE_SRV].data == (HOST, 6400)
+    assert records[TYPE_TXT].data == {"codec": "vmx"}
+    assert records[TYPE_A].name == HOST and records[TYPE_A].data == "10.0.0.7"
+    assert {record.ttl for record in records.values()} == {90}
+
+
+def test_parse_message_follows_compression_pointers():
+    header = struct.pack("!6H", 0, 0x8400, 0, 1, 0, 0)
+    service = discovery._encode_name(SERVICE)
+    # The PTR target is "STUDIO (Cam 1)" + pointer to the owner name at offset 12.
+    rdata = bytes([14]) + b"STUDIO (Cam 1)" + struct.pack("!H", 0xC000 | 12)
+    packet = header + service + struct.pack("!2HIH", TYPE_PTR, discovery.CLASS_IN, 60, len(rdata)) + rdata
+    (record,) = parse_message(packet)
+    assert record.data == INSTANCE
+
+
+def test_parse_message_ignores_queries_and_rejects_short_packets():
+    assert parse_message(build_query(SERVICE)) == []
+    with pytest.raises(ValueError):
+        parse_message(b"\x00" * 5)
+
+
+class _Responder:
+    """Answers browse queries for one instance on the test group."""
+
+    def __init__(self, group: str, port: int, ttl: int):
+        self.group, self.port, self.ttl = group, port, ttl
+        self.answering = True
+        self.queries = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.sock.bind(("", port))
+        loopback = socket.inet_aton("127.0.0.1")
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, socket.inet_aton(group) + loopback)
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, loopback)
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+        self.sock.settimeout(0.1)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                data, _addr = self.sock.recvfrom(9000)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            if len(data) < 12 or struct.unpack_from("!H", data, 2)[0] & 0x8000:
+                continue
+            self.queries += 1
+            if self.answering:
+                self.send(self.ttl)
+
+    def send(self, ttl: int) -> None:
+        self.sock.sendto(_response(ttl), (self.group, self.port))
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self.sock.close()
+
+
+def _free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(predicate, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+@pytest.fixture
+def loopback():
+    group, port = "239.255.77.77", _free_udp_port()
+    try:
+        responder = _Responder(group, port, ttl=2)
+    except OSError as e:
+        pytest.skip(f"loopback multicast unavailable: {e}")
+    directory = SourceDirectory(SERVICE, group=group, port=port, interface="127.0.0.1")
+    events: list[tuple[str, str]] = []
+    directory.subscribe(lambda kind, source: events.append((kind, source.name)))
+    directory.start()
+    assert directory.wait_started()
+    if not _wait_for(lambda: responder.queries > 0, 2.0):
+        directory.stop()
+        responder.close()
+        pytest.skip("loopback multicast is not delivered")
+    yield directory, responder, events
+    directory.stop()
+    responder.close()
+
+
+def test_loopback_add_refresh_and_ttl_expiry(loopback):
+    directory, responder, events = loopback
+    assert _wait_for(lambda: directory.sources() == ["STUDIO (Cam 1)"], 2.0)
+    (entry,) = directory.entries()
+    assert (entry.host, entry.port, entry.addresses) == (HOST, 6400, ["10.0.0.7"])
+    assert entry.properties == {"codec": "vmx"}
+
+    # A 2 s TTL outlives several browse backoff steps only through refreshes.
+    time.sleep(3.0)
+    assert directory.sources() == ["STUDIO (Cam 1)"]
+    assert events == [("add", "STUDIO (Cam 1)")]
+
+    responder.answering = False
+    assert _wait_for(lambda: directory.sources() == [], 3.0)
+    assert events[-1] == ("remove", "STUDIO (Cam 1)")
+
+
+def test_loopback_goodbye_removes_immediately(loopback):
+    directory, responder, events = loopback
+    assert _wait_for(lambda: directory.sources() == ["STUDIO (Cam 1)"], 2.0)
+    responder.answering = False
+    responder.send(0)
+    assert _wait_for(lambda: directory.sources() == [], 0.5)
+    assert events == [("add", "STUDIO (Cam 1)"), ("remove", "STUDIO (Cam 1)")]
@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+from srt_multiview import core
+
+
+def _raw_windows():
+    # Enumeration order: primary first, then an unlabelled adapter, then a named one.
+    return [
+        {"id": "disp-a", "index": 0, "name": "Primary", "x": 0, "y": 0, "width": 1920, "height": 1080, "isPrimary": True},
+        {"id": "disp-b", "index": 1, "name": "", "x": 1920, "y": 0, "width": 1920, "height": 1080, "isPrimary": False},
+        {"id": "disp-c", "index": 2, "name": "TV", "x": 3840, "y": 0, "width": 1920, "height": 1080, "isPrimary": False},
+    ]
+
+
+def test_windows_view_numbers_only_kept_displays():
+    view = core._windows_displays(_raw_windows(), True, {})
+    assert [(d["id"], d["index"], d["name"]) for d in view] == [("disp-b", 0, "Écran 1"), ("disp-c", 1, "TV")]
+
+    full = core._windows_displays(_raw_windows(), False, {"disp-c": "Régie"})
+    assert [(d["id"], d["index"], d["name"]) for d in full] == [
+        ("disp-a", 0, "Primary"),
+        ("disp-b", 1, "Écran 2"),
+        ("disp-c", 2, "Régie"),
+    ]
+
+
+def test_windows_view_leaves_the_cached_walk_untouched():
+    raw = _raw_windows()
+    core._windows_displays(raw, True, {"disp-b": "Scène"})
+    assert raw == _raw_windows()
+
+
+def test_monitor_ids_match_the_pre_cache_enumeration():
+    monitors = [
+        SimpleNamespace(name=None, x=0, y=0, width=1920, height=1080, is_primary=True),
+        SimpleNamespace(name="HDMI-1", x=1920, y=0, width=1920, height=1080, is_primary=False),
+        SimpleNamespace(name=None, x=3840, y=0, width=1280, height=720, is_primary=False),
+    ]
+    view = core._monitor_displays(monitors, True, {})
+    assert [(d["id"], d["index"], d["name"]) for d in view] == [
+        ("HDMI-1", 0, "HDMI-1"),
+        ("geom-3840-0-1280x720", 1, "Écran 3"),
+    ]
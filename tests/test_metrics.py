@@ -0,0 +1,62 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+from srt_multiview import core, metrics
+
+
+def _fake_proc():
+    return SimpleNamespace(pid=os.getpid(), started_at=time.monotonic() - 5, poll=lambda: None)
+
+
+CONFIG = {
+    "streams": [{"id": "a", "name": "Cam A", "source": "srt"}, {"id": "b", "name": "Cam \"B\""}],
+    "mapping": {"a": "d1"},
+    "routes": [],
+    "sender": {},
+}
+
+
+def test_render_reports_running_player():
+    manager = core.player_manager
+    with manager._lock:
+        manager.players["a"] = _fake_proc()
+    try:
+        text = metrics.render(CONFIG)
+    finally:
+        with manager._lock:
+            manager.players.pop("a", None)
+    assert 'srt_multiview_up{kind="player",id="a",name="Cam A",source="srt",display="d1"} 1' in text
+    assert 'srt_multiview_up{kind="player",id="b",name="Cam \\"B\\"",source="srt",display=""} 0' in text
+    assert "# TYPE srt_multiview_player_startup_seconds histogram" in text
+    assert text.endswith("# EOF\n")
+    assert "# EOF" not in metrics.render(CONFIG, openmetrics=False)
+
+
+def test_render_while_players_come_and_go():
+    manager = core.player_manager
+    stop = threading.Event()
+
+    def churn():
+        i = 0
+        while not stop.is_set():
+            with manager._lock:
+                manager.players[f"churn-{i % 50}"] = _fake_proc()
+                manager.stall_count[f"churn-{(i + 25) % 50}"] = i
+                manager.players.pop(f"churn-{(i + 25) % 50}", None)
+            i += 1
+
+    config = dict(CONFIG, streams=[{"id": f"churn-{i}"} for i in range(50)])
+    thread = threading.Thread(target=churn, daemon=True)
+    thread.start()
+    try:
+        for _ in range(50):
+            metrics.render(config)
+    finally:
+        stop.set()
+        thread.join()
+        with manager._lock:
+            for i in range(50):
+                manager.players.pop(f"churn-{i}", None)
+                manager.stall_count.pop(f"churn-{i}", None)
@@ -0,0 +1,35 @@
+from srt_multiview import core
+
+
+def _udp(stream_id: str, port: int) -> dict:
+    return {"id": stream_id, "name": stream_id.upper(), "source": "udp", "udpAddr": "239.1.1.1", "udpPort": port}
+
+
+def test_mosaic_opens_each_stream_once_and_splits_repeats():
+    mosaic = {
+        "columns": 2,
+        "rows": 2,
+        "fps": 30,
+        "showLabels": False,
+        "tiles": [{"streamId": "a"}, {"streamId": "b"}, {"streamId": "a"}, {"streamId": ""}],
+    }
+    args, graph = core.mosaic_filtergraph(mosaic, {"a": _udp("a", 5000), "b": _udp("b", 5002)}, 1920, 1080)
+
+    assert [args[i + 1] for i, arg in enumerate(args) if arg == "-i"] == ["udp://@239.1.1.1:5000", "udp://@239.1.1.1:5002"]
+    chains = graph.split(";")
+    assert chains[0] == "[0:v:0]split=2[s0_0][s0_1]"
+    tiles = chains[1:5]
+    assert tiles[0].startswith("[s0_0]setpts=PTS-STARTPTS,")
+    assert tiles[1].startswith("[1:v:0]setpts=PTS-STARTPTS,")
+    assert tiles[2].startswith("[s0_1]setpts=PTS-STARTPTS,")
+    assert all(",fps=30,setsar=1,format=yuv420p[" in tile for tile in tiles[:3])
+    assert tiles[3] == "color=c=black:s=960x540:r=30,format=yuv420p[t3]"
+    assert chains[5] == "[t0][t1][t2][t3]xstack=inputs=4:layout=0_0|960_0|0_540|960_540:fill=black:shortest=0[out]"
+
+
+def test_mosaic_pads_uneven_grids_and_labels_tiles():
+    mosaic = {"columns": 3, "rows": 1, "fps": 25, "tiles": [{"streamId": "a", "label": "Cam: 1"}]}
+    _args, graph = core.mosaic_filtergraph(mosaic, {"a": _udp("a", 5000)}, 1000, 500)
+    chains = graph.split(";")
+    assert "drawtext=text=Cam\\\\: 1:expansion=none" in chains[0]
+    assert chains[-1] == "[t0]null,pad=1000:500:(ow-iw)/2:(oh-ih)/2[out]"
@@ -0,0 +1,102 @@
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from srt_multiview import core
+
+
+def _fmt(clock, label, diff, fd=0, aq=0, vq=0):
+    # ffplay's own format: "%7.2f %s:%7.3f fd=%4d aq=%5dKB vq=%5dKB sq=%5dB \r"
+    return "%7s %s:%7.3f fd=%4d aq=%5dKB vq=%5dKB sq=%5dB " % (clock, label, diff, fd, aq, vq, 0)
+
+
+def _replay(probe, lines):
+    beats = []
+    for line in lines:
+        match = core._FFPLAY_STATUS_RE.match(line)
+        assert match, line
+        probe.feed(match)
+        beats.append(probe.beat(match))
+    return beats
+
+
+# ffplay -stats lines, as split on \r, for a muted low-bitrate SRT slate.
+STARTUP = [
+    "    nan    :  0.000 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+    "    nan M-V:  0.000 fd=   0 aq=    0KB vq=    3KB sq=    0B ",
+]
+MUTED_LOW_BITRATE = [
+    "   1.02 M-V: -0.004 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+    "   1.06 M-V: -0.011 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+    "   1.09 M-V: -0.011 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+    "   1.13 M-V: -0.002 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+    "   1.16 M-V: -0.009 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+]
+# Same player once the caller went away: clocks extrapolate, nothing presented.
+MUTED_FROZEN = [
+    "   3.40 M-V: -0.007 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+    "   3.43 M-V: -0.007 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+    "   3.46 M-V: -0.008 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+    "   3.50 M-V: -0.007 fd=   0 aq=    0KB vq=    0KB sq=    0B ",
+]
+
+
+def test_status_line_formats():
+    match = core._FFPLAY_STATUS_RE.match("  12.34 A-V:  0.001 fd=   3 aq=   10KB vq=  120KB sq=    0B f=0/0   ")
+    assert match and match.group("label") == "A-V" and match.group("fd") == "3"
+    assert core._FFPLAY_STATUS_RE.match("    nan    :  0.000 fd=   0 aq=    0KB vq=    0KB sq=    0B ")
+    assert core._FFPLAY_STATUS_RE.match("[srt @ 0x55] Connection to srt://:9001 failed") is None
+
+
+def test_startup_phases():
+    probe = core._StartupProbe()
+    phases = []
+    for line in STARTUP + MUTED_LOW_BITRATE[:1]:
+        phases += probe.feed(core._FFPLAY_STATUS_RE.match(line))
+    assert phases == ["connect", "first_frame"]
+
+
+def test_low_bitrate_muted_stream_keeps_beating():
+    probe = core._StartupProbe()
+    beats = _replay(probe, STARTUP + MUTED_LOW_BITRATE)
+    assert beats[:2] == [False, False]
+    assert sum(beats[2:]) >= 3
+
+
+def test_frozen_picture_stops_beating():
+    probe = core._StartupProbe()
+    _replay(probe, STARTUP + MUTED_LOW_BITRATE)
+    assert _replay(probe, MUTED_FROZEN) == [False] * len(MUTED_FROZEN)
+
+
+def test_audio_only_beats_on_clock():
+    probe = core._StartupProbe()
+    lines = [_fmt("nan", "M-A", 0.0), _fmt("0.50", "M-A", 0.0), _fmt("0.53", "M-A", 0.0), _fmt("0.53", "M-A", 0.0)]
+    assert _replay(probe, lines) == [False, True, True, False]
+
+
+def test_realtime_player_ignores_slewing_drift():
+    probe = core._StartupProbe(realtime=True)
+    healthy = [_fmt("%.2f" % (1 + i * 0.04), "M-V", -0.01 * (i % 3), vq=i % 2) for i in range(6)]
+    assert any(_replay(probe, healthy))
+    # The external clock slows down once the queues are empty: drift moves, nothing else.
+    frozen = [_fmt("%.2f" % (2 + i * 0.04), "M-V", -0.004 * i) for i in range(6)]
+    assert _replay(probe, frozen) == [False] * 6
+    dropping = [_fmt("3.00", "M-V", 0.0, fd=1), _fmt("3.04", "M-V", 0.0, fd=1)]
+    assert _replay(probe, dropping) == [True, False]
+
+
+def test_check_stalls_flags_silent_player():
+    manager = core.PlayerManager(Path("ffplay"))
+    manager.stall_timeout = 10.0
+    probe = core._StartupProbe()
+    probe.first_frame_at = probe.last_beat_at = time.monotonic() - 30
+    manager.players["s"] = SimpleNamespace(pid=1, poll=lambda: None, kill=lambda: None)
+    manager._probes["s"] = probe
+    assert manager.check_stalls() == ["s"]
+    assert manager.is_stalled("s") and manager.stall_count["s"] == 1
+    assert manager.check_stalls() == []
+
+    probe.last_beat_at = time.monotonic()
+    manager.stalled.clear()
+    assert manager.check_stalls() == []
@@ -0,0 +1,76 @@
+import threading
+import time
+
+from srt_multiview import core
+
+
+def _wait_queued(scheduler: core.LaunchScheduler, key: str) -> None:
+    deadline = time.monotonic() + 2.0
+    while scheduler.position(key) is None:
+        assert time.monotonic() < deadline, f"{key} never queued"
+        time.sleep(0.005)
+
+
+def _waiter(scheduler, key, priority, admitted, results, cancel=None):
+    def run():
+        granted = scheduler.acquire(key, priority, cancel)
+        results[key] = granted
+        if granted:
+            admitted.append(key)
+            scheduler.release()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    _wait_queued(scheduler, key)
+    return thread
+
+
+def test_waiters_are_admitted_by_priority_then_arrival():
+    scheduler = core.LaunchScheduler(max_concurrent=1, settle=0.0)
+    assert scheduler.acquire("player:hold")
+    admitted: list[str] = []
+    results: dict[str, bool] = {}
+    threads = [
+        _waiter(scheduler, "player:low-1", 0, admitted, results),
+        _waiter(scheduler, "player:high", 5, admitted, results),
+        _waiter(scheduler, "player:low-2", 0, admitted, results),
+    ]
+    assert [scheduler.position(k) for k in ("player:high", "player:low-1", "player:low-2")] == [1, 2, 3]
+    scheduler.release()
+    for thread in threads:
+        thread.join(2.0)
+    assert admitted == ["player:high", "player:low-1", "player:low-2"]
+    assert scheduler.position("player:high") is None
+
+
+def test_cancel_drops_queued_launches_only():
+    scheduler = core.LaunchScheduler(max_concurrent=1, settle=0.0)
+    assert scheduler.acquire("player:hold")
+    admitted: list[str] = []
+    results: dict[str, bool] = {}
+    stop = threading.Event()
+    threads = [
+        _waiter(scheduler, "player:a", 0, admitted, results),
+        _waiter(scheduler, "mosaic:m", 0, admitted, results),
+        _waiter(scheduler, "player:b", 0, admitted, results, cancel=stop),
+    ]
+    scheduler.cancel("player:a")
+    stop.set()
+    threads[0].join(2.0)
+    threads[2].join(2.0)
+    assert results == {"player:a": False, "player:b": False}
+    # The running launch keeps its slot; the survivor gets it next.
+    scheduler.cancel("player:hold")
+    scheduler.release()
+    threads[1].join(2.0)
+    assert admitted == ["mosaic:m"]
+
+
+def test_settle_keeps_a_released_slot_busy():
+    scheduler = core.LaunchScheduler(max_concurrent=1, settle=0.2)
+    with scheduler.slot("player:a") as granted:
+        assert granted
+    started = time.monotonic()
+    with scheduler.slot("player:b") as granted:
+        assert granted
+    assert time.monotonic() - started >= 0.15
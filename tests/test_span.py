@@ -0,0 +1,36 @@
+from srt_multiview import core
+
+
+def _display(display_id: str, x: int, y: int, width: int = 1920, height: int = 1080) -> dict:
+    return {"id": display_id, "x": x, "y": y, "width": width, "height": height}
+
+
+def test_span_rect_accepts_exact_tilings():
+    row = [_display("a", 0, 0), _display("b", 1920, 0)]
+    assert core.span_rect(row) == (0, 0, 3840, 1080)
+    grid = [_display("a", 0, 0), _display("b", 1920, 0), _display("c", 0, 1080), _display("d", 1920, 1080)]
+    assert core.span_rect(grid) == (0, 0, 3840, 2160)
+    assert core.span_rect([]) is None
+
+
+def test_span_rect_rejects_gaps_overlaps_and_foreign_displays():
+    assert core.span_rect([_display("a", 0, 0), _display("b", 3840, 0)]) is None
+    assert core.span_rect([_display("a", 0, 0), _display("b", 0, 1080, 1280, 720)]) is None
+    # Same area as the box, but two displays overlap and leave a hole.
+    assert core.span_rect([_display("a", 0, 0), _display("b", 960, 0), _display("c", 0, 1080)]) is None
+    left_right = [_display("a", 0, 0), _display("c", 3840, 0)]
+    middle = _display("b", 1920, 0)
+    assert core.span_rect(left_right + [middle], [middle]) == (0, 0, 5760, 1080)
+    assert core.span_rect([_display("a", 0, 0), _display("c", 0, 1080)], [_display("x", 100, 100, 640, 480)]) is None
+
+
+def test_shared_decode_filter_places_each_member_at_its_offset():
+    members = [
+        ({"id": "a", "rotate": 90}, _display("m1", 1920, 0)),
+        ({"id": "b", "displayMode": "stretch"}, _display("m2", 3840, 0, 1280, 720)),
+    ]
+    chains = core.shared_decode_filter(members, (1920, 0, 3200, 1080)).split(";")
+    assert chains[0] == "split=2[s0][s1]"
+    assert chains[1].startswith("[s0]transpose=1,scale=1920:1080:") and chains[1].endswith(",setsar=1[v0]")
+    assert chains[2] == "[s1]scale=1280:720,setsar=1[v1]"
+    assert chains[3] == "[v0][v1]xstack=inputs=2:layout=0_0|1920_0"
@@ -0,0 +1,76 @@
+import pytest
+
+from srt_multiview import core
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    calls: list[tuple[float, object]] = []
+    monkeypatch.setattr(core.supervisor, "run_later", lambda delay, callback: calls.append((delay, callback)))
+    return calls
+
+
+def _watchdog() -> core.RestartWatchdog:
+    return core.RestartWatchdog(
+        core.RestartPolicy(max_attempts=3, base_delay=1.0, max_delay=4.0, jitter=0.0, stable_after=30.0, circuit_cooldown=60.0)
+    )
+
+
+def test_delay_doubles_up_to_the_cap():
+    policy = core.RestartPolicy(base_delay=1.0, max_delay=5.0, jitter=0.0)
+    assert [policy.delay_for(attempt) for attempt in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_quick_failures_back_off_then_open_the_circuit(scheduled):
+    watchdog = _watchdog()
+    watchdog.arm("player:a", lambda: True)
+    for _ in range(4):
+        assert watchdog.on_exit("player:a", 1)
+    assert [delay for delay, _ in scheduled] == [1.0, 2.0, 4.0, 60.0]
+    info = watchdog.info("player:a")
+    assert info["circuit_open"] and info["restart_pending"] and info["last_exit_code"] == 1
+
+    # Only the latest scheduled restart fires; the half-open retry closes the circuit.
+    restarts = []
+    watchdog._states["player:a"].restart = lambda: restarts.append(1) or True
+    for _delay, callback in scheduled[:-1]:
+        callback()
+    assert restarts == []
+    scheduled[-1][1]()
+    assert restarts == [1]
+    info = watchdog.info("player:a")
+    assert (info["restarts"], info["circuit_open"], info["restart_pending"]) == (1, False, False)
+
+
+def test_a_failed_restart_counts_as_another_exit(scheduled):
+    watchdog = _watchdog()
+    watchdog.arm("route:r", lambda: False)
+    watchdog.on_exit("route:r", 1)
+    scheduled[0][1]()
+    assert [delay for delay, _ in scheduled] == [1.0, 2.0]
+    assert watchdog.info("route:r")["last_exit_code"] is None
+
+
+def test_stable_run_resets_attempts_and_disarm_cancels(scheduled):
+    watchdog = _watchdog()
+    watchdog.arm("sender", lambda: True)
+    watchdog.on_exit("sender", 1)
+    watchdog.on_exit("sender", 1)
+    watchdog._states["sender"].last_start_at -= 31.0
+    watchdog.on_exit("sender", 1)
+    assert [delay for delay, _ in scheduled] == [1.0, 2.0, 1.0]
+
+    restarts = []
+    watchdog._states["sender"].restart = lambda: restarts.append(1) or True
+    watchdog.disarm("sender")
+    scheduled[-1][1]()
+    assert restarts == []
+    assert not watchdog.on_exit("sender", 1)
+    assert not watchdog.pending("sender")
+
+
+def test_disabled_policy_never_restarts(scheduled):
+    watchdog = core.RestartWatchdog(core.RestartPolicy(enabled=False))
+    watchdog.arm("player:a", lambda: True)
+    assert not watchdog.on_exit("player:a", 3)
+    assert scheduled == [] and not watchdog.is_armed("player:a")